@@ -0,0 +1,161 @@
+"""
+Animation clips and players
+
+An AnimationClip is the data of one animation: its frames, their
+collision masks and how long each frame is shown. Clips are built once
+(when an entity class first loads its assets) and shared by every
+instance; nothing in a clip changes after it is created.
+
+An AnimationPlayer is one instance's cursor into a clip: the clip, the
+frame index and the time spent on that frame. It is driven by elapsed
+game time (update(dt_ms), SIM_TICK_MS per simulation tick), so an
+animation plays at the same speed whatever the tick rate, and its state
+is three numbers (see snapshot.py).
+"""
+import pygame
+
+# Sums of SIM_TICK_MS are not exact (15 ticks of 1000/60 ms add up to
+# 249.99999999999994): frames end this close to their duration
+_EPSILON_MS = 1e-6
+
+
+class AnimationClip:
+    """Frames, masks and frame durations of one animation (shared, never modified)"""
+
+    __slots__ = ("name", "frames", "masks", "durations", "loop", "length_ms")
+
+    def __init__(self, frames, durations, loop=True, name=""):
+        """
+        Create a clip
+
+        Args:
+            frames (list): Frame surfaces, in order (at least one)
+            durations (float or list): Milliseconds each frame is shown
+                                       (one value for every frame, or one per frame)
+            loop (bool): Start over after the last frame (False = stop on it)
+            name (str): Name for logs
+        """
+        if not frames:
+            raise ValueError(f"Animation clip {name!r} has no frames")
+        self.name = name
+        self.frames = tuple(frames)
+        self.masks = tuple(pygame.mask.from_surface(frame) for frame in self.frames)
+        if isinstance(durations, (int, float)):
+            durations = (durations,) * len(self.frames)
+        self.durations = tuple(durations)
+        if len(self.durations) != len(self.frames):
+            raise ValueError(f"Animation clip {name!r}: {len(self.frames)} frames but "
+                             f"{len(self.durations)} durations")
+        if min(self.durations) <= 0:
+            raise ValueError(f"Animation clip {name!r}: frame durations must be positive")
+        self.loop = loop
+        self.length_ms = sum(self.durations)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def transformed(self, transform, name=None):
+        """
+        Get a clip with every frame transformed (flipped, scaled...), same timing
+
+        Args:
+            transform (callable): Called with each frame surface, returns the new surface
+            name (str): Name of the new clip (this clip's name if None)
+
+        Returns:
+            AnimationClip: The new clip (masks are rebuilt from the new frames)
+        """
+        return AnimationClip([transform(frame) for frame in self.frames], self.durations, self.loop,
+                             self.name if name is None else name)
+
+
+class AnimationPlayer:
+    """Playback cursor of one instance into a shared AnimationClip"""
+
+    __slots__ = ("clip", "index", "elapsed_ms", "finished")
+
+    def __init__(self, clip):
+        """
+        Start playing a clip from its first frame
+
+        Args:
+            clip (AnimationClip): Clip to play
+        """
+        self.clip = clip
+        self.index = 0  # Current frame
+        self.elapsed_ms = 0.0  # Time spent on the current frame
+        self.finished = False  # A clip that doesn't loop played its last frame through
+
+    @property
+    def image(self):
+        """Surface of the current frame"""
+        return self.clip.frames[self.index]
+
+    @property
+    def mask(self):
+        """Collision mask of the current frame"""
+        return self.clip.masks[self.index]
+
+    def play(self, clip, restart=False):
+        """
+        Switch to a clip
+
+        Args:
+            clip (AnimationClip): Clip to play
+            restart (bool): Start from its first frame (False = keep the
+                            current frame and time, e.g. between clips of
+                            the same motion)
+        """
+        if restart:
+            self.index = 0
+            self.elapsed_ms = 0.0
+            self.finished = False
+        elif clip is not self.clip and self.index >= len(clip):
+            self.index %= len(clip)
+        self.clip = clip
+
+    def update(self, dt_ms):
+        """
+        Advance the animation
+
+        Args:
+            dt_ms (float): Game milliseconds elapsed
+
+        Returns:
+            bool: True if the frame changed
+        """
+        if self.finished:
+            return False
+        clip = self.clip
+        start_index = self.index
+        self.elapsed_ms += dt_ms
+        while self.elapsed_ms + _EPSILON_MS >= clip.durations[self.index]:
+            self.elapsed_ms = max(0.0, self.elapsed_ms - clip.durations[self.index])
+            if self.index + 1 < len(clip):
+                self.index += 1
+            elif clip.loop:
+                self.index = 0
+            else:
+                self.finished = True
+                break
+        return self.index != start_index
+
+    def get_state(self):
+        """
+        Get the playback state (see snapshot.py; the clip is chosen by the owner)
+
+        Returns:
+            tuple: (frame index, milliseconds on the frame, finished)
+        """
+        return (self.index, self.elapsed_ms, self.finished)
+
+    def set_state(self, state):
+        """
+        Restore the state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        index, self.elapsed_ms, finished = state
+        self.index = min(index, len(self.clip) - 1)
+        self.finished = bool(finished)
@@ -0,0 +1,204 @@
+"""
+Asset pack - single-file container for the game assets
+
+Frozen builds ship one pack file instead of the whole assets folder, so
+nothing has to be extracted to disk before the menu appears. The pack is
+memory-mapped and every entry is exposed as a zero-copy memoryview.
+
+File layout:
+    header  magic (4 bytes) + version (uint16) + index size (uint32)
+    index   UTF-8 JSON object mapping asset names to [offset, size]
+    data    raw file contents, offsets relative to the end of the index
+
+Build a pack from the project root with:
+    python asset_pack.py assets assets.pack
+"""
+import io
+import json
+import mmap
+import os
+import posixpath
+import struct
+import sys
+
+PACK_MAGIC = b"CRPK"
+PACK_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+
+
+def normalize_asset_name(relative_path):
+    """
+    Normalize an asset path into the key used inside the pack
+
+    Args:
+        relative_path (str): Path such as './assets/lixo/lata.png'
+
+    Returns:
+        str: Normalized key such as 'assets/lixo/lata.png'
+    """
+    name = relative_path.replace("\\", "/")
+    return posixpath.normpath(name).lstrip("/")
+
+
+class AssetReader(io.RawIOBase):
+    """
+    Read-only file-like wrapper over a memoryview
+
+    pygame.image.load, pygame.mixer.Sound and pygame.font.Font accept
+    file-like objects, so pack entries are handed to them without first
+    copying the whole entry into a bytes object.
+    """
+
+    def __init__(self, view, name=""):
+        super().__init__()
+        self._view = view
+        self._position = 0
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        remaining = len(self._view) - self._position
+        count = min(len(buffer), remaining)
+        if count <= 0:
+            return 0
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._position = max(0, position)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class AssetPack:
+    """Memory-mapped asset pack opened for reading"""
+
+    def __init__(self, path):
+        """
+        Open an asset pack
+
+        Args:
+            path (str): Path to the pack file
+
+        Raises:
+            ValueError: If the file is not a valid asset pack
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Asset pack is empty: {path}")
+        self._view = memoryview(self._mmap)
+
+        magic, version, index_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Not a supported asset pack: {path}")
+
+        index_start = _HEADER.size
+        self._data_start = index_start + index_size
+        self.index = json.loads(bytes(self._view[index_start:self._data_start]).decode("utf-8"))
+
+    def __contains__(self, relative_path):
+        return normalize_asset_name(relative_path) in self.index
+
+    def get(self, relative_path):
+        """
+        Get the raw bytes of an entry without copying
+
+        Args:
+            relative_path (str): Asset path relative to the project root
+
+        Returns:
+            memoryview: Read-only view into the memory-mapped pack
+
+        Raises:
+            FileNotFoundError: If the entry is not in the pack
+        """
+        name = normalize_asset_name(relative_path)
+        try:
+            offset, size = self.index[name]
+        except KeyError:
+            raise FileNotFoundError(f"Asset not found in pack: {name}")
+        start = self._data_start + offset
+        return self._view[start:start + size]
+
+    def open(self, relative_path):
+        """
+        Open an entry as a read-only file-like object
+
+        Args:
+            relative_path (str): Asset path relative to the project root
+
+        Returns:
+            AssetReader: File-like wrapper around the entry
+        """
+        return AssetReader(self.get(relative_path), normalize_asset_name(relative_path))
+
+    def close(self):
+        """Release the memory map and the underlying file"""
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+def build_pack(source_dir, output_path, root="."):
+    """
+    Write every file under source_dir into a single asset pack
+
+    Args:
+        source_dir (str): Directory to pack (e.g. 'assets')
+        output_path (str): Destination pack file
+        root (str): Directory that asset names are relative to
+
+    Returns:
+        int: Number of packed files
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            entries.append((normalize_asset_name(os.path.relpath(full_path, root)), full_path))
+    entries.sort()
+
+    index = {}
+    offset = 0
+    for name, full_path in entries:
+        size = os.path.getsize(full_path)
+        index[name] = [offset, size]
+        offset += size
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    with open(output_path, "wb") as pack:
+        pack.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        pack.write(index_bytes)
+        for _, full_path in entries:
+            with open(full_path, "rb") as f:
+                pack.write(f.read())
+
+    return len(entries)
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "assets"
+    output = sys.argv[2] if len(sys.argv) > 2 else "assets.pack"
+    count = build_pack(source, output)
+    print(f"[ASSET PACK] Packed {count} files from '{source}' into '{output}'")
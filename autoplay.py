@@ -0,0 +1,231 @@
+"""
+Autoplay bot - a heuristic player for soak tests and demos
+
+AutoplayBot is a pegador input source (see entities/pegador_input.py)
+that plays on its own, once per simulation tick:
+- picks the trash it can reach soonest, predicting where the trash will
+  have drifted (-RIVER_FLOW_SPEED px per tick) when the net gets there
+- walks under it, and keeps steering while charging
+- charges the force whose dive depth (the cubic force_ratio curve in
+  Pegador._update_charging) takes the net just past the trash, then
+  releases the button
+- holds back while a crocodile that is not fully submerged
+  (CrocodileControl.current_state) will cross the dive column; if it has
+  to, it keeps holding until stunned rather than diving into a crocodile
+
+The bot only presses the same three controls a player has.
+"""
+import math
+from config import *
+from entities.pegador import PegadorState
+from entities.pegador_input import ActionInput
+from sim_clock import sim_clock
+
+# The net dives this far past the trash so the collision rect overlaps it
+NET_OVERSHOOT = 12
+# Crocodiles are avoided with this much horizontal clearance (pixels)
+CROCODILE_CLEARANCE = 24
+FULLY_SUBMERGED = 4  # CrocodileControl.FULLY_SUBMERGED
+
+
+class AutoplayBot(ActionInput):
+    """Pegador input source that plays the game"""
+
+    def __init__(self, game=None):
+        """
+        Args:
+            game (Game): Game to play (can be set later, once it exists)
+        """
+        super().__init__()
+        self.game = game
+        self.target = None
+        self._decided_tick = None
+
+        # Statistics
+        self.dives = 0
+        self.held_back_ticks = 0  # Ticks spent waiting for a crocodile to pass
+
+    def get_pressed(self):
+        """
+        Decide (once per simulation tick) and return the held controls
+
+        Returns:
+            dict: Held state by key (see ActionInput)
+        """
+        tick = sim_clock.tick_count
+        if tick != self._decided_tick:
+            self._decided_tick = tick
+            self._decide()
+        return super().get_pressed()
+
+    def _decide(self):
+        """Choose the controls for this tick"""
+        game = self.game
+        if game is None or game.pegador_is_on_cooldown:
+            self.set_action()
+            return
+
+        pegador = game.pegador
+        if pegador.state == PegadorState.IDLE:
+            self._play_idle(pegador)
+        elif pegador.state == PegadorState.CHARGING:
+            self._play_charging(pegador)
+        else:
+            self.target = None
+            self.set_action()
+
+    def _play_idle(self, pegador):
+        """Walk towards the best trash and start charging once it is in reach"""
+        self.target, force = self._choose_target(pegador)
+        if self.target is None:
+            self.set_action()
+            return
+
+        charge_ticks = self._charge_ticks(force)
+        target_x = self._intercept_x(pegador, self.target, charge_ticks)
+        dx = target_x - pegador.rect.centerx
+        left, right = self._steer(dx)
+
+        # Start charging once the rest of the way can be walked while charging
+        in_reach = abs(dx) <= PEGADOR_SPEED * charge_ticks + PEGADOR_SPEED
+        if in_reach and self._is_dive_safe(pegador, target_x, force, charge_ticks):
+            self.set_action(left, right, space=True)
+        else:
+            if in_reach:
+                self.held_back_ticks += 1
+            self.set_action(left, right)
+
+    def _play_charging(self, pegador):
+        """Keep charging and steering; release at the needed force"""
+        target = self.target
+        if target is None or not target.alive() or target.is_captured:
+            target, _ = self._choose_target(pegador)
+            self.target = target
+
+        force = self._force_for(pegador, target) if target is not None else 0
+        remaining = max(0, self._charge_ticks(force) - self._charge_ticks(pegador.force))
+        target_x = (self._intercept_x(pegador, target, remaining) if target is not None
+                    else pegador.rect.centerx)
+        dx = target_x - pegador.rect.centerx
+        left, right = self._steer(dx)
+
+        ready = pegador.force >= force and abs(dx) <= PEGADOR_SPEED
+        if ready and self._is_dive_safe(pegador, target_x, pegador.force, 0):
+            self.set_action(left, right, space=False)
+            self.dives += 1
+            return
+
+        # Holding at full force stuns the pegador: better than a crocodile
+        if ready:
+            self.held_back_ticks += 1
+        self.set_action(left, right, space=True)
+
+    @staticmethod
+    def _steer(dx):
+        """Controls walking towards a horizontal offset: (left, right)"""
+        if dx <= -PEGADOR_SPEED / 2:
+            return True, False
+        if dx >= PEGADOR_SPEED / 2:
+            return False, True
+        return False, False
+
+    def _choose_target(self, pegador):
+        """
+        Pick the trash that can be caught soonest
+
+        Returns:
+            tuple: (trash or None, force needed to reach it)
+        """
+        best = None
+        best_force = 0
+        best_ticks = None
+        for trash in self.game.floating_objects:
+            if trash.is_captured:
+                continue
+            force = self._force_for(pegador, trash)
+            charge_ticks = self._charge_ticks(force)
+            target_x = self._intercept_x(pegador, trash, charge_ticks)
+            if not 0 <= target_x <= SCREEN_WIDTH:
+                continue  # Gone downstream before the net gets there
+            walk_ticks = max(0, abs(target_x - pegador.rect.centerx) - PEGADOR_SPEED * charge_ticks) / PEGADOR_SPEED
+            ticks = walk_ticks + charge_ticks + self._descent_ticks(pegador, trash)
+            if best_ticks is None or ticks < best_ticks:
+                best, best_force, best_ticks = trash, force, ticks
+        return best, best_force
+
+    @staticmethod
+    def _force_for(pegador, trash):
+        """
+        Force whose dive takes the net just past a trash
+
+        Inverts the dive depth curve of Pegador._update_charging:
+        max_depth = bottom - (force / max) ** 3 * (bottom - top), where
+        max_depth is the pegador's centery at the turning point.
+        """
+        top = pegador.river_band_top
+        bottom = pegador.river_band_bottom
+        depth = trash.rect.centery + pegador.rect.height // 2 - NET_OVERSHOOT
+        ratio = (bottom - depth) / max(1, bottom - top)
+        ratio = min(1.0, max(0.0, ratio))
+        force = ratio ** (1 / 3) * PEGADOR_MAX_FORCE
+        # Never hold up to full force (that stuns the pegador)
+        return min(math.ceil(force), PEGADOR_MAX_FORCE - PEGADOR_FORCE_CHARGE_RATE)
+
+    @staticmethod
+    def _charge_ticks(force):
+        """Ticks of holding the button to reach a force (plus the release tick)"""
+        return math.ceil(force / PEGADOR_FORCE_CHARGE_RATE) + 1
+
+    @staticmethod
+    def _descent_ticks(pegador, trash):
+        """Ticks from the release until the net reaches a trash"""
+        return max(0, math.ceil((pegador.margin_y - trash.rect.bottom) / PEGADOR_VERTICAL_SPEED))
+
+    def _intercept_x(self, pegador, trash, charge_ticks):
+        """Where a trash will be when a dive released after charge_ticks reaches it"""
+        ticks = charge_ticks + self._descent_ticks(pegador, trash)
+        return trash.rect.centerx - RIVER_FLOW_SPEED * ticks
+
+    def _is_dive_safe(self, pegador, x, force, charge_ticks):
+        """
+        Check that no crocodile crosses the dive column while the pegador is in the river
+
+        Args:
+            pegador (Pegador): The diving pegador
+            x (int): Column the dive happens at
+            force (float): Force of the dive
+            charge_ticks (int): Ticks before the release
+
+        Returns:
+            bool: True if no surfaced crocodile reaches the column in time
+        """
+        # Turning point of the dive (same curve as Pegador._update_charging)
+        ratio = (force / PEGADOR_MAX_FORCE) ** 3
+        bottom = pegador.river_band_bottom
+        max_depth = bottom - ratio * (bottom - pegador.river_band_top)
+        net_top = max_depth - pegador.rect.height // 2
+        dive_ticks = 2 * max(0, (pegador.margin_y - net_top) / PEGADOR_VERTICAL_SPEED)
+        start, end = charge_ticks, charge_ticks + dive_ticks
+
+        half_width = pegador.rect.width // 2 + CROCODILE_CLEARANCE
+        for crocodile in self.game.crocodiles:
+            if crocodile.control.current_state == FULLY_SUBMERGED or crocodile.is_carrying_pegador:
+                continue
+            if crocodile.rect.bottom < net_top:
+                continue  # Further up the river than the net goes
+            velocity = 2 if crocodile.swim_direction else -2
+            # Horizontal span swept by the crocodile during the dive
+            left_edge = crocodile.rect.left + min(velocity * start, velocity * end)
+            right_edge = crocodile.rect.right + max(velocity * start, velocity * end)
+            if left_edge <= x + half_width and right_edge >= x - half_width:
+                return False
+        return True
+
+    def get_stats(self):
+        """
+        Get bot statistics
+
+        Returns:
+            dict: Dives started and ticks spent waiting for crocodiles
+        """
+        return {"dives": self.dives, "held_back_ticks": self.held_back_ticks}
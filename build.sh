@@ -32,6 +32,10 @@ fi
 echo "🧹 Limpando builds anteriores..."
 rm -rf build/ dist/
 
+# Empacotar assets em um único arquivo
+echo "📦 Gerando assets.pack..."
+python asset_pack.py assets assets.pack
+
 # Executar build
 echo "🔨 Gerando executável..."
 pyinstaller --clean Crocolixo.spec
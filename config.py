@@ -6,8 +6,83 @@ Game configuration and constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+SIM_FPS = 60  # Fixed simulation tick rate (movement speeds are in pixels per tick)
+SIM_TICK_MS = 1000 / SIM_FPS  # Simulated milliseconds per tick
+SIM_MAX_FRAME_MS = 250  # Longest frame the simulation catches up on (avoids a spiral of death)
+RENDER_FPS = FPS  # Presentation rate cap during gameplay (0 = uncapped, e.g. 144 for 144 Hz displays)
+INTERPOLATION_MAX_STEP = 32  # Sprites moving further than this in one tick are drawn without interpolation
+MENU_IDLE_FPS = 15  # Tick rate while a menu has nothing to animate
+WINDOW_SCALE = 1  # Integer window scale (the canvas stays SCREEN_WIDTH x SCREEN_HEIGHT)
+FULLSCREEN = False
+RENDER_BACKEND = "software"  # "software" or "sdl2" (see render.py)
+VSYNC = False  # Synchronize presents to the display refresh where supported
+DISPLAY_REFRESH_RATE = 60  # Refresh rate (Hz) assumed when pygame can't report the display's
+PAUSE_ON_FOCUS_LOST = True  # Pause when the window loses focus, not only when minimized (see power.py)
+POWER_IDLE_TIMEOUT_MS = 1000  # Longest single event wait while paused in the background
+PACER_SPIN_MS = 2.0  # Final part of each frame wait spent spinning instead of sleeping (see pacing.py)
 GAME_TITLE = "Crocolixo"
 
+# Session metrics (see metrics.py)
+METRICS_ENABLED = False  # Export metrics to a JSONL file per session
+METRICS_DIR = "telemetry"  # Directory for the session files
+METRICS_FLUSH_INTERVAL = 5.0  # Seconds between exported snapshots
+
+# Profiling (see profiling.py)
+PROFILE_SAMPLE_INTERVAL = 0.001  # Seconds between stack samples (~1 kHz)
+PROFILE_FRAMES = 600  # Frames covered by the cProfile window
+PROFILE_OUTPUT = "profile"  # Output path without extension
+
+# Garbage collection control (see gc_control.py)
+GC_CONTROL_ENABLED = True  # Freeze load-time objects and keep full collections out of gameplay
+GC_SLACK_MIN_MS = 4.0  # Minimum time left in a frame to run a young-generation collection in it
+
+# Slow-frame watchdog (see frame_watchdog.py)
+WATCHDOG_ENABLED = False  # Capture the main-thread stack of slow gameplay frames
+WATCHDOG_BUDGET_MS = 1000 / FPS  # Expected frame time
+WATCHDOG_FACTOR = 2.0  # A frame is slow once it takes longer than budget * factor
+WATCHDOG_INCIDENTS = 20  # Slow frames kept (ring buffer, printed at game over)
+
+# Frame recording (see recording.py)
+RECORD_FORMAT = "raw"  # 'raw' (delta-compressed clip) or 'png' (PNG sequence)
+RECORD_DIR = "recordings"  # Directory for the recordings
+RECORD_QUEUE_SIZE = 8  # Frames waiting for the writer thread before new ones are dropped
+RECORD_KEYFRAME_INTERVAL = 120  # Raw clips store a whole frame every N frames (XOR deltas in between)
+RECORD_COMPRESSION = 1  # zlib level for raw clips (1 = fastest)
+
+# Gameplay timers (see timer_wheel.py)
+TIMER_WHEEL_LEVELS = 4  # Levels of 64 slots (64**4 ticks, about 77 hours of range)
+
+# Rewind (see snapshot.py)
+REWIND_ENABLED = False  # Keep recent game states so BACKSPACE can rewind (main.py --rewind; on with --debug)
+REWIND_SECONDS = 5  # Game time kept in the rewind buffer
+REWIND_STEP_SECONDS = 2  # How far back one press of BACKSPACE goes
+REWIND_INTERVAL_TICKS = 4  # Simulation ticks between snapshots (a rewind lands on the nearest one before)
+REWIND_KEYFRAME_INTERVAL = 15  # Every N-th snapshot is stored whole (XOR deltas in between)
+REWIND_COMPRESSION = 1  # zlib level for the snapshots (1 = fastest)
+
+# Spectator feed (see spectator.py, main.py --spectate)
+SPECTATOR_ADDRESS = "127.0.0.1:8765"  # HOST:PORT, or a path for a Unix socket
+SPECTATOR_MAX_VIEWERS = 8  # Viewers connected at the same time
+SPECTATOR_MAX_BACKLOG = 256 * 1024  # Bytes queued for a viewer before it is resynced with a keyframe
+SPECTATOR_MAX_RESYNCS = 30  # Resyncs in a row without reading before a viewer is disconnected
+SPECTATOR_COMPRESSION = 1  # zlib level (1 = fastest)
+SPECTATOR_RECONNECT_SECONDS = 1  # Viewer: wait between connection attempts
+
+# Leak audit (see leak_audit.py, soak.py --audit)
+LEAK_AUDIT_TRACEMALLOC_FRAMES = 1  # Stack depth per traced allocation (deeper is much slower)
+LEAK_AUDIT_TOP_LINES = 5  # Fastest-growing allocation sites shown per checkpoint
+LEAK_AUDIT_CYCLES = 5  # Consecutive growing checkpoints that count as a leak
+LEAK_AUDIT_MIN_GROWTH_KB = 256  # Traced memory growth over those checkpoints needed to report it
+
+# Training environment (see env.py)
+ENV_FRAME_SKIP = 4  # Simulation ticks per environment step (the action is held for all of them)
+ENV_MAX_STEPS = 18000  # Steps before an episode is truncated
+ENV_MAX_TRASH = 16  # Trash slots in an observation (extra trash is left out)
+ENV_MAX_CROCODILES = 3  # Crocodile slots in an observation
+
+# Asset pack bundled with frozen builds (see asset_pack.py)
+ASSET_PACK_FILE = "assets.pack"
+
 # Colors (R, G, B)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -55,6 +130,14 @@ PEGADOR_RESPAWN_COOLDOWN = 2500  # Duration in milliseconds before new pegador s
 CROCODILE_CAPTURE_DURATION = 600  # milliseconds - duration of capture animation (emerge + wobble)
 CROCODILE_CAPTURE_WOBBLE_INTENSITY = 3.0  # pixels - intensity of wobble/shake during capture
 
+# Crocodile AI scheduling (see entities/crocodile_scheduler.py)
+CROCODILE_AI_INTERVAL = 4  # Ticks between decision steps of one crocodile (round-robin; 1 = every tick)
+
+# Crocodile behavior (see entities/crocodile_control.py, entities/flow_field.py)
+CROCODILE_BEHAVIOR = "wander"  # "wander" (random swimming) or "hunting" (steer towards the pegador's dive column)
+FLOW_FIELD_CELL_SIZE = 32  # Pixels per side of a flow field cell
+HUNTING_VERTICAL_SPEED = 1.5  # Vertical speed (pixels per tick) of a hunting crocodile
+
 # Crocodile spawn settings
 SECOND_CROCODILE_SCORE_THRESHOLD = 800  # Score needed to spawn second crocodile
 SECOND_CROCODILE_MAX_POLLUTION_PERCENT = 70  # Max pollution percentage (0-100) to allow second crocodile spawn
@@ -1,12 +1,20 @@
 """
 Crocodile entity that swims in the river with animated sprites
 """
+import time
 import pygame
 import random
 import config
-from utils import resource_path
+from utils import load_sound, init_mixer
 from spritesheet import spritesheet
+from animation import AnimationClip, AnimationPlayer
+from surfaces import prepare_surface
 from entities.crocodile_control import CrocodileControl
+from metrics import metrics
+from leak_audit import auditor
+
+_mask_tests = metrics.counter("collision.mask_tests")
+_state_transitions = metrics.counter("crocodile.state_transitions")
 
 
 class Crocodile(pygame.sprite.Sprite):
@@ -22,10 +30,15 @@ class Crocodile(pygame.sprite.Sprite):
     HEAD_SPRITE_HEIGHT = 11
 
     # Animation configuration
-    ANIMATION_SPEED = 15  # frames to hold each sprite before advancing
+    ANIMATION_FRAME_MS = 250  # milliseconds to hold each sprite before advancing
     SCALE = 2.0  # scaling factor for sprites
 
-    def __init__(self, x, y, min_y, max_y, control=None):
+    # Scaled (and pre-flipped) animation clips and attack sound shared by every crocodile (loaded on first use)
+    _clip_cache = None
+    _flipped_clip_cache = None
+    _attack_sound = None
+
+    def __init__(self, x, y, min_y, max_y, control=None, scheduler=None):
         """
         Initialize a crocodile
 
@@ -34,9 +47,13 @@ class Crocodile(pygame.sprite.Sprite):
             y (int): Initial y position
             min_y (int): Minimum y boundary (top of river)
             max_y (int): Maximum y boundary (bottom of river)
-            control (CrocodileControl): Control object for behavior (uses default if None)
+            control (type): Control class (or factory) called with the crocodile
+                           (CrocodileControl if None)
+            scheduler (CrocodileScheduler): Scheduler giving the decision turns
+                                            (None = decide every tick)
         """
         super().__init__()
+        auditor.track(self)
 
         # Position and movement
         self.min_y = min_y
@@ -49,22 +66,17 @@ class Crocodile(pygame.sprite.Sprite):
         # Load all animations
         self._load_animations()
 
-        # State management (delegated to control)
-        self.animation_frame = 0  # Current frame counter for animation speed
-        self.current_anim_index = 0  # Current index in the active animation
+        # Animation cursor (state management is delegated to control)
+        self.animation = AnimationPlayer(self.clips[4])
 
-        # Set initial image and rect
-        current_animation = self.animations[4]
-        self.image = current_animation[0]
+        # Set initial image, mask and rect
+        self.image = self.animation.image
+        self.mask = self.animation.mask  # Collision mask for pixel-perfect collision detection
 
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
-        # Collision mask for pixel-perfect collision detection
-        self.mask = None
-        self._update_mask()
-
         # Carrying state
         self.is_carrying_pegador = False
         self.carried_pegador = None
@@ -72,60 +84,53 @@ class Crocodile(pygame.sprite.Sprite):
         # Splash events queue - list of (event_type, x, y) tuples
         self.pending_splashes = []
 
-        # Sound reference for crocodile attack sound
-        self.attack_sound = None
+        # Channel playing the crocodile attack sound
+        self.attack_channel = None
+
+        # AI scheduling (ai_due is set by the scheduler before every tick)
+        self.scheduler = scheduler
+        self.ai_due = True
 
         # Control system ==> alway last init action (control needs crocodile fully started)
         self.control = control(self) if control is not None else CrocodileControl(self)
+        self._reported_state = self.control.current_state
 
         print(f"[CROC] Initialized at ({x}, {y}), state: {self.control.current_state}, image size: {self.image.get_size()}")
 
     def _load_animations(self):
-        """Load all sprite animations from spritesheet"""
+        """Load the animation clips from the spritesheet (once per process)"""
+        if Crocodile._clip_cache is not None:
+            self.clips = Crocodile._clip_cache
+            self.flipped_clips = Crocodile._flipped_clip_cache
+            return
+
         # Load crocodile spritesheet (2 cols x 4 rows)
         # All states are now in the same file with head already positioned
-        croc_sheet = spritesheet(resource_path("assets/crocodilo.png"))
-
-        # Extract animations for each row (each row is one animation with 2 frames)
-        # Note: pygame.Rect interprets as (x, y, width, height)
-        # Row 0: Fully surfaced (frames at y=0)
-        self.anim_fully_surfaced = [
-            croc_sheet.image_at((0, 0, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1),
-            croc_sheet.image_at((self.BODY_SPRITE_WIDTH, 0, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1)
-        ]
-
-        # Row 1: Mostly surfaced (frames at y=26)
-        self.anim_mostly_surfaced = [
-            croc_sheet.image_at((0, self.BODY_SPRITE_HEIGHT, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1),
-            croc_sheet.image_at((self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1)
-        ]
-
-        # Row 2: Mostly submerged (frames at y=52)
-        self.anim_mostly_submerged = [
-            croc_sheet.image_at((0, self.BODY_SPRITE_HEIGHT * 2, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1),
-            croc_sheet.image_at((self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT * 2, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1)
-        ]
-
-        # Row 3: Head only (frames at y=78)
-        self.anim_head_only = [
-            croc_sheet.image_at((0, self.BODY_SPRITE_HEIGHT * 3, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1),
-            croc_sheet.image_at((self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT * 3, self.BODY_SPRITE_WIDTH, self.BODY_SPRITE_HEIGHT), colorkey=-1)
-        ]
-
-        # Scale all sprites
-        self.anim_fully_surfaced = self._scale_sprites(self.anim_fully_surfaced)
-        self.anim_mostly_surfaced = self._scale_sprites(self.anim_mostly_surfaced)
-        self.anim_mostly_submerged = self._scale_sprites(self.anim_mostly_submerged)
-        self.anim_head_only = self._scale_sprites(self.anim_head_only)
-
-        # Store animations in a list for easy access by state
-        self.animations = [
-            self.anim_fully_surfaced,
-            self.anim_mostly_surfaced,
-            self.anim_mostly_submerged,
-            self.anim_head_only,
-            self.anim_head_only
-        ]
+        croc_sheet = spritesheet("assets/crocodilo.png")
+
+        # Each row is one animation with 2 frames:
+        # fully surfaced, mostly surfaced, mostly submerged, head only
+        row_clips = []
+        for row, name in enumerate(("fully_surfaced", "mostly_surfaced", "mostly_submerged", "head_only")):
+            frames = croc_sheet.load_strip((0, self.BODY_SPRITE_HEIGHT * row, self.BODY_SPRITE_WIDTH,
+                                            self.BODY_SPRITE_HEIGHT), 2)
+            # Scale all sprites
+            row_clips.append(AnimationClip(self._scale_sprites(frames), self.ANIMATION_FRAME_MS,
+                                           name=f"crocodile.{name}"))
+
+        # Clips by state (fully submerged keeps the head-only frames, it isn't drawn)
+        self.clips = row_clips + [row_clips[3]]
+        # Frames facing left, flipped once instead of every frame
+        flipped = [clip.transformed(self._flip_sprite, name=f"{clip.name}.flipped") for clip in row_clips]
+        self.flipped_clips = flipped + [flipped[3]]
+
+        Crocodile._clip_cache = self.clips
+        Crocodile._flipped_clip_cache = self.flipped_clips
+
+    @staticmethod
+    def _flip_sprite(sprite):
+        """Mirror a sprite horizontally (facing left)"""
+        return prepare_surface(pygame.transform.flip(sprite, True, False), alpha=True, rle=True, origin="Crocodile")
 
     def _scale_sprites(self, sprite_list):
         """
@@ -142,49 +147,79 @@ class Crocodile(pygame.sprite.Sprite):
             width = int(sprite.get_width() * self.SCALE)
             height = int(sprite.get_height() * self.SCALE)
             # Use scale() instead of smoothscale() to keep pixel art crisp
-            scaled.append(pygame.transform.scale(sprite, (width, height)))
+            scaled_sprite = pygame.transform.scale(sprite, (width, height))
+            scaled.append(prepare_surface(scaled_sprite, alpha=True, rle=True, origin="Crocodile"))
         return scaled
 
-
-    def _update_mask(self):
-        """Update the collision mask based on current image"""
-        if self.image is not None:
-            self.mask = pygame.mask.from_surface(self.image)
-
     def _update_image(self):
-        """Update the current image based on state and animation frame"""
-        current_animation = self.animations[self.control.current_state]
-        self.image = current_animation[self.current_anim_index]
-
-        # Flip image horizontally if swimming left (swim_direction = 0)
-        if self.swim_direction == 0:
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        # Update mask whenever image changes
-        self._update_mask()
+        """Update the current image and mask from the state, direction and animation frame"""
+        # Use the horizontally flipped frames when swimming left (swim_direction = 0)
+        clips = self.flipped_clips if self.swim_direction == 0 else self.clips
+        # Clips of every state share their timing: switching keeps the frame
+        self.animation.play(clips[self.control.current_state])
+        self.image = self.animation.image
+        # Collision mask for pixel-perfect collision detection (shared with the clip)
+        self.mask = self.animation.mask
 
     def update(self):
         """Update crocodile position and animation"""
+        ai_start = time.perf_counter()
+        decide = self.ai_due
+
         # Delegate state transitions to control (always update state)
-        self.control.update_state()
+        self.control.update_state(decide)
+
+        # Report state changes (including ones made outside update_state)
+        if self.control.current_state != self._reported_state:
+            self._reported_state = self.control.current_state
+            _state_transitions.inc()
 
         # Skip movement and animation updates when fully submerged
         if self.control.current_state == 4:  # FULLY_SUBMERGED
+            if self.scheduler is not None:
+                self.scheduler.add_time(time.perf_counter() - ai_start)
             return
 
         # Delegate movement to control (moves the rect)
-        self.control.update_movement(self.min_y, self.max_y)
+        self.control.update_movement(self.min_y, self.max_y, decide)
+        if self.scheduler is not None:
+            self.scheduler.add_time(time.perf_counter() - ai_start)
 
         # Update animation frame
-        self.animation_frame += 1
-        if self.animation_frame >= self.ANIMATION_SPEED:
-            self.animation_frame = 0
-            # Advance to next frame in animation (loop between 0 and 1)
-            self.current_anim_index = (self.current_anim_index + 1) % 2
+        self.animation.update(config.SIM_TICK_MS)
 
         # Update the sprite image
         self._update_image()
 
+    def get_state(self):
+        """
+        Get the gameplay state, control included (see snapshot.py; the
+        carried pegador is stored by the game)
+
+        Returns:
+            tuple: Position, direction, animation and control state
+        """
+        return ((self.rect.x, self.rect.y, self.vel_y, self.swim_direction) + self.animation.get_state()
+                + (self.is_carrying_pegador,) + self.control.get_state())
+
+    def set_state(self, state):
+        """
+        Restore the gameplay state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        x, y, self.vel_y, self.swim_direction = state[:4]
+        self.animation.set_state(state[4:7])
+        is_carrying_pegador = state[7]
+        self.control.set_state(state[8:])
+        self.rect.x = x
+        self.rect.y = y
+        self.is_carrying_pegador = bool(is_carrying_pegador)
+        self.pending_splashes.clear()
+        self._reported_state = self.control.current_state
+        self._update_image()
+
     def start_carrying_pegador(self, pegador):
         """
         Start carrying the pegador
@@ -192,6 +227,11 @@ class Crocodile(pygame.sprite.Sprite):
         Args:
             pegador (Pegador): The pegador to carry
         """
+        # A crocodile still carrying an earlier pegador can catch the new
+        # one: drop the old one first or it stays referenced (and drawn) forever
+        if self.carried_pegador is not None and self.carried_pegador is not pegador:
+            self.release_pegador()
+
         self.is_carrying_pegador = True
         self.carried_pegador = pegador
         self.control.start_carrying(self)
@@ -206,6 +246,7 @@ class Crocodile(pygame.sprite.Sprite):
             print(f"[CROC] Releasing pegador at ({self.rect.x}, {self.rect.y})")
             released_pegador = self.carried_pegador
             self.carried_pegador = None
+            released_pegador.catching_crocodile = None  # Break the reference cycle
             self.is_carrying_pegador = False
             self.control.stop_carrying()
 
@@ -264,28 +305,32 @@ class Crocodile(pygame.sprite.Sprite):
         offset_y = other_sprite.rect.y - self.rect.y
 
         # Check if masks overlap (returns None if no collision, otherwise returns contact point)
+        _mask_tests.inc()
         overlap = self.mask.overlap(other_sprite.mask, (offset_x, offset_y))
 
         return overlap is not None
 
     def play_attack_sound(self):
         """Play crocodile attack sound"""
-        if config.SOUND_ENABLED and pygame.mixer.get_init():
+        if config.SOUND_ENABLED and init_mixer():
             try:
                 # Stop previous sound if playing
                 self.stop_attack_sound()
 
-                # Load and play new sound
-                self.attack_sound = pygame.mixer.Sound(resource_path('assets/sons/crocodilo_agua.ogg'))
-                self.attack_sound.set_volume(config.CROCODILE_SOUND_VOLUME)
-                self.attack_sound.play()
+                # Load the shared sound once and play it on a free channel
+                if Crocodile._attack_sound is None:
+                    Crocodile._attack_sound = load_sound('assets/sons/crocodilo_agua.ogg')
+                    Crocodile._attack_sound.set_volume(config.CROCODILE_SOUND_VOLUME)
+                self.attack_channel = Crocodile._attack_sound.play()
                 print("[CROC] Playing attack sound")
             except (pygame.error, FileNotFoundError) as e:
                 print(f"[CROC] Warning: Could not play crocodile sound: {e}")
 
     def stop_attack_sound(self):
         """Stop crocodile attack sound"""
-        if self.attack_sound:
-            self.attack_sound.stop()
-            self.attack_sound = None
+        if self.attack_channel:
+            # The channel may have been reused by another sound since
+            if self.attack_channel.get_sound() is Crocodile._attack_sound:
+                self.attack_channel.stop()
+            self.attack_channel = None
             print("[CROC] Stopped attack sound")
@@ -2,10 +2,11 @@
 Control classes for crocodile behavior
 Separates movement and state transition logic from the crocodile sprite
 """
-import pygame
 import random
 import config
 from entities.pegador import PegadorState
+from sim_clock import get_ticks
+from timer_wheel import Timer
 
 
 class CrocodileControl:
@@ -35,15 +36,21 @@ class CrocodileControl:
 
     states_array = [FULLY_SURFACED, MOSTLY_SURFACED, MOSTLY_SUBMERGED, HEAD_ONLY, FULLY_SUBMERGED]
 
+    # Values in get_state() (subclasses append theirs after these)
+    STATE_SIZE = 27
+
     def __init__(self, crocodile):
         """Initialize the control"""
         self.crocodile = crocodile  # Keep reference to crocodile
         self.current_state = random.randint(1, 4)  # Start at random state (0-4)
         self.target_state = self.current_state
 
-        # State transition timing
-        self.state_timer = pygame.time.get_ticks()
-        self.swim_vert_timer = self.state_timer
+        # State transition timing (the timers only mark a decision as due;
+        # it is taken on the crocodile's next decision turn)
+        self.state_timer = Timer(self._state_timer_done)
+        self.swim_vert_timer = Timer(self._swim_vert_timer_done)
+        self.state_change_due = None  # Game time the state timer ran out (None = not due)
+        self.swim_vert_change_due = None  # Game time the vertical timer ran out
         self.next_state_change = random.randint(
             self.STATE_CHANGE_MIN_TIME,
             self.STATE_CHANGE_MAX_TIME
@@ -53,6 +60,8 @@ class CrocodileControl:
             self.VERTICAL_MOVE_MIN_TIME,
             self.VERTICAL_MOVE_MAX_TIME
         )
+        self.state_timer.start(self.next_state_change)
+        self.swim_vert_timer.start(self.next_swim_vert_change)
 
         # Vertical movement velocity
         self.vel_y = random.uniform(-1.5, 1.5)
@@ -61,22 +70,60 @@ class CrocodileControl:
         self.is_carrying = False
         self.carrying_start_time = 0
         self.waiting_at_edge = False
-        self.wait_start_time = 0
+        self.wait_timer = Timer(self._finish_waiting)
         self.wait_duration = 1000  # 1 second wait
 
         # Capture animation state
         self.is_capturing = False
-        self.capture_start_time = 0
+        self.capture_timer = Timer(self._finish_capture)
+        self.capture_start_time = 0  # Phase of the wobble
         self.capture_base_y = 0  # Store original Y position during capture
         self.pre_capture_state = None  # Store state before capture to restore later
 
         # Repositioning flag (when emerging from fully submerged)
         self.should_reposition = False
 
+    def get_state(self):
+        """
+        Get the state, timers and velocity (see snapshot.py)
+
+        Returns:
+            tuple: Control state
+        """
+        return ((self.current_state, self.target_state, self.next_state_change, self.state_change_due,
+                 self.next_swim_vert_change, self.swim_vert_change_due, self.vel_y,
+                 self.is_carrying, self.carrying_start_time, self.waiting_at_edge,
+                 self.is_capturing, self.capture_start_time, self.capture_base_y, self.pre_capture_state,
+                 self.should_reposition)
+                + self.state_timer.get_state() + self.swim_vert_timer.get_state()
+                + self.wait_timer.get_state() + self.capture_timer.get_state())
+
+    def set_state(self, state):
+        """
+        Restore the state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        (self.current_state, self.target_state, self.next_state_change, self.state_change_due,
+         self.next_swim_vert_change, self.swim_vert_change_due, self.vel_y,
+         is_carrying, self.carrying_start_time, waiting_at_edge,
+         is_capturing, self.capture_start_time, self.capture_base_y, self.pre_capture_state,
+         should_reposition) = state[:15]
+        self.state_timer.set_state(state[15:18])
+        self.swim_vert_timer.set_state(state[18:21])
+        self.wait_timer.set_state(state[21:24])
+        self.capture_timer.set_state(state[24:27])
+        self.is_carrying = bool(is_carrying)
+        self.waiting_at_edge = bool(waiting_at_edge)
+        self.is_capturing = bool(is_capturing)
+        self.should_reposition = bool(should_reposition)
+
     def start_carrying(self, crocodile):
         """Start carrying a pegador - begins with capture animation"""
         self.is_capturing = True
-        self.capture_start_time = pygame.time.get_ticks()
+        self.capture_start_time = get_ticks()
+        self.capture_timer.start(config.CROCODILE_CAPTURE_DURATION)
         self.capture_base_y = crocodile.rect.y
         self.pre_capture_state = self.current_state
 
@@ -90,18 +137,44 @@ class CrocodileControl:
         """Stop carrying and return to normal behavior"""
         self.is_carrying = False
         self.waiting_at_edge = False
+        self.wait_timer.cancel()
         print("[CONTROL] Stopped carrying mode")
 
-    def update_movement(self, min_y, max_y):
-        current_time = pygame.time.get_ticks()
-        # print('pos: ', crocodile.rect.x, crocodile.rect.y)
+    def _finish_capture(self):
+        """capture_timer callback - capture animation complete, start carrying"""
+        print("[CONTROL] Capture animation complete, starting carrying mode")
+        self.is_capturing = False
+        self.is_carrying = True
+        self.carrying_start_time = get_ticks()
+        self.waiting_at_edge = False
+
+        # Return to state 1 (MOSTLY_SURFACED) after capture animation
+        self.current_state = self.MOSTLY_SURFACED
+        self.target_state = self.MOSTLY_SURFACED
+        print("[CONTROL] Returned to state 1 (MOSTLY_SURFACED) after capture")
+
+    def _finish_waiting(self):
+        """wait_timer callback - done waiting at the edge: return pegador and crocodile to normal"""
+        self.crocodile.release_pegador()
+        self.stop_carrying()
+
+    def _state_timer_done(self):
+        """state_timer callback - a new target state is due"""
+        self.state_change_due = get_ticks()
+
+    def _swim_vert_timer_done(self):
+        """swim_vert_timer callback - a new vertical velocity is due"""
+        self.swim_vert_change_due = get_ticks()
+
+    def update_movement(self, min_y, max_y, decide=True):
         """
         Update crocodile position based on control logic
 
         Args:
-            crocodile: The Crocodile sprite to control
             min_y: Minimum y boundary
             max_y: Maximum y boundary
+            decide (bool): Turn at the screen edges this tick (part of the
+                           decision step, see entities/crocodile_scheduler.py)
         """
         # Handle repositioning when emerging from fully submerged state
         if self.should_reposition:
@@ -124,44 +197,26 @@ class CrocodileControl:
 
             self.should_reposition = False
 
-        # Capture animation - emerge and wobble
+        # Capture animation - emerge and wobble (until capture_timer fires)
         if self.is_capturing:
-            elapsed_time = current_time - self.capture_start_time
+            elapsed_time = get_ticks() - self.capture_start_time
 
-            if elapsed_time < config.CROCODILE_CAPTURE_DURATION:
-                # Apply strong wobble effect (shake)
-                import math
-                wobble_frequency = 0.03  # Higher frequency = faster shake
-                wobble_x = math.sin(elapsed_time * wobble_frequency) * config.CROCODILE_CAPTURE_WOBBLE_INTENSITY
-                wobble_y = math.cos(elapsed_time * wobble_frequency * 1.3) * config.CROCODILE_CAPTURE_WOBBLE_INTENSITY
+            # Apply strong wobble effect (shake)
+            import math
+            wobble_frequency = 0.03  # Higher frequency = faster shake
+            wobble_x = math.sin(elapsed_time * wobble_frequency) * config.CROCODILE_CAPTURE_WOBBLE_INTENSITY
+            wobble_y = math.cos(elapsed_time * wobble_frequency * 1.3) * config.CROCODILE_CAPTURE_WOBBLE_INTENSITY
 
-                # Keep crocodile near surface with wobble
-                self.crocodile.rect.x += wobble_x
-                self.crocodile.rect.y = self.capture_base_y + wobble_y
+            # Keep crocodile near surface with wobble
+            self.crocodile.rect.x += wobble_x
+            self.crocodile.rect.y = self.capture_base_y + wobble_y
 
-                return  # Skip normal movement
-            else:
-                # Capture animation complete, transition to carrying mode
-                print("[CONTROL] Capture animation complete, starting carrying mode")
-                self.is_capturing = False
-                self.is_carrying = True
-                self.carrying_start_time = current_time
-                self.waiting_at_edge = False
-
-                # Return to state 1 (MOSTLY_SURFACED) after capture animation
-                self.current_state = self.MOSTLY_SURFACED
-                self.target_state = self.MOSTLY_SURFACED
-                print("[CONTROL] Returned to state 1 (MOSTLY_SURFACED) after capture")
+            return  # Skip normal movement
 
         # Special behavior when carrying pegador
         if self.is_carrying:
             if self.waiting_at_edge:
-                # Waiting at edge for 1 second before returning
-                if current_time - self.wait_start_time > self.wait_duration:
-                    # Return pegador and crocodile to normal
-                    self.crocodile.release_pegador()
-                    self.stop_carrying()
-                return  # Don't move while waiting
+                return  # Don't move while waiting (wait_timer returns the pegador)
 
             # Continue swimming in current direction until off screen
             if self.crocodile.swim_direction == 1:  # Swimming right
@@ -169,43 +224,27 @@ class CrocodileControl:
                 # Check if completely off screen (right edge)
                 if self.crocodile.rect.left > config.SCREEN_WIDTH:
                     self.waiting_at_edge = True
-                    self.wait_start_time = current_time
+                    self.wait_timer.start(self.wait_duration)
                     print("[CONTROL] Reached right edge, waiting...")
             else:  # Swimming left
                 self.crocodile.rect.x -= 2
                 # Check if completely off screen (left edge)
                 if self.crocodile.rect.right < 0:
                     self.waiting_at_edge = True
-                    self.wait_start_time = current_time
+                    self.wait_timer.start(self.wait_duration)
                     print("[CONTROL] Reached left edge, waiting...")
             return  # Skip normal movement behavior
 
         # Normal random swim behavior
         if(self.crocodile.swim_direction):
             self.crocodile.rect.x += 2
-            if(self.crocodile.rect.x > config.SCREEN_WIDTH + 20):
+            if(decide and self.crocodile.rect.x > config.SCREEN_WIDTH + 20):
                 self.crocodile.swim_direction = 0
         else:
             self.crocodile.rect.x -= 2
-            if(self.crocodile.rect.x < -100):
+            if(decide and self.crocodile.rect.x < -100):
                 self.crocodile.swim_direction = 1
 
-        # Check if it's time to change vertical direction
-        if current_time - self.swim_vert_timer > self.next_swim_vert_change:
-            old_vel_y = self.vel_y
-
-            # Pick a new random vertical velocity
-            self.vel_y = random.uniform(-1.5, 1.5)
-
-            print(f"[CROC] New vertical velocity: {old_vel_y:.2f} -> {self.vel_y:.2f}")
-
-            # Reset timer for next change
-            self.swim_vert_timer = current_time
-            self.next_swim_vert_change = random.randint(
-                self.VERTICAL_MOVE_MIN_TIME,
-                self.VERTICAL_MOVE_MAX_TIME
-            )
-
         # Apply vertical movement with small wobble
         wobble = random.uniform(-0.2, 0.2)
         self.crocodile.rect.y += self.vel_y + wobble
@@ -218,35 +257,21 @@ class CrocodileControl:
             self.crocodile.rect.bottom = max_y
             self.vel_y = -abs(self.vel_y)  # Force upward movement
 
-    def update_state(self):
+    def update_state(self, decide=True):
         """
         Update the state transitions
 
+        Args:
+            decide (bool): Run the decision step this tick (see _decide);
+                           the current state steps towards the target
+                           every tick
+
         Returns:
             int: The new current state
         """
-        current_time = pygame.time.get_ticks()
-
-        # Check if it's time to pick a new target state
-        if current_time - self.state_timer > self.next_state_change:
-            old_target = self.target_state
-
-            # Pick a random target state (0-4, including FULLY_SUBMERGED)
-            self.target_state = self._rand_next_state(old_target)
-
-            # Prevent going to state 4 (FULLY_SUBMERGED) when carrying pegador
-            if self.is_carrying and self.target_state == self.FULLY_SUBMERGED:
-                self.target_state = self.HEAD_ONLY  # Cap at state 3
-                print(f"[CROC] Prevented state 4 while carrying, capped at {self.target_state}")
-
-            print(f"[CROC] New target state: {old_target} -> {self.target_state} (current: {self.current_state})")
-
-            # Reset timer for next change
-            self.state_timer = current_time
-            self.next_state_change = random.randint(
-                self.STATE_CHANGE_MIN_TIME,
-                self.STATE_CHANGE_MAX_TIME
-            )
+        current_time = get_ticks()
+        if decide:
+            self._decide(current_time)
 
         # Gradually transition towards target state (one level at a time)
         if self.current_state < self.target_state:
@@ -282,6 +307,62 @@ class CrocodileControl:
 
         return self.current_state
     
+    def _decide(self, current_time):
+        """
+        Decision step: pick a new target state and vertical velocity when
+        their timers run out (runs on the crocodile's scheduled turns)
+
+        Args:
+            current_time (int): Current game time
+        """
+        self._decide_state(current_time)
+        self._decide_velocity(current_time)
+
+    def _decide_state(self, current_time):
+        """Pick a new random target state when the state timer runs out"""
+        # Check if it's time to pick a new target state
+        if self.state_change_due is not None:
+            self._report_decision(current_time, self.state_change_due)
+            self.state_change_due = None
+            old_target = self.target_state
+
+            # Pick a random target state (0-4, including FULLY_SUBMERGED)
+            self.target_state = self._rand_next_state(old_target)
+
+            # Prevent going to state 4 (FULLY_SUBMERGED) when carrying pegador
+            if self.is_carrying and self.target_state == self.FULLY_SUBMERGED:
+                self.target_state = self.HEAD_ONLY  # Cap at state 3
+                print(f"[CROC] Prevented state 4 while carrying, capped at {self.target_state}")
+
+            print(f"[CROC] New target state: {old_target} -> {self.target_state} (current: {self.current_state})")
+
+            # Reset timer for next change
+            self.next_state_change = random.randint(
+                self.STATE_CHANGE_MIN_TIME,
+                self.STATE_CHANGE_MAX_TIME
+            )
+            self.state_timer.start(self.next_state_change)
+
+    def _decide_velocity(self, current_time):
+        """Pick a new random vertical velocity when the vertical timer runs out"""
+        # Check if it's time to change vertical direction
+        if self.swim_vert_change_due is not None:
+            self._report_decision(current_time, self.swim_vert_change_due)
+            self.swim_vert_change_due = None
+            old_vel_y = self.vel_y
+
+            # Pick a new random vertical velocity
+            self.vel_y = random.uniform(-1.5, 1.5)
+
+            print(f"[CROC] New vertical velocity: {old_vel_y:.2f} -> {self.vel_y:.2f}")
+
+            # Reset timer for next change
+            self.next_swim_vert_change = random.randint(
+                self.VERTICAL_MOVE_MIN_TIME,
+                self.VERTICAL_MOVE_MAX_TIME
+            )
+            self.swim_vert_timer.start(self.next_swim_vert_change)
+
     def _rand_next_state(self, curr_state):
         if(curr_state == 1):
             return random.randint(1, 2)
@@ -291,6 +372,18 @@ class CrocodileControl:
 
         return random.randint(curr_state - 1, curr_state + 1)
 
+    def _report_decision(self, current_time, due_time):
+        """
+        Report a timer handled by the decision step to the crocodile's scheduler
+
+        Args:
+            current_time (int): Current game time
+            due_time (int): Game time the timer ran out at
+        """
+        scheduler = self.crocodile.scheduler
+        if scheduler is not None:
+            scheduler.record_decision(current_time - due_time)
+
     def _add_splash(self, event_type):
         """
         Add a splash event to the crocodile's queue
@@ -335,14 +428,24 @@ class DebugControl(CrocodileControl):
         self.transitioning_up = True
         print(f"[DEBUG CONTROL] Created with fixed position ({self.fixed_x}, {self.fixed_y})")
 
-    def update_movement(self, min_y, max_y):
+    def get_state(self):
+        """Get the control state (see CrocodileControl.get_state) and the cycle direction"""
+        return super().get_state() + (self.transitioning_up,)
+
+    def set_state(self, state):
+        """Restore the state returned by get_state()"""
+        super().set_state(state)
+        if len(state) > self.STATE_SIZE:
+            self.transitioning_up = bool(state[self.STATE_SIZE])
+
+    def update_movement(self, min_y, max_y, decide=True):
         """
         Keep crocodile at fixed position
 
         Args:
-            crocodile: The Crocodile sprite to control
             min_y: Minimum y boundary (ignored)
             max_y: Maximum y boundary (ignored)
+            decide (bool): Decision step this tick (ignored)
         """
         # Keep position fixed
         self.crocodile.rect.x = self.fixed_x
@@ -350,14 +453,19 @@ class DebugControl(CrocodileControl):
         # Set velocity to zero
         self.crocodile.vel_y = 0
 
-    def update_state(self):
+    def update_state(self, decide=True):
         """
         Cycle through states in order (0 -> 1 -> 2 -> 3 -> 4 -> 3 -> 2 -> 1)
+
+        Args:
+            decide (bool): Run the decision step (state timer) this tick
         """
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
 
         # Check if it's time to transition to next state
-        if current_time - self.state_timer > self.next_state_change:
+        if decide and self.state_change_due is not None:
+            self._report_decision(current_time, self.state_change_due)
+            self.state_change_due = None
             # Move to target state
             if self.current_state != self.target_state:
                 old_state = self.current_state
@@ -378,10 +486,49 @@ class DebugControl(CrocodileControl):
                     self.transitioning_up = True
 
             # Reset timer for next change
-            self.state_timer = current_time
             self.next_state_change = random.randint(
                 self.STATE_CHANGE_MIN_TIME,
                 self.STATE_CHANGE_MAX_TIME
             )
+            self.state_timer.start(self.next_state_change)
 
         return self.current_state
+
+
+class HuntingControl(CrocodileControl):
+    """
+    Control that steers towards the pegador's dive column
+
+    Direction and vertical velocity come from the flow field shared by
+    all hunting crocodiles (see entities/flow_field.py), read on every
+    decision turn. Submerging and surfacing stay random, and the crocodile
+    wanders like CrocodileControl while there is nothing to hunt.
+    """
+
+    def __init__(self, crocodile, flow_field):
+        """
+        Initialize the control
+
+        Args:
+            crocodile (Crocodile): Crocodile to control
+            flow_field (FlowField): Shared field towards the pegador
+        """
+        self.flow_field = flow_field
+        super().__init__(crocodile)
+
+    def _decide_velocity(self, current_time):
+        """Steer along the flow field (wander when there is nothing to hunt)"""
+        direction = self.flow_field.direction_at(*self.crocodile.rect.center)
+        if direction is None:
+            super()._decide_velocity(current_time)
+            return
+
+        dx, dy = direction
+        # A carrying crocodile keeps swimming off screen with its catch
+        if dx and not self.is_carrying and not self.is_capturing:
+            self.crocodile.swim_direction = self.TO_RIGH if dx > 0 else self.TO_LEFT
+        self.vel_y = dy * config.HUNTING_VERTICAL_SPEED
+
+        # Wandering picks up from here once the pegador is gone
+        self.swim_vert_change_due = None
+        self.swim_vert_timer.start(self.next_swim_vert_change)
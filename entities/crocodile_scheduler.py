@@ -0,0 +1,115 @@
+"""
+Time-sliced crocodile AI
+
+Every tick each crocodile integrates its motion (swimming, vertical
+velocity and wobble, river bounds, stepping towards its target state,
+capture and carrying), but the decision step of CrocodileControl - the
+timers that pick a new target state or vertical velocity, with their
+random draws, and the turn at the screen edges - only runs every
+CROCODILE_AI_INTERVAL ticks. Crocodiles take turns round-robin by their
+place in the crocodiles group, so about 1/interval of them decide on any
+tick and the AI cost grows slowly as crocodiles are added.
+
+A timer that runs out between two of a crocodile's turns waits for the
+next one. The scheduler reports that decision latency (ticks between a
+timer running out and the decision being taken) and the AI cost of every
+tick, both as session metrics and in get_stats().
+"""
+import math
+from collections import Counter
+from config import *
+from metrics import metrics
+
+_ai_time = metrics.histogram("crocodile.ai_ms", (0.05, 0.1, 0.25, 0.5, 1, 2, 4))
+_decision_latency = metrics.histogram("crocodile.decision_latency_ms", (16.7, 33.3, 50, 66.7, 100, 200))
+
+
+class CrocodileScheduler:
+    """Hands out decision turns to crocodiles and measures the AI cost"""
+
+    def __init__(self, interval=CROCODILE_AI_INTERVAL):
+        """
+        Args:
+            interval (int): Ticks between two decision steps of one crocodile
+                            (1 = every crocodile decides every tick)
+        """
+        self.interval = max(1, int(interval))
+        self._tick_seconds = 0.0
+
+        # Statistics
+        self.ticks = 0
+        self.turns = 0  # Crocodile updates with a decision step
+        self.updates = 0  # Crocodile updates
+        self.decisions = 0  # Timers handled in a decision step
+        self.latency_ticks = Counter()
+        self._latency_total_ms = 0.0
+        self._ai_total_ms = 0.0
+        self.max_ai_ms = 0.0
+
+    def begin_tick(self, crocodiles, tick):
+        """
+        Give this tick's decision turns (before the crocodiles are updated)
+
+        Args:
+            crocodiles (iterable): Crocodiles in play, in a stable order
+            tick (int): Current simulation tick
+        """
+        interval = self.interval
+        for index, crocodile in enumerate(crocodiles):
+            due = (index + tick) % interval == 0
+            crocodile.ai_due = due
+            self.turns += due
+            self.updates += 1
+        self._tick_seconds = 0.0
+
+    def add_time(self, seconds):
+        """
+        Count time spent in crocodile AI during this tick
+
+        Args:
+            seconds (float): perf_counter() time of one crocodile's AI
+        """
+        self._tick_seconds += seconds
+
+    def end_tick(self):
+        """Report the AI cost of the tick (after the crocodiles are updated)"""
+        ai_ms = self._tick_seconds * 1000
+        _ai_time.observe(ai_ms)
+        self.ticks += 1
+        self._ai_total_ms += ai_ms
+        if ai_ms > self.max_ai_ms:
+            self.max_ai_ms = ai_ms
+
+    def record_decision(self, late_ms):
+        """
+        Count a timer handled in a decision step
+
+        Args:
+            late_ms (float): Game time since the timer ran out
+        """
+        _decision_latency.observe(late_ms)
+        self.decisions += 1
+        self._latency_total_ms += late_ms
+        # A timer handled on the first tick after it ran out is 0 ticks late
+        # (game time is truncated to whole milliseconds: allow 1 ms)
+        self.latency_ticks[max(0, math.ceil((late_ms - 1) / SIM_TICK_MS) - 1)] += 1
+
+    def get_stats(self):
+        """
+        Get scheduling statistics
+
+        Returns:
+            dict: Interval, share of updates with a decision step, mean/max
+                  AI milliseconds per tick, decisions taken and their
+                  latency (mean milliseconds and count per ticks late)
+        """
+        return {
+            "interval": self.interval,
+            "ticks": self.ticks,
+            "decision_share": round(self.turns / self.updates, 3) if self.updates else 0.0,
+            "mean_ai_ms": round(self._ai_total_ms / self.ticks, 4) if self.ticks else 0.0,
+            "max_ai_ms": round(self.max_ai_ms, 4),
+            "decisions": self.decisions,
+            "mean_latency_ms": round(self._latency_total_ms / self.decisions, 2) if self.decisions else 0.0,
+            "latency_ticks": dict(sorted(self.latency_ticks.items())),
+        }
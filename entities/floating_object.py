@@ -4,13 +4,23 @@ Floating objects that move down the river
 import pygame
 import random
 from config import *
-from utils import resource_path
+from utils import load_image
+from surfaces import prepare_surface
+from metrics import metrics
+from leak_audit import auditor
+
+_mask_tests = metrics.counter("collision.mask_tests")
 
 
 class FloatingObject(pygame.sprite.Sprite):
     WIDTH = 40
     HEIGHT = 40
 
+    # Source images shared by every instance, keyed by image path
+    _source_images = {}
+    # Object types by index (snapshots store the index)
+    TYPE_NAMES = list(OBJECT_TYPES)
+
     def __init__(self, x, y, min_y, max_y, object_type="plastic"):
         """
         Initialize a floating object
@@ -21,36 +31,85 @@ class FloatingObject(pygame.sprite.Sprite):
             object_type (str): Type of object (plastic, metal, organic, paper)
         """
         super().__init__()
+        auditor.track(self)
         
-        self.object_type = object_type
-        self.object = OBJECT_TYPES.get(object_type)
-        
-        # Create a simple rectangle sprite (replace with images later)
         self.width = self.WIDTH
         self.height = self.HEIGHT
-        self.image = pygame.image.load(resource_path(self.object.image))
-        # self.color = OBJECT_TYPES.get(object_type, WHITE)
-        # self.image.fill(self.color)
-        self.rotation = random.randint(0, 359)
-        self.image = pygame.transform.rotate(self.image, self.rotation)
+        self.min_y = min_y
+        self.max_y = max_y
+        self.respawn(x, y, object_type)
+
+    def respawn(self, x, y, object_type):
+        """
+        (Re)initialize the object so pooled instances can be reused
+
+        Args:
+            x (int): Initial x position
+            y (int): Initial y position
+            object_type (str): Type of object (key in OBJECT_TYPES)
+        """
+        self._build_image(object_type, random.randint(0, 359))
+        self.rect.x = x
+        self.rect.y = y
+
+        # Movement properties - synchronized with river flow
+        self.vel_y = random.uniform(-0.5, 0.5)  # Slight vertical wobble
+
+        # Capture state
+        self.is_captured = False
+
+    def _build_image(self, object_type, rotation):
+        """
+        Build the rotated, scaled image, its rect and collision mask
+
+        Args:
+            object_type (str): Type of object (key in OBJECT_TYPES)
+            rotation (int): Rotation in degrees
+        """
+        self.object_type = object_type
+        self.object = OBJECT_TYPES.get(object_type)
+        self.rotation = rotation
+
+        source_image = self._source_images.get(self.object.image)
+        if source_image is None:
+            source_image = load_image(self.object.image).convert_alpha()
+            self._source_images[self.object.image] = source_image
+        self.image = pygame.transform.rotate(source_image, self.rotation)
         image_width = self.image.get_width() * self.object.scale
         image_height = self.image.get_height() * self.object.scale
         self.image = pygame.transform.smoothscale(self.image, (image_width, image_height))
-        
+        self.image = prepare_surface(self.image, alpha=True, rle=True, origin=f"FloatingObject:{object_type}")
+
         self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
 
         # Collision mask for pixel-perfect collision detection
         self.mask = pygame.mask.from_surface(self.image)
 
-        # Movement properties - synchronized with river flow
-        self.vel_y = random.uniform(-0.5, 0.5)  # Slight vertical wobble
-        self.min_y = min_y
-        self.max_y = max_y
+    def get_state(self):
+        """
+        Get the gameplay state (see snapshot.py)
 
-        # Capture state
-        self.is_captured = False
+        Returns:
+            tuple: (type index, rotation, x, y, vertical velocity, captured)
+        """
+        return (self.TYPE_NAMES.index(self.object_type), self.rotation,
+                self.rect.x, self.rect.y, self.vel_y, self.is_captured)
+
+    def set_state(self, state):
+        """
+        Restore the gameplay state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        type_index, rotation, x, y, self.vel_y, is_captured = state
+        object_type = self.TYPE_NAMES[type_index]
+        # Rebuilding the image is the expensive part: skip it when unchanged
+        if object_type != self.object_type or rotation != self.rotation:
+            self._build_image(object_type, rotation)
+        self.rect.x = x
+        self.rect.y = y
+        self.is_captured = bool(is_captured)
     
     def update(self):
         """Update the floating object position"""
@@ -91,6 +150,7 @@ class FloatingObject(pygame.sprite.Sprite):
         offset_y = other_sprite.rect.y - self.rect.y
 
         # Check if masks overlap (returns None if no collision, otherwise returns contact point)
+        _mask_tests.inc()
         overlap = self.mask.overlap(other_sprite.mask, (offset_x, offset_y))
 
         return overlap is not None
@@ -0,0 +1,153 @@
+"""
+Flow field over the river band, shared by hunting crocodiles
+
+The river band is cut into FLOW_FIELD_CELL_SIZE cells. The goal is the
+pegador's dive column: the cells under the pegador from the bottom of
+the band up to the depth its dive reaches (predicted from the force while
+charging). A Dijkstra pass from the goal cells gives every cell the
+direction of the next step on its cheapest path there, so steering a
+crocodile is one lookup however many crocodiles there are.
+
+update() is called once per tick, but the field is only rebuilt when the
+goal cells change (the pegador moved to another column or its dive got
+deeper), which is a few times per second at most.
+"""
+import heapq
+import time
+from config import *
+from entities.pegador import PegadorState
+from metrics import metrics
+
+_rebuild_time = metrics.histogram("crocodile.flow_field_ms", (0.1, 0.25, 0.5, 1, 2, 4))
+
+# Neighbour offsets and step costs (diagonals cost ~sqrt(2) times more)
+_NEIGHBOURS = ((1, 0, 10), (-1, 0, 10), (0, 1, 10), (0, -1, 10),
+               (1, 1, 14), (1, -1, 14), (-1, 1, 14), (-1, -1, 14))
+
+
+class FlowField:
+    """Coarse grid of directions towards the pegador's dive column"""
+
+    def __init__(self, left, top, width, height, cell_size=FLOW_FIELD_CELL_SIZE):
+        """
+        Args:
+            left (int): Left edge of the area covered (pixels)
+            top (int): Top edge (top of the river band)
+            width (int): Width of the area
+            height (int): Height of the area (the river band)
+            cell_size (int): Pixels per cell side
+        """
+        self.left = left
+        self.top = top
+        self.cell_size = max(1, cell_size)
+        self.cols = max(1, -(-width // self.cell_size))
+        self.rows = max(1, -(-height // self.cell_size))
+        # Direction (-1, 0 or 1 per axis) per cell, row by row; zero in the goal cells
+        self.dir_x = [0] * (self.cols * self.rows)
+        self.dir_y = [0] * (self.cols * self.rows)
+        self.goal = None  # (column, top row) of the goal cells, None = nothing to hunt
+
+        # Statistics
+        self.updates = 0
+        self.rebuilds = 0
+        self._rebuild_total_ms = 0.0
+
+    def update(self, pegador):
+        """
+        Point the field at a pegador's dive column (rebuilt only if it changed)
+
+        Args:
+            pegador (Pegador): Pegador to hunt (None = nothing to hunt)
+        """
+        self.updates += 1
+        goal = self._goal_for(pegador) if pegador is not None else None
+        if goal == self.goal:
+            return
+        self.goal = goal
+        if goal is not None:
+            self._rebuild(*goal)
+
+    def _goal_for(self, pegador):
+        """Goal cells of a pegador: (column, top row) of its dive column"""
+        if pegador.state == PegadorState.CHARGING:
+            # Where a dive released now would turn (same curve as Pegador._update_charging)
+            force_ratio = (pegador.force / PEGADOR_MAX_FORCE) ** 3
+            depth = pegador.river_band_bottom - force_ratio * (pegador.river_band_bottom - pegador.river_band_top)
+        elif pegador.state in (PegadorState.DESCENDING, PegadorState.ASCENDING):
+            depth = pegador.max_depth
+        elif pegador.state == PegadorState.IDLE:
+            depth = pegador.river_band_bottom  # Every dive starts at the bottom of the band
+        else:
+            return None  # Stunned, showing a catch or caught: not diving any time soon
+        return self._cell(pegador.rect.centerx, depth)
+
+    def _cell(self, x, y):
+        """(column, row) of the cell containing a point, clamped to the grid"""
+        col = int((x - self.left) // self.cell_size)
+        row = int((y - self.top) // self.cell_size)
+        return min(max(col, 0), self.cols - 1), min(max(row, 0), self.rows - 1)
+
+    def _rebuild(self, goal_col, goal_row):
+        """Recompute every cell's direction towards the goal cells"""
+        start = time.perf_counter()
+        cols, rows = self.cols, self.rows
+        dir_x, dir_y = self.dir_x, self.dir_y
+        cost = [None] * (cols * rows)
+        heap = []
+        for row in range(goal_row, rows):
+            index = row * cols + goal_col
+            cost[index] = 0
+            dir_x[index] = dir_y[index] = 0
+            heap.append((0, goal_col, row))
+
+        # Every cell points back at the neighbour it was reached from
+        while heap:
+            distance, col, row = heapq.heappop(heap)
+            if distance > cost[row * cols + col]:
+                continue
+            for dx, dy, step in _NEIGHBOURS:
+                next_col, next_row = col + dx, row + dy
+                if 0 <= next_col < cols and 0 <= next_row < rows:
+                    index = next_row * cols + next_col
+                    if cost[index] is None or distance + step < cost[index]:
+                        cost[index] = distance + step
+                        dir_x[index] = -dx
+                        dir_y[index] = -dy
+                        heapq.heappush(heap, (distance + step, next_col, next_row))
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _rebuild_time.observe(elapsed_ms)
+        self.rebuilds += 1
+        self._rebuild_total_ms += elapsed_ms
+
+    def direction_at(self, x, y):
+        """
+        Get the direction towards the goal from a point
+
+        Args:
+            x (float): Point x
+            y (float): Point y
+
+        Returns:
+            tuple: (dx, dy) with -1, 0 or 1 per axis ((0, 0) in the goal
+                   cells), or None when there is nothing to hunt
+        """
+        if self.goal is None:
+            return None
+        col, row = self._cell(x, y)
+        index = row * self.cols + col
+        return self.dir_x[index], self.dir_y[index]
+
+    def get_stats(self):
+        """
+        Get flow field statistics
+
+        Returns:
+            dict: Grid size, updates, rebuilds and mean rebuild milliseconds
+        """
+        return {
+            "cells": f"{self.cols}x{self.rows}",
+            "updates": self.updates,
+            "rebuilds": self.rebuilds,
+            "mean_rebuild_ms": round(self._rebuild_total_ms / self.rebuilds, 3) if self.rebuilds else 0.0,
+        }
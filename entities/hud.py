@@ -0,0 +1,140 @@
+"""
+HUD - Cached, change-driven heads-up display layer
+"""
+from config import *
+from surfaces import prepare_surface
+
+
+class HUD:
+    """
+    Composites the score, lives and pollution bar from cached surfaces.
+
+    Each element is rendered into its own surface and only rebuilt when
+    the value it shows changes (score, current_lives, current_points).
+    The force bar is the only element drawn from scratch every frame.
+    """
+
+    # Force bar layout (bottom right corner)
+    FORCE_BAR_WIDTH = 200
+    FORCE_BAR_HEIGHT = 20
+    FORCE_BAR_MARGIN = 20
+
+    def __init__(self, pegador_counter, pollution_bar, ui_font, force_font):
+        """
+        Initialize the HUD
+
+        Args:
+            pegador_counter (PegadorCounter): Lives counter to display
+            pollution_bar (PollutionBar): Pollution bar to display
+            ui_font (pygame.font.Font): Font for the score
+            force_font (pygame.font.Font): Font for the force bar label
+        """
+        self.pegador_counter = pegador_counter
+        self.pollution_bar = pollution_bar
+        self.ui_font = ui_font
+
+        # Cached layers: name -> (surface, position)
+        self.layers = {}
+        self._shown_values = {}
+
+        # Statistics
+        self.rebuild_counts = {"score": 0, "lives": 0, "pollution": 0}
+        self.frame_count = 0
+
+        # Force bar geometry and label are static
+        self.force_bar_x = SCREEN_WIDTH - self.FORCE_BAR_WIDTH - self.FORCE_BAR_MARGIN
+        self.force_bar_y = SCREEN_HEIGHT - self.FORCE_BAR_HEIGHT - self.FORCE_BAR_MARGIN
+        self.force_label = force_font.render("FORÇA", True, BLACK)
+        self.force_label_rect = self.force_label.get_rect(
+            center=(self.force_bar_x + self.FORCE_BAR_WIDTH // 2, self.force_bar_y - 15)
+        )
+
+    def invalidate(self):
+        """Force every cached layer to be rebuilt on the next draw"""
+        self._shown_values.clear()
+
+    def _refresh(self, name, value, render):
+        """
+        Rebuild a layer if the value it shows has changed
+
+        Args:
+            name (str): Layer name
+            value: Value currently shown by the layer
+            render (callable): Returns (surface, position) for the layer
+        """
+        if name in self._shown_values and self._shown_values[name] == value:
+            return
+        self._shown_values[name] = value
+        self.layers[name] = render()
+        self.rebuild_counts[name] += 1
+
+    def _render_score(self, score):
+        """Render the score text at the top left"""
+        text = self.ui_font.render(f"PONTOS: {score}", True, WHITE)
+        return prepare_surface(text, alpha=True, origin="HUD:score"), (10, 10)
+
+    def draw(self, backend, score, pegador):
+        """
+        Draw the HUD, rebuilding only the layers whose values changed
+
+        Args:
+            backend (RenderBackend): Backend to draw with
+            score (int): Current score
+            pegador (Pegador): Active pegador (for the force bar)
+        """
+        self.frame_count += 1
+
+        self._refresh("lives", self.pegador_counter.current_lives, self.pegador_counter.render)
+        self._refresh("pollution", self.pollution_bar.current_points, self.pollution_bar.render)
+        self._refresh("score", score, lambda: self._render_score(score))
+
+        for surface, position in self.layers.values():
+            backend.blit(surface, position)
+
+        # Draw force bar when charging (bottom right corner)
+        if pegador.is_charging():
+            self._draw_force_bar(backend, pegador.get_force_percentage())
+
+    def _draw_force_bar(self, backend, force_percentage):
+        """
+        Draw the force bar (the only per-frame HUD element)
+
+        Args:
+            backend (RenderBackend): Backend to draw with
+            force_percentage (float): Current force (0-100)
+        """
+        bar_x = self.force_bar_x
+        bar_y = self.force_bar_y
+        bar_width = self.FORCE_BAR_WIDTH
+        bar_height = self.FORCE_BAR_HEIGHT
+
+        # Background bar
+        backend.fill_rect(BLACK, (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4))
+        backend.fill_rect(WHITE, (bar_x, bar_y, bar_width, bar_height))
+
+        # Force bar (filled portion)
+        fill_width = int((force_percentage / 100) * bar_width)
+
+        # Color gradient based on force
+        if force_percentage < 33:
+            bar_color = GREEN
+        elif force_percentage < 66:
+            bar_color = YELLOW
+        else:
+            bar_color = RED
+
+        backend.fill_rect(bar_color, (bar_x, bar_y, fill_width, bar_height))
+
+        # Force text (centered above the bar)
+        backend.blit(self.force_label, self.force_label_rect)
+
+    def get_stats(self):
+        """
+        Get HUD rebuild statistics
+
+        Returns:
+            dict: Frames drawn and rebuild count per layer
+        """
+        stats = {"frames": self.frame_count}
+        stats.update(self.rebuild_counts)
+        return stats
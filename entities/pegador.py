@@ -4,7 +4,11 @@ Pegador (Pool Net) entity that collects trash from the river
 import pygame
 from enum import Enum
 from config import *
-from utils import resource_path
+from utils import load_image
+from surfaces import prepare_surface
+from entities.pegador_input import KeyboardInput
+from leak_audit import auditor
+from timer_wheel import Timer
 
 
 class PegadorState(Enum):
@@ -19,7 +23,14 @@ class PegadorState(Enum):
 
 
 class Pegador(pygame.sprite.Sprite):
-    def __init__(self, x, y, river_band_top, river_band_bottom):
+    # (front, side) sprites shared by every instance
+    _image_cache = None
+    # Collision mask of each sprite, by sprite
+    _mask_cache = None
+    # States by index (snapshots store the index)
+    _STATES = list(PegadorState)
+
+    def __init__(self, x, y, river_band_top, river_band_bottom, input_source=None):
         """
         Initialize the pegador
         
@@ -28,21 +39,20 @@ class Pegador(pygame.sprite.Sprite):
             y (int): Initial y position (at margin)
             river_band_top (int): Top boundary of the river where objects spawn
             river_band_bottom (int): Bottom boundary of the river where objects spawn
+            input_source: Where the controls come from (see pegador_input;
+                          the keyboard if None)
         """
         super().__init__()
+        auditor.track(self)
+        self.input_source = input_source if input_source is not None else KeyboardInput()
         
-        # Load sprites - both are long versions (300px height)
-        pegador_front = pygame.image.load(resource_path('assets/pegador_frente_comprido.png')).convert_alpha()
-        pegador_side = pygame.image.load(resource_path('assets/pegador_lado.png')).convert_alpha()
-        
-        # Scale sprites
-        front_width = int(pegador_front.get_width() * PEGADOR_SCALE)
-        front_height = int(pegador_front.get_height() * PEGADOR_SCALE)
-        side_width = int(pegador_side.get_width() * PEGADOR_SCALE)
-        side_height = int(pegador_side.get_height() * PEGADOR_SCALE)
-        
-        self.image_front = pygame.transform.smoothscale(pegador_front, (front_width, front_height))
-        self.image_side = pygame.transform.smoothscale(pegador_side, (side_width, side_height))
+        # Sprites (and their masks) are loaded once and shared by every pegador
+        if Pegador._image_cache is None:
+            Pegador._image_cache = self._load_images()
+            Pegador._mask_cache = {image: pygame.mask.from_surface(image) for image in Pegador._image_cache}
+        self.image_front, self.image_side = Pegador._image_cache
+        self._masks = Pegador._mask_cache
+        front_width = self.image_front.get_width()
         
         # Start with front view (when at margin)
         self.image = self.image_front
@@ -56,7 +66,7 @@ class Pegador(pygame.sprite.Sprite):
         self.collision_rect.top = self.rect.top
 
         # Collision mask for pixel-perfect collision detection
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = self._masks[self.image]
         
         # State management
         self.state = PegadorState.IDLE
@@ -74,19 +84,43 @@ class Pegador(pygame.sprite.Sprite):
         self.captured_trash = None
         
         # Show catch delay timer
-        self.show_catch_timer = 0
+        self.show_catch_timer = Timer(self._finish_showing_catch)
         self.show_catch_duration = 500  # 1 second to show the catch
 
         # Stunned timer
-        self.stunned_timer = 0
+        self.stunned_timer = Timer(self._finish_stun)
 
         # Crocodile reference when caught
         self.catching_crocodile = None
         self.catch_offset_y = 0  # Vertical offset from mouth position where pegador was caught
         
+    @staticmethod
+    def _load_images():
+        """
+        Load and scale the pegador sprites
+
+        Returns:
+            tuple: (front image, side image)
+        """
+        # Load sprites - both are long versions (300px height)
+        pegador_front = load_image('assets/pegador_frente_comprido.png').convert_alpha()
+        pegador_side = load_image('assets/pegador_lado.png').convert_alpha()
+        
+        # Scale sprites
+        front_width = int(pegador_front.get_width() * PEGADOR_SCALE)
+        front_height = int(pegador_front.get_height() * PEGADOR_SCALE)
+        side_width = int(pegador_side.get_width() * PEGADOR_SCALE)
+        side_height = int(pegador_side.get_height() * PEGADOR_SCALE)
+        
+        image_front = pygame.transform.smoothscale(pegador_front, (front_width, front_height))
+        image_side = pygame.transform.smoothscale(pegador_side, (side_width, side_height))
+        image_front = prepare_surface(image_front, alpha=True, rle=True, origin="Pegador:front")
+        image_side = prepare_surface(image_side, alpha=True, rle=True, origin="Pegador:side")
+        return image_front, image_side
+
     def update(self):
         """Update pegador state and position"""
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
 
         if self.state == PegadorState.IDLE:
             self._update_idle(keys)
@@ -98,8 +132,6 @@ class Pegador(pygame.sprite.Sprite):
             self._update_ascending()
         elif self.state == PegadorState.SHOWING_CATCH:
             self._update_showing_catch()
-        elif self.state == PegadorState.STUNNED:
-            self._update_stunned()
         elif self.state == PegadorState.CAUGHT_BY_CROCODILE:
             self._update_caught_by_crocodile()
     
@@ -124,7 +156,7 @@ class Pegador(pygame.sprite.Sprite):
             self.state = PegadorState.CHARGING
             self.force = 0
             self.image = self.image_side  # Switch to side view when diving
-            self.mask = pygame.mask.from_surface(self.image)  # Update mask
+            self.mask = self._masks[self.image]  # Update mask
     
     def _update_charging(self, keys):
         """Handle charging state - building up force"""
@@ -149,9 +181,9 @@ class Pegador(pygame.sprite.Sprite):
                 # Enter STUNNED state
                 self.force = 0
                 self.state = PegadorState.STUNNED
-                self.stunned_timer = 0
+                self.stunned_timer.start(PEGADOR_STUNNED_DURATION)
                 self.image = self.image_front
-                self.mask = pygame.mask.from_surface(self.image)
+                self.mask = self._masks[self.image]
             else:
                 self.force = min(self.force + PEGADOR_FORCE_CHARGE_RATE, PEGADOR_MAX_FORCE)
         else:
@@ -188,7 +220,7 @@ class Pegador(pygame.sprite.Sprite):
         if self.rect.centery <= self.max_depth:
             self.state = PegadorState.ASCENDING
             self.image = self.image_front  # Switch back to front view when ascending
-            self.mask = pygame.mask.from_surface(self.image)  # Update mask
+            self.mask = self._masks[self.image]  # Update mask
     
     def _update_ascending(self):
         """Handle ascending state - returning to margin (bottom)"""
@@ -211,45 +243,35 @@ class Pegador(pygame.sprite.Sprite):
             # If carrying trash, go to SHOWING_CATCH state for 1 second
             if self.captured_trash:
                 self.state = PegadorState.SHOWING_CATCH
-                self.show_catch_timer = 0
+                self.show_catch_timer.start(self.show_catch_duration)
                 self.force = 0
                 self.image = self.image_front
-                self.mask = pygame.mask.from_surface(self.image)  # Update mask
+                self.mask = self._masks[self.image]  # Update mask
             else:
                 # No trash, go directly to IDLE
                 self.state = PegadorState.IDLE
                 self.force = 0
                 self.image = self.image_front
-                self.mask = pygame.mask.from_surface(self.image)  # Update mask
+                self.mask = self._masks[self.image]  # Update mask
     
     def _update_showing_catch(self):
-        """Handle showing catch state - display caught trash for 1 second"""
+        """Handle showing catch state - display caught trash until show_catch_timer fires"""
         # Keep trash at margin position
         if self.captured_trash:
             self.captured_trash.rect.centerx = self.rect.centerx
             self.captured_trash.rect.centery = self.rect.top + 20
 
-        # Update timer
-        self.show_catch_timer += 16  # Approximate ms per frame (60 FPS)
-
-        # After 1 second, release trash and go to IDLE
-        if self.show_catch_timer >= self.show_catch_duration:
-            if self.captured_trash:
-                self.captured_trash.kill()
-                self.captured_trash = None
-            self.state = PegadorState.IDLE
-            self.show_catch_timer = 0
-
-    def _update_stunned(self):
-        """Handle stunned state - pegador is stunned for 1 second after maxing out force bar"""
-        # Update timer
-        self.stunned_timer += 16  # Approximate ms per frame (60 FPS)
+    def _finish_showing_catch(self):
+        """show_catch_timer callback - release the trash and go back to IDLE"""
+        if self.captured_trash:
+            self.captured_trash.kill()
+            self.captured_trash = None
+        self.state = PegadorState.IDLE
 
-        # After the stunned duration, return to IDLE
-        if self.stunned_timer >= PEGADOR_STUNNED_DURATION:
-            self.state = PegadorState.IDLE
-            self.stunned_timer = 0
-            self.force = 0
+    def _finish_stun(self):
+        """stunned_timer callback - the stun (after maxing out the force bar) is over"""
+        self.state = PegadorState.IDLE
+        self.force = 0
 
     def capture_trash(self, trash):
         """
@@ -270,6 +292,36 @@ class Pegador(pygame.sprite.Sprite):
             return True  # Indicate that trash was captured
         return False
     
+    def get_state(self):
+        """
+        Get the gameplay state (see snapshot.py; references to the captured
+        trash and the catching crocodile are stored by the game)
+
+        Returns:
+            tuple: Position, state, force, dive depth, catch offset, view and timers
+        """
+        return ((self.rect.x, self.rect.y, self._STATES.index(self.state), self.force, self.max_depth,
+                 self.catch_offset_y, self.image is self.image_side)
+                + self.show_catch_timer.get_state() + self.stunned_timer.get_state())
+
+    def set_state(self, state):
+        """
+        Restore the gameplay state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        x, y, state_index, self.force, self.max_depth, self.catch_offset_y, side_view = state[:7]
+        self.show_catch_timer.set_state(state[7:10])
+        self.stunned_timer.set_state(state[10:13])
+        self.state = self._STATES[state_index]
+        self.rect.x = x
+        self.rect.y = y
+        self.collision_rect.centerx = self.rect.centerx
+        self.collision_rect.top = self.rect.top
+        self.image = self.image_side if side_view else self.image_front
+        self.mask = self._masks[self.image]
+
     def get_force_percentage(self):
         """Get current force as percentage (0-100)"""
         return (self.force / PEGADOR_MAX_FORCE) * 100
@@ -304,7 +356,7 @@ class Pegador(pygame.sprite.Sprite):
 
         # Switch to side view
         self.image = self.image_side
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = self._masks[self.image]
 
     def _update_caught_by_crocodile(self):
         """Handle caught by crocodile state - follow the crocodile's mouth with stored offset"""
@@ -313,7 +365,7 @@ class Pegador(pygame.sprite.Sprite):
             print("[PEGADOR] Lost crocodile reference, returning to idle")
             self.state = PegadorState.IDLE
             self.image = self.image_front
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self._masks[self.image]
             return
 
         # Get the mouth position from the crocodile
@@ -3,7 +3,8 @@ Pegador Counter - Shows remaining pegador lives (HP system)
 """
 import pygame
 from config import *
-from utils import resource_path
+from utils import load_image
+from surfaces import prepare_surface
 
 
 class PegadorCounter:
@@ -27,7 +28,7 @@ class PegadorCounter:
         self.current_lives = max_lives
 
         # Load and scale pegador sprite
-        pegador_image = pygame.image.load(resource_path('assets/pegador_frente.png')).convert_alpha()
+        pegador_image = load_image('assets/pegador_frente.png').convert_alpha()
 
         # Scale to small icon size
         icon_scale = 0.4  # Increased size for better visibility
@@ -35,6 +36,11 @@ class PegadorCounter:
         icon_height = int(pegador_image.get_height() * icon_scale)
 
         self.pegador_icon = pygame.transform.smoothscale(pegador_image, (icon_width, icon_height))
+        self.pegador_icon = prepare_surface(self.pegador_icon, alpha=True, origin="PegadorCounter:icon")
+
+        # Grayed out/transparent icon for lost lives (built once)
+        self.faded_icon = self.pegador_icon.copy()
+        self.faded_icon.set_alpha(50)  # Very transparent
 
         # Spacing between icons
         self.icon_spacing = icon_width + 6
@@ -66,22 +72,34 @@ class PegadorCounter:
         """
         return self.current_lives <= 0
 
-    def draw(self, screen):
+    def render(self):
         """
-        Draw the pegador life icons on the screen
+        Render the life icons into a standalone surface
 
-        Args:
-            screen (pygame.Surface): The screen to draw on
+        Returns:
+            tuple: (pygame.Surface, (x, y)) surface and its screen position
         """
+        surface_width = self.icon_spacing * (self.max_lives - 1) + self.pegador_icon.get_width()
+        surface = pygame.Surface((surface_width, self.pegador_icon.get_height()), pygame.SRCALPHA)
+
         for i in range(self.max_lives):
-            icon_x = self.x + (i * self.icon_spacing)
-            icon_y = self.y
+            icon_x = i * self.icon_spacing
 
             if i < self.current_lives:
                 # Draw full opacity for remaining lives
-                screen.blit(self.pegador_icon, (icon_x, icon_y))
+                surface.blit(self.pegador_icon, (icon_x, 0))
             else:
                 # Draw grayed out/transparent for lost lives
-                faded_icon = self.pegador_icon.copy()
-                faded_icon.set_alpha(50)  # Very transparent
-                screen.blit(faded_icon, (icon_x, icon_y))
+                surface.blit(self.faded_icon, (icon_x, 0))
+
+        return prepare_surface(surface, alpha=True, rle=True, origin="PegadorCounter"), (self.x, self.y)
+
+    def draw(self, screen):
+        """
+        Draw the pegador life icons on the screen
+
+        Args:
+            screen (pygame.Surface): The screen to draw on
+        """
+        surface, position = self.render()
+        screen.blit(surface, position)
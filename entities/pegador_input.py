@@ -0,0 +1,57 @@
+"""
+Pegador input - where the pegador's controls come from
+
+Pegador.update() reads three controls (move left, move right and the
+dive/charge button) from an input source instead of the keyboard
+directly, so something other than a player can drive it (e.g. the
+training environment in env.py).
+
+Input sources provide get_pressed(), returning a mapping indexed like
+pygame.key.get_pressed() for the keys the pegador reads (K_LEFT,
+K_RIGHT and K_SPACE).
+"""
+import pygame
+
+
+class KeyboardInput:
+    """Reads the pegador's controls from the keyboard (the player)"""
+
+    def get_pressed(self):
+        """
+        Get the state of the controls
+
+        Returns:
+            ScancodeWrapper: pygame.key.get_pressed()
+        """
+        return pygame.key.get_pressed()
+
+
+class ActionInput:
+    """Controls set programmatically, held until the next set_action()"""
+
+    def __init__(self):
+        """Initialize with nothing pressed"""
+        self._pressed = {pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_SPACE: False}
+
+    def set_action(self, left=False, right=False, space=False):
+        """
+        Set which controls are held
+
+        Args:
+            left (bool): Move left
+            right (bool): Move right
+            space (bool): Hold the dive button (charge, release to dive)
+        """
+        pressed = self._pressed
+        pressed[pygame.K_LEFT] = left
+        pressed[pygame.K_RIGHT] = right
+        pressed[pygame.K_SPACE] = space
+
+    def get_pressed(self):
+        """
+        Get the state of the controls
+
+        Returns:
+            dict: Held state by key (K_LEFT, K_RIGHT and K_SPACE)
+        """
+        return self._pressed
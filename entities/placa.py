@@ -3,7 +3,8 @@ Placa entity - displays environmental messages at the top of the screen
 """
 import pygame
 import random
-from utils import resource_path
+from utils import load_image, load_font, read_text
+from surfaces import prepare_surface
 
 
 class Placa(pygame.sprite.Sprite):
@@ -20,7 +21,7 @@ class Placa(pygame.sprite.Sprite):
         self.debug = debug
         
         # Load placa image and scale it up
-        placa_original = pygame.image.load(resource_path('assets/placa.png')).convert_alpha()
+        placa_original = load_image('assets/placa.png').convert_alpha()
 
         # Scale placa to be 1.6x larger (reduced from 2.0x)
         scale_factor = 1.6
@@ -30,7 +31,7 @@ class Placa(pygame.sprite.Sprite):
         
         # Load font with smaller size to fit longer phrases
         try:
-            self.font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 15)
+            self.font = load_font('assets/fonts/upheaval.ttf', 15)
         except:
             print("Warning: Could not load upheaval.ttf, using default font")
             self.font = pygame.font.Font(None, 12)
@@ -38,23 +39,52 @@ class Placa(pygame.sprite.Sprite):
         # Load phrases from file
         self.phrases = self._load_phrases()
         
-        # Select a random phrase
-        self.current_phrase = random.choice(self.phrases) if self.phrases else "Preserve a natureza!"
-        
-        # Create the final image with text
+        # Position (the rect is sized by reset)
+        self.x = x
+        self.y = y
+
+        # Select a random phrase and create the final image with text
+        self.reset()
+
+    def reset(self):
+        """Pick a new random phrase and rebuild the sign image"""
+        self._set_phrase(random.choice(self.phrases) if self.phrases else "Preserve a natureza!")
+
+    def get_phrase_index(self):
+        """
+        Get the index of the phrase shown (see snapshot.py)
+
+        Returns:
+            int: Index in the phrase list (-1 for the default phrase)
+        """
+        return self.phrases.index(self.current_phrase) if self.current_phrase in self.phrases else -1
+
+    def set_phrase_index(self, index):
+        """
+        Show the phrase returned by get_phrase_index()
+
+        Args:
+            index (int): Index in the phrase list (-1 for the default phrase)
+        """
+        phrase = self.phrases[index] if 0 <= index < len(self.phrases) else "Preserve a natureza!"
+        if phrase != self.current_phrase:
+            self._set_phrase(phrase)
+
+    def _set_phrase(self, phrase):
+        """Show a phrase and rebuild the sign image"""
+        self.current_phrase = phrase
         self._create_image_with_text()
-        
-        # Position
+
         self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.top = y
+        self.rect.centerx = self.x
+        self.rect.top = self.y
     
     def _load_phrases(self):
         """Load phrases from frases.txt file"""
         phrases = []
         try:
-            with open(resource_path('assets/frases.txt'), 'r', encoding='utf-8') as f:
-                phrases = [line.strip() for line in f if line.strip()]
+            text = read_text('assets/frases.txt')
+            phrases = [line.strip() for line in text.splitlines() if line.strip()]
         except FileNotFoundError:
             print("Warning: frases.txt not found, using default phrase")
             phrases = ["Preserve a natureza!"]
@@ -140,6 +170,8 @@ class Placa(pygame.sprite.Sprite):
             line_rect.top = y_offset
             self.image.blit(line_surface, line_rect)
             y_offset += line_height
+
+        self.image = prepare_surface(self.image, alpha=True, rle=True, origin="Placa")
     
     def update(self):
         """Update method (placa is static, so nothing to do)"""
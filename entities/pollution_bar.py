@@ -3,7 +3,12 @@ Pollution Bar - Shows river pollution level based on caught/lost trash
 """
 import pygame
 from config import *
-from utils import resource_path
+from utils import load_font
+from surfaces import prepare_surface
+from metrics import metrics
+
+_trash_lost = metrics.counter("trash.lost")
+_trash_caught = metrics.counter("trash.caught")
 
 
 class PollutionBar:
@@ -36,7 +41,7 @@ class PollutionBar:
         # Above 66% = red (high pollution)
 
         # Load custom font
-        self.font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 16)
+        self.font = load_font('assets/fonts/upheaval.ttf', 16)
 
     def lose_trash(self):
         """
@@ -44,6 +49,7 @@ class PollutionBar:
         INCREASES pollution (bar fills to the right)
         """
         self.current_points = min(self.max_points, self.current_points + POLLUTION_BAR_POINTS_LOST_PER_TRASH)
+        _trash_lost.inc()
         print(f"[POLLUTION BAR] Lost trash! Pollution increased: {self.current_points}/{self.max_points}")
 
     def catch_trash(self):
@@ -52,6 +58,7 @@ class PollutionBar:
         DECREASES pollution (bar empties to the left)
         """
         self.current_points = max(0, self.current_points - POLLUTION_BAR_POINTS_GAINED_PER_TRASH)
+        _trash_caught.inc()
         print(f"[POLLUTION BAR] Caught trash! Pollution decreased: {self.current_points}/{self.max_points}")
 
     def is_game_over(self):
@@ -91,30 +98,43 @@ class PollutionBar:
         else:
             return RED  # High pollution = red
 
-    def draw(self, screen):
+    def render(self):
         """
-        Draw the pollution bar on the screen (horizontal)
+        Render the bar and its label into a standalone surface
 
-        Args:
-            screen (pygame.Surface): The screen to draw on
+        Returns:
+            tuple: (pygame.Surface, (x, y)) surface and its screen position
         """
-        # Draw border (black outline)
         border_thickness = 2
-        pygame.draw.rect(screen, WHITE,
-                        (self.x - border_thickness,
-                         self.y - border_thickness,
+        label_text = self.font.render("POLUIÇÃO", True, WHITE)
+
+        # Surface covers the border plus the label below the bar
+        surface_width = max(self.width + border_thickness * 2, label_text.get_width())
+        surface_height = border_thickness + self.height + 3 + label_text.get_height()
+        surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
+        origin_x = self.x - border_thickness - (surface_width - self.width - border_thickness * 2) // 2
+        origin_y = self.y - border_thickness
+
+        # Bar coordinates local to the surface
+        bar_x = self.x - origin_x
+        bar_y = self.y - origin_y
+
+        # Draw border (black outline)
+        pygame.draw.rect(surface, WHITE,
+                        (bar_x - border_thickness,
+                         bar_y - border_thickness,
                          self.width + border_thickness * 2,
                          self.height + border_thickness * 2))
 
         # Draw background (white/empty bar)
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, self.width, self.height))
 
         # Draw center marker (vertical white line at center)
-        center_x = self.x + (self.width // 2)
+        center_x = bar_x + (self.width // 2)
         marker_thickness = 2
-        pygame.draw.line(screen, WHITE,
-                        (center_x, self.y),
-                        (center_x, self.y + self.height),
+        pygame.draw.line(surface, WHITE,
+                        (center_x, bar_y),
+                        (center_x, bar_y + self.height),
                         marker_thickness)
 
         # Calculate filled width based on current pollution
@@ -126,12 +146,23 @@ class PollutionBar:
 
         # Draw filled portion from left to right
         if fill_width > 0:
-            pygame.draw.rect(screen, bar_color,
-                           (self.x, self.y, fill_width, self.height))
+            pygame.draw.rect(surface, bar_color,
+                           (bar_x, bar_y, fill_width, self.height))
 
         # Draw label "Poluição" below the bar
-        label_text = self.font.render("POLUIÇÃO", True, WHITE)
         label_rect = label_text.get_rect()
-        label_rect.centerx = self.x + (self.width // 2)
-        label_rect.top = self.y + self.height + 3
-        screen.blit(label_text, label_rect)
+        label_rect.centerx = bar_x + (self.width // 2)
+        label_rect.top = bar_y + self.height + 3
+        surface.blit(label_text, label_rect)
+
+        return prepare_surface(surface, alpha=True, rle=True, origin="PollutionBar"), (origin_x, origin_y)
+
+    def draw(self, screen):
+        """
+        Draw the pollution bar on the screen (horizontal)
+
+        Args:
+            screen (pygame.Surface): The screen to draw on
+        """
+        surface, position = self.render()
+        screen.blit(surface, position)
@@ -1,9 +1,14 @@
 """
 Spawn Manager - Controls the spawning of trash objects over time
+
+Warm-up, acceleration, waves and the spawns themselves run on timers of
+the timer wheel (see timer_wheel.py); update() only reports a spawn that
+came due.
 """
 import random
-import pygame
 from config import *
+from sim_clock import get_ticks
+from timer_wheel import Timer
 
 
 class SpawnManager:
@@ -18,10 +23,16 @@ class SpawnManager:
         """
         Initialize the spawn manager
         """
+        # Timers
+        self.warmup_timer = Timer(self._finish_warmup)
+        self.acceleration_timer = Timer(self._accelerate)
+        self.wave_timer = Timer(self._toggle_wave)
+        self.spawn_timer = Timer(self._spawn_timer_done)
+
         # Timing
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = get_ticks()
         self.last_spawn_time = self.game_start_time
-        self.last_acceleration_time = self.game_start_time
+        self.spawn_due = False  # Spawn timer ran out, reported by the next update()
 
         # Spawn rate control
         self.current_spawn_rate = SPAWN_INITIAL_RATE
@@ -31,10 +42,18 @@ class SpawnManager:
         self.in_wave = False
         self.wave_start_time = 0
         self.next_wave_time = self.game_start_time + random.randint(WAVE_INTERVAL_MIN, WAVE_INTERVAL_MAX)
+        self._start_timers()
 
         print(f"[SPAWN MANAGER] Initialized - Warmup: {SPAWN_WARMUP_TIME}ms, Initial rate: {SPAWN_INITIAL_RATE}ms")
         print(f"[SPAWN MANAGER] First wave scheduled at: {self.next_wave_time - self.game_start_time}ms")
 
+    def _start_timers(self):
+        """Arm the warm-up, acceleration and first wave timers (new round)"""
+        self.warmup_timer.start(SPAWN_WARMUP_TIME)
+        self.acceleration_timer.start(SPAWN_ACCELERATION_INTERVAL, SPAWN_ACCELERATION_INTERVAL)
+        self.wave_timer.start(self.next_wave_time - self.game_start_time)
+        self.spawn_timer.cancel()
+
     def update(self, current_time):
         """
         Update spawn manager state
@@ -45,39 +64,50 @@ class SpawnManager:
         Returns:
             bool: True if should spawn a new object, False otherwise
         """
-        # Check if warmup period is complete
-        if not self.warmup_complete:
-            if current_time - self.game_start_time >= SPAWN_WARMUP_TIME:
-                self.warmup_complete = True
-                print("[SPAWN MANAGER] Warmup complete - spawning enabled")
-            else:
-                return False  # Don't spawn during warmup
-
-        # Update spawn rate acceleration (gradually speed up over time)
-        if current_time - self.last_acceleration_time >= SPAWN_ACCELERATION_INTERVAL:
-            self.last_acceleration_time = current_time
-            old_rate = self.current_spawn_rate
-            self.current_spawn_rate = max(SPAWN_MIN_RATE, self.current_spawn_rate - SPAWN_ACCELERATION_AMOUNT)
-
-            if old_rate != self.current_spawn_rate:
-                print(f"[SPAWN MANAGER] Spawn rate accelerated: {old_rate}ms -> {self.current_spawn_rate}ms")
-
-        # Check for wave/burst activation
-        if not self.in_wave and current_time >= self.next_wave_time:
-            self._start_wave(current_time)
-
-        # Check if current wave should end
-        if self.in_wave and current_time - self.wave_start_time >= WAVE_DURATION:
-            self._end_wave(current_time)
-
-        # Determine if we should spawn based on current rate
-        effective_spawn_rate = WAVE_SPAWN_RATE if self.in_wave else self.current_spawn_rate
+        if not self.spawn_due:
+            return False
 
-        if current_time - self.last_spawn_time >= effective_spawn_rate:
-            self.last_spawn_time = current_time
-            return True
+        self.spawn_due = False
+        self.last_spawn_time = current_time
+        self._schedule_spawn()
+        return True
 
-        return False
+    def _schedule_spawn(self):
+        """Arm the spawn timer for the current rate (after warm-up)"""
+        if not self.warmup_complete:
+            return
+        effective_spawn_rate = WAVE_SPAWN_RATE if self.in_wave else self.current_spawn_rate
+        self.spawn_timer.start(self.last_spawn_time + effective_spawn_rate - get_ticks())
+
+    def _spawn_timer_done(self):
+        """spawn_timer callback - a spawn is due"""
+        self.spawn_due = True
+
+    def _finish_warmup(self):
+        """warmup_timer callback - spawning enabled"""
+        self.warmup_complete = True
+        print("[SPAWN MANAGER] Warmup complete - spawning enabled")
+        self._schedule_spawn()
+
+    def _accelerate(self):
+        """acceleration_timer callback - gradually speed up spawning"""
+        old_rate = self.current_spawn_rate
+        self.current_spawn_rate = max(SPAWN_MIN_RATE, self.current_spawn_rate - SPAWN_ACCELERATION_AMOUNT)
+
+        if old_rate != self.current_spawn_rate:
+            print(f"[SPAWN MANAGER] Spawn rate accelerated: {old_rate}ms -> {self.current_spawn_rate}ms")
+            if not self.in_wave:
+                self._schedule_spawn()
+        else:
+            self.acceleration_timer.cancel()  # Fastest rate reached
+
+    def _toggle_wave(self):
+        """wave_timer callback - start or end a wave"""
+        if self.in_wave:
+            self._end_wave(get_ticks())
+        else:
+            self._start_wave(get_ticks())
+        self._schedule_spawn()
 
     def _start_wave(self, current_time):
         """
@@ -88,6 +118,7 @@ class SpawnManager:
         """
         self.in_wave = True
         self.wave_start_time = current_time
+        self.wave_timer.start(WAVE_DURATION)
         print(f"[SPAWN MANAGER] WAVE STARTED! Duration: {WAVE_DURATION}ms, Rate: {WAVE_SPAWN_RATE}ms")
 
     def _end_wave(self, current_time):
@@ -102,6 +133,7 @@ class SpawnManager:
         # Schedule next wave
         next_wave_delay = random.randint(WAVE_INTERVAL_MIN, WAVE_INTERVAL_MAX)
         self.next_wave_time = current_time + next_wave_delay
+        self.wave_timer.start(next_wave_delay)
 
         print(f"[SPAWN MANAGER] Wave ended. Next wave in: {next_wave_delay}ms")
 
@@ -123,18 +155,50 @@ class SpawnManager:
         """
         return WAVE_SPAWN_RATE if self.in_wave else self.current_spawn_rate
 
+    def get_state(self):
+        """
+        Get the spawn timers and rate (see snapshot.py)
+
+        Returns:
+            tuple: Times, rate, wave state and the timer states
+        """
+        return ((self.game_start_time, self.last_spawn_time, self.spawn_due,
+                 self.current_spawn_rate, self.warmup_complete, self.in_wave, self.wave_start_time,
+                 self.next_wave_time)
+                + self.warmup_timer.get_state() + self.acceleration_timer.get_state()
+                + self.wave_timer.get_state() + self.spawn_timer.get_state())
+
+    def set_state(self, state):
+        """
+        Restore the state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        (self.game_start_time, self.last_spawn_time, spawn_due,
+         self.current_spawn_rate, warmup_complete, in_wave, self.wave_start_time,
+         self.next_wave_time) = state[:8]
+        self.warmup_timer.set_state(state[8:11])
+        self.acceleration_timer.set_state(state[11:14])
+        self.wave_timer.set_state(state[14:17])
+        self.spawn_timer.set_state(state[17:20])
+        self.spawn_due = bool(spawn_due)
+        self.warmup_complete = bool(warmup_complete)
+        self.in_wave = bool(in_wave)
+
     def reset(self):
         """
         Reset the spawn manager to initial state
         """
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         self.game_start_time = current_time
         self.last_spawn_time = current_time
-        self.last_acceleration_time = current_time
+        self.spawn_due = False
         self.current_spawn_rate = SPAWN_INITIAL_RATE
         self.warmup_complete = False
         self.in_wave = False
         self.wave_start_time = 0
         self.next_wave_time = current_time + random.randint(WAVE_INTERVAL_MIN, WAVE_INTERVAL_MAX)
+        self._start_timers()
 
         print("[SPAWN MANAGER] Reset to initial state")
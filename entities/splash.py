@@ -2,11 +2,20 @@
 Splash animation entity - plays when pegador catches trash
 """
 import pygame
-from utils import resource_path
-from config import SOUND_ENABLED, SPLASH_SOUND_VOLUME
+from utils import load_image, load_sound, init_mixer
+from surfaces import prepare_surface
+from leak_audit import auditor
+from animation import AnimationClip, AnimationPlayer
+from config import SOUND_ENABLED, SPLASH_SOUND_VOLUME, SIM_TICK_MS
 
 
 class Splash(pygame.sprite.Sprite):
+    FRAME_MS = 100  # 100ms per frame = 400ms total animation
+
+    # Animation clip and sound shared by every splash (loaded on first use)
+    _clip = None
+    _sound = None
+
     def __init__(self, x, y):
         """
         Initialize the splash animation
@@ -16,26 +25,43 @@ class Splash(pygame.sprite.Sprite):
             y (int): Center y position
         """
         super().__init__()
+        auditor.track(self)
         
+        if Splash._clip is None:
+            Splash._clip = self._load_clip()
+        self.animation = AnimationPlayer(Splash._clip)
+
+        self.respawn(x, y)
+
+    @classmethod
+    def _load_clip(cls):
+        """Load the splash animation clip from the spritesheet"""
         # Load spritesheet (1x4 vertical)
-        spritesheet = pygame.image.load(resource_path('assets/splash.png')).convert_alpha()
+        spritesheet = load_image('assets/splash.png').convert_alpha()
         
         # Extract 4 frames (64x64 each from 64x256 sheet)
         frame_width = 64
         frame_height = 64
-        self.frames = []
+        frames = []
         
         for i in range(4):
             frame = spritesheet.subsurface(pygame.Rect(0, i * frame_height, frame_width, frame_height))
-            self.frames.append(frame)
-        
+            frames.append(prepare_surface(frame, alpha=True, rle=True, origin="Splash"))
+        return AnimationClip(frames, cls.FRAME_MS, loop=False, name="splash")
+
+    def respawn(self, x, y):
+        """
+        (Re)start the animation so pooled instances can be reused
+
+        Args:
+            x (int): Center x position
+            y (int): Center y position
+        """
         # Animation state
-        self.current_frame = 0
-        self.frame_timer = 0
-        self.frame_duration = 100  # 100ms per frame = 400ms total animation
+        self.animation.play(Splash._clip, restart=True)
         
         # Set initial image and position
-        self.image = self.frames[self.current_frame]
+        self.image = self.animation.image
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -43,31 +69,47 @@ class Splash(pygame.sprite.Sprite):
         self.animation_complete = False
         
         # Play splash sound
-        if SOUND_ENABLED and pygame.mixer.get_init():
+        if SOUND_ENABLED and init_mixer():
             try:
-                splash_sound = pygame.mixer.Sound(resource_path('assets/sons/water_splash.ogg'))
-                splash_sound.set_volume(SPLASH_SOUND_VOLUME)
-                splash_sound.play()
+                if Splash._sound is None:
+                    Splash._sound = load_sound('assets/sons/water_splash.ogg')
+                    Splash._sound.set_volume(SPLASH_SOUND_VOLUME)
+                Splash._sound.play()
             except (pygame.error, FileNotFoundError) as e:
                 print(f"Warning: Could not play splash sound: {e}")
     
+    def get_state(self):
+        """
+        Get the gameplay state (see snapshot.py)
+
+        Returns:
+            tuple: (center x, center y, complete) and the animation state
+        """
+        return (self.rect.centerx, self.rect.centery, self.animation_complete) + self.animation.get_state()
+
+    def set_state(self, state):
+        """
+        Restore the gameplay state returned by get_state() (without the sound)
+
+        Args:
+            state (tuple): State to restore
+        """
+        x, y, animation_complete = state[:3]
+        self.animation.set_state(state[3:6])
+        self.animation_complete = bool(animation_complete)
+        self.image = self.animation.image
+        self.rect = self.image.get_rect()
+        self.rect.center = (x, y)
+
     def update(self):
-        """Update animation frame"""
+        """Advance the animation (the splash removes itself once it played through)"""
         if self.animation_complete:
             return
-        
-        # Update timer
-        self.frame_timer += 16  # ~60 FPS
-        
-        # Check if it's time to advance frame
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.current_frame += 1
-            
-            # Check if animation is complete
-            if self.current_frame >= len(self.frames):
-                self.animation_complete = True
-                self.kill()  # Remove from sprite groups
-            else:
-                # Update to next frame
-                self.image = self.frames[self.current_frame]
+
+        if self.animation.update(SIM_TICK_MS):
+            self.image = self.animation.image
+
+        # Check if animation is complete
+        if self.animation.finished:
+            self.animation_complete = True
+            self.kill()  # Remove from sprite groups
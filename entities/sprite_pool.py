@@ -0,0 +1,62 @@
+"""
+Sprite Pool - Recycles dead sprites instead of constructing new ones
+"""
+
+
+class SpritePool:
+    """
+    Pool of sprites of a single class.
+
+    A sprite is free for reuse once it is no longer in any group (killed
+    by the game, by the pegador or by its own animation), so callers never
+    have to hand sprites back explicitly. Pooled classes must provide a
+    respawn() method taking the same arguments as acquire().
+    """
+
+    def __init__(self, factory):
+        """
+        Initialize the pool
+
+        Args:
+            factory (callable): Builds a new sprite when no dead one is available
+        """
+        self.factory = factory
+        self.sprites = []
+
+    def acquire(self, *args):
+        """
+        Get a live sprite, reusing a dead one when possible
+
+        Args:
+            *args: Arguments for respawn() (or the factory for new sprites)
+
+        Returns:
+            pygame.sprite.Sprite: The (re)initialized sprite
+        """
+        for sprite in self.sprites:
+            if not sprite.alive():
+                sprite.respawn(*args)
+                return sprite
+
+        sprite = self.factory(*args)
+        self.sprites.append(sprite)
+        return sprite
+
+    def resize(self, count, *args):
+        """
+        Grow or shrink the pool to count sprites (restoring a game snapshot)
+
+        New sprites stay dead; dropped ones must be dead already.
+
+        Args:
+            count (int): Number of sprites
+            *args: Arguments for the factory
+        """
+        del self.sprites[count:]
+        while len(self.sprites) < count:
+            self.sprites.append(self.factory(*args))
+
+    def release_all(self):
+        """Kill every pooled sprite so all of them become available again"""
+        for sprite in self.sprites:
+            sprite.kill()
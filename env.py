@@ -0,0 +1,458 @@
+"""
+Training environment - Gym-style API over Game for automated playtest agents
+
+CrocolixoEnv runs one game without a window (SDL dummy video driver, no
+mixer) and never draws: a step only advances the simulation, holding the
+chosen controls for ENV_FRAME_SKIP ticks. VectorEnv runs N environments
+in worker processes; observations, rewards and done flags are exchanged
+through one shared memory block, so only a tiny command message per
+step goes through the pipes.
+
+Actions (index into ACTIONS) hold the controls Pegador.update() reads:
+    0 nothing       1 left          2 right
+    3 space         4 left + space  5 right + space
+Holding space charges the force bar; releasing it dives.
+
+Observations are float32 arrays of OBS_SIZE values, scaled to about 0-1:
+    pegador     x, y, force, one-hot state (PegadorState), respawning
+    game        pollution, lives left, trash wave active
+    trash       ENV_MAX_TRASH slots of: present, x, y, type
+                (OBJECT_TYPES index scaled to 0-1), oldest first
+    crocodiles  ENV_MAX_CROCODILES slots of: present, x, y, submersion
+                state (0 fully surfaced - 1 fully submerged), swimming
+                right, carrying a pegador
+
+Reward: +1 per trash caught, -1 per life lost. An episode terminates at
+game over and is truncated after ENV_MAX_STEPS steps.
+
+Requires numpy (not needed by the game itself). The simulation clock is
+shared by the whole process, so only one environment can be open per
+process; use VectorEnv to run several.
+"""
+import contextlib
+import multiprocessing
+import os
+import random
+from array import array
+from multiprocessing import shared_memory
+import pygame
+from config import *
+from entities.pegador import PegadorState
+from entities.pegador_input import ActionInput
+from utils import init_headless
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Controls held by each action: (left, right, space)
+ACTIONS = (
+    (False, False, False),
+    (True, False, False),
+    (False, True, False),
+    (False, False, True),
+    (True, False, True),
+    (False, True, True),
+)
+
+_PEGADOR_STATES = list(PegadorState)
+_TRASH_TYPE_VALUES = {name: (index + 1) / len(OBJECT_TYPES) for index, name in enumerate(OBJECT_TYPES)}
+
+PEGADOR_OBS_SIZE = 4 + len(_PEGADOR_STATES)
+GAME_OBS_SIZE = 3
+TRASH_OBS_SIZE = 4
+CROCODILE_OBS_SIZE = 6
+OBS_SIZE = (PEGADOR_OBS_SIZE + GAME_OBS_SIZE + ENV_MAX_TRASH * TRASH_OBS_SIZE
+            + ENV_MAX_CROCODILES * CROCODILE_OBS_SIZE)
+
+
+def _require_numpy():
+    """Raise a helpful error when numpy is missing"""
+    if np is None:
+        raise ImportError("env.py needs numpy (pip install numpy)")
+
+
+class CrocolixoEnv:
+    """One game driven by discrete actions"""
+
+    # Only one environment per process (the simulation clock is shared)
+    _open = False
+
+    def __init__(self, frame_skip=ENV_FRAME_SKIP, max_steps=ENV_MAX_STEPS, headless=True, quiet=True):
+        """
+        Create the game (assets are loaded once, episodes only reset it)
+
+        Args:
+            frame_skip (int): Simulation ticks per step
+            max_steps (int): Steps before an episode is truncated (0 = never)
+            headless (bool): Run without a window; render() still works
+            quiet (bool): Discard the game's log output
+        """
+        _require_numpy()
+        if CrocolixoEnv._open:
+            raise RuntimeError("Only one CrocolixoEnv can be open per process (use VectorEnv)")
+
+        from game import Game
+        from render import create_backend
+
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.headless = headless
+        self._devnull = open(os.devnull, "w") if quiet else None
+
+        if headless:
+            init_headless()
+        else:
+            pygame.init()
+        self.input = ActionInput()
+        try:
+            with self._quiet():
+                self.game = Game(backend=create_backend("software", scale=1, fullscreen=False, vsync=False),
+                                 input_source=self.input)
+        except BaseException:
+            # Nothing is open: a later environment can still be created
+            if self._devnull is not None:
+                self._devnull.close()
+            raise
+        # Only once the game exists (close() can always release it)
+        CrocolixoEnv._open = True
+
+        self.steps = 0
+        self._score = 0
+        self._lives = self.game.pegador_counter.current_lives
+
+    def _quiet(self):
+        """Context discarding the game's prints (when quiet)"""
+        if self._devnull is None:
+            return contextlib.nullcontext()
+        return contextlib.redirect_stdout(self._devnull)
+
+    def reset(self, seed=None):
+        """
+        Start a new episode
+
+        Args:
+            seed (int): Seed for the game's random generator (None keeps
+                        the current sequence)
+
+        Returns:
+            tuple: (observation, info)
+        """
+        if seed is not None:
+            random.seed(seed)
+        self.input.set_action()
+        with self._quiet():
+            self.game.reset()
+        self.steps = 0
+        self._score = 0
+        self._lives = self.game.pegador_counter.current_lives
+        return np.frombuffer(self.observe(), dtype=np.float32), self._info()
+
+    def step(self, action):
+        """
+        Hold an action for frame_skip simulation ticks
+
+        Args:
+            action (int): Index into ACTIONS
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        reward, terminated, truncated = self.step_simulation(action)
+        return np.frombuffer(self.observe(), dtype=np.float32), reward, terminated, truncated, self._info()
+
+    def step_simulation(self, action):
+        """
+        Advance the game without building an observation
+
+        Args:
+            action (int): Index into ACTIONS
+
+        Returns:
+            tuple: (reward, terminated, truncated)
+        """
+        self.input.set_action(*ACTIONS[action])
+        game = self.game
+        with self._quiet():
+            for _ in range(self.frame_skip):
+                game.update()
+                if not game.running:
+                    break
+        self.steps += 1
+
+        lives = game.pegador_counter.current_lives
+        reward = (game.score - self._score) / 10 - (self._lives - lives)
+        self._score = game.score
+        self._lives = lives
+
+        terminated = not game.running
+        truncated = not terminated and 0 < self.max_steps <= self.steps
+        return float(reward), terminated, truncated
+
+    def observe(self):
+        """
+        Build the observation of the current state
+
+        Returns:
+            array: OBS_SIZE float32 values (array('f'))
+        """
+        game = self.game
+        pegador = game.pegador
+        values = [0.0] * OBS_SIZE
+
+        values[0] = pegador.rect.centerx / SCREEN_WIDTH
+        values[1] = pegador.rect.centery / SCREEN_HEIGHT
+        values[2] = pegador.force / PEGADOR_MAX_FORCE
+        values[3] = 1.0 if game.pegador_is_on_cooldown else 0.0
+        values[4 + _PEGADOR_STATES.index(pegador.state)] = 1.0
+
+        index = PEGADOR_OBS_SIZE
+        values[index] = game.pollution_bar.current_points / game.pollution_bar.max_points
+        values[index + 1] = game.pegador_counter.current_lives / game.pegador_counter.max_lives
+        values[index + 2] = 1.0 if game.spawn_manager.is_in_wave() else 0.0
+
+        index += GAME_OBS_SIZE
+        for slot, trash in zip(range(ENV_MAX_TRASH), game.floating_objects):
+            base = index + slot * TRASH_OBS_SIZE
+            values[base] = 1.0
+            values[base + 1] = trash.rect.centerx / SCREEN_WIDTH
+            values[base + 2] = trash.rect.centery / SCREEN_HEIGHT
+            values[base + 3] = _TRASH_TYPE_VALUES.get(trash.object_type, 0.0)
+
+        index += ENV_MAX_TRASH * TRASH_OBS_SIZE
+        for slot, crocodile in zip(range(ENV_MAX_CROCODILES), game.crocodiles):
+            base = index + slot * CROCODILE_OBS_SIZE
+            values[base] = 1.0
+            values[base + 1] = crocodile.rect.centerx / SCREEN_WIDTH
+            values[base + 2] = crocodile.rect.centery / SCREEN_HEIGHT
+            values[base + 3] = crocodile.control.current_state / 4
+            values[base + 4] = float(crocodile.swim_direction)
+            values[base + 5] = 1.0 if crocodile.is_carrying_pegador else 0.0
+
+        return array("f", values)
+
+    def _info(self):
+        """Episode statistics reported with every observation"""
+        return {
+            "score": self.game.score,
+            "lives": self.game.pegador_counter.current_lives,
+            "pollution": self.game.pollution_bar.get_pollution_percentage(),
+            "steps": self.steps,
+        }
+
+    def render(self):
+        """
+        Draw the current state
+
+        Returns:
+            numpy.ndarray: The frame as a (height, width, 3) uint8 array
+        """
+        pygame.event.pump()
+        self.game.draw()
+        return pygame.surfarray.array3d(self.game.screen).swapaxes(0, 1)
+
+    def close(self):
+        """Release the environment (another one can be opened afterwards)"""
+        if self.game is not None:
+            # Drops the game's timers, entities and GC hook so it can be collected
+            with self._quiet():
+                self.game.close()
+            self.game = None
+        if self._devnull is not None:
+            self._devnull.close()
+            self._devnull = None
+        CrocolixoEnv._open = False
+
+
+def _worker(index, connection, memory_name, num_envs, frame_skip, max_steps):
+    """
+    Worker process loop: owns one environment and steps it on command
+
+    Args:
+        index (int): Environment index (its slot in the shared buffers)
+        connection (Connection): Command pipe to the VectorEnv
+        memory_name (str): Name of the shared memory block
+        num_envs (int): Number of environments sharing the block
+        frame_skip (int): Simulation ticks per step
+        max_steps (int): Steps before an episode is truncated
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    layout = _SharedLayout(num_envs)
+    observations, actions, rewards, flags = layout.views(memory.buf)
+    obs_start = index * OBS_SIZE
+    obs_end = obs_start + OBS_SIZE
+
+    env = CrocolixoEnv(frame_skip=frame_skip, max_steps=max_steps)
+    try:
+        while True:
+            command, argument = connection.recv()
+            if command == "step":
+                reward, terminated, truncated = env.step_simulation(actions[index])
+                info = None
+                if terminated or truncated:
+                    # Report the finished episode and start the next one
+                    info = env._info()
+                    env.reset()
+                observations[obs_start:obs_end] = env.observe()
+                rewards[index] = reward
+                flags[index * 2] = terminated
+                flags[index * 2 + 1] = truncated
+                connection.send(info)
+            elif command == "reset":
+                env.reset(argument)
+                observations[obs_start:obs_end] = env.observe()
+                connection.send(env._info())
+            elif command == "close":
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        env.close()
+        del observations, actions, rewards, flags
+        memory.close()
+        connection.close()
+
+
+class _SharedLayout:
+    """Layout of the shared memory block: observations, actions, rewards, done flags"""
+
+    def __init__(self, num_envs):
+        """
+        Args:
+            num_envs (int): Number of environments
+        """
+        self.num_envs = num_envs
+        self.observations_size = num_envs * OBS_SIZE * 4  # float32
+        self.actions_offset = self.observations_size
+        self.rewards_offset = self.actions_offset + num_envs * 4  # int32
+        self.flags_offset = self.rewards_offset + num_envs * 4  # float32
+        self.size = self.flags_offset + num_envs * 2  # (terminated, truncated) bytes
+
+    def views(self, buffer):
+        """
+        Get typed views of the block
+
+        Args:
+            buffer (memoryview): The shared memory buffer
+
+        Returns:
+            tuple: (observations 'f', actions 'i', rewards 'f', flags 'B') memoryviews
+        """
+        return (
+            buffer[:self.actions_offset].cast("f"),
+            buffer[self.actions_offset:self.rewards_offset].cast("i"),
+            buffer[self.rewards_offset:self.flags_offset].cast("f"),
+            buffer[self.flags_offset:self.size].cast("B"),
+        )
+
+
+class VectorEnv:
+    """N environments stepped in parallel by worker processes"""
+
+    def __init__(self, num_envs, frame_skip=ENV_FRAME_SKIP, max_steps=ENV_MAX_STEPS, start_method="spawn"):
+        """
+        Start the workers (each loads the game's assets once)
+
+        Episodes reset automatically: when an environment finishes, the
+        observation returned for it is the first one of its next episode
+        and its info holds the finished episode's statistics.
+
+        Args:
+            num_envs (int): Number of environments (worker processes)
+            frame_skip (int): Simulation ticks per step
+            max_steps (int): Steps before an episode is truncated (0 = never)
+            start_method (str): multiprocessing start method
+        """
+        _require_numpy()
+        self.num_envs = num_envs
+        layout = _SharedLayout(num_envs)
+        self._memory = shared_memory.SharedMemory(create=True, size=layout.size)
+        buffer = self._memory.buf
+        self._observations = np.ndarray((num_envs, OBS_SIZE), dtype=np.float32, buffer=buffer)
+        self._actions = np.ndarray(num_envs, dtype=np.int32, buffer=buffer, offset=layout.actions_offset)
+        self._rewards = np.ndarray(num_envs, dtype=np.float32, buffer=buffer, offset=layout.rewards_offset)
+        self._flags = np.ndarray((num_envs, 2), dtype=np.bool_, buffer=buffer, offset=layout.flags_offset)
+
+        context = multiprocessing.get_context(start_method)
+        self._connections = []
+        self._processes = []
+        for index in range(num_envs):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(index, child_end, self._memory.name, num_envs, frame_skip, max_steps),
+                name=f"crocolixo-env-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        self._closed = False
+
+    def reset(self, seed=None):
+        """
+        Start a new episode in every environment
+
+        Args:
+            seed (int): Base seed; environment i is seeded with seed + i
+
+        Returns:
+            tuple: (observations (num_envs, OBS_SIZE), list of infos)
+        """
+        for index, connection in enumerate(self._connections):
+            connection.send(("reset", None if seed is None else seed + index))
+        infos = [connection.recv() for connection in self._connections]
+        return self._observations.copy(), infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action
+
+        Args:
+            actions (sequence): One action index per environment
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, infos);
+                   infos[i] holds the finished episode's statistics when
+                   environment i was reset, and is empty otherwise
+        """
+        self._actions[:] = actions
+        for connection in self._connections:
+            connection.send(("step", None))
+        infos = [connection.recv() or {} for connection in self._connections]
+        return (
+            self._observations.copy(),
+            self._rewards.copy(),
+            self._flags[:, 0].copy(),
+            self._flags[:, 1].copy(),
+            infos,
+        )
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self._closed:
+            return
+        self._closed = True
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+
+        del self._observations, self._actions, self._rewards, self._flags
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,158 @@
+"""
+Slow-frame watchdog - capture what the main loop was doing during spikes
+
+Averages hide intermittent spikes (first frame of a wave, a crocodile
+surfacing, a splash spawning). The watchdog thread checks the running
+frame every few milliseconds; once it exceeds the frame budget by
+WATCHDOG_FACTOR it snapshots the main thread's stack, so the incident
+shows the code that was running while the frame was late.
+"""
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from config import *
+from metrics import metrics
+
+_incidents_counter = metrics.counter("watchdog.incidents")
+
+
+class FrameWatchdog:
+    """
+    Watches main-loop frames from a background thread.
+
+    The main thread brackets every frame with frame_started() and
+    frame_finished() and marks its stage (events, update, draw) with
+    set_stage(). The last `capacity` incidents are kept in a ring buffer.
+    """
+
+    def __init__(self, budget_ms=WATCHDOG_BUDGET_MS, factor=WATCHDOG_FACTOR, capacity=WATCHDOG_INCIDENTS):
+        """
+        Initialize the watchdog
+
+        Args:
+            budget_ms (float): Expected frame time
+            factor (float): A frame is slow once it runs longer than budget_ms * factor
+            capacity (int): Number of incidents kept
+        """
+        self.threshold = budget_ms * factor / 1000
+        self.poll_interval = max(0.001, budget_ms / 4000)
+        self.incidents = deque(maxlen=capacity)
+
+        self._main_thread_id = threading.main_thread().ident
+        self._frame_index = 0
+        self._frame_start = None  # perf_counter() of the running frame (None between frames)
+        self._stage = None
+        self._context = None
+        self._captured = None  # Incident of the running frame, once captured
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the watchdog thread (no-op if already running)"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="frame-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watchdog thread"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._frame_start = None
+
+    def frame_started(self, context=None):
+        """
+        Mark the start of a frame
+
+        Args:
+            context (str): What the game was doing (e.g. 'gameplay', 'wave')
+        """
+        self._frame_index += 1
+        self._captured = None
+        self._context = context
+        self._stage = "events"
+        self._frame_start = time.perf_counter()
+
+    def set_stage(self, stage):
+        """
+        Mark the stage of the running frame
+
+        Args:
+            stage (str): 'events', 'update' or 'draw'
+        """
+        self._stage = stage
+
+    def frame_finished(self):
+        """Mark the end of a frame (records the full duration of a slow frame)"""
+        start = self._frame_start
+        self._frame_start = None
+        incident = self._captured
+        if incident is not None and start is not None:
+            incident["frame_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    def _run(self):
+        """Polling loop (background thread)"""
+        while not self._stop_event.wait(self.poll_interval):
+            # frame_started() bumps the index before setting the start time:
+            # an index unchanged across the read means both are the same frame's
+            frame_index = self._frame_index
+            start = self._frame_start
+            if start is None or self._captured is not None or self._frame_index != frame_index:
+                continue
+            elapsed = time.perf_counter() - start
+            if elapsed > self.threshold:
+                self._capture(frame_index, start, elapsed)
+
+    def _capture(self, frame_index, start, elapsed):
+        """
+        Snapshot the main thread's stack for the running frame
+
+        Args:
+            frame_index (int): Index of the slow frame
+            start (float): perf_counter() start of the slow frame
+            elapsed (float): Seconds the frame had been running
+        """
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        stack = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+        stack.reverse()
+
+        # The slow frame may have finished while the stack was walked: the
+        # stack would belong to whatever ran next
+        if self._frame_index != frame_index or self._frame_start != start:
+            return
+
+        incident = {
+            "frame": frame_index,
+            "context": self._context,
+            "stage": self._stage,
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "frame_ms": None,  # Filled in when the frame finishes
+            "stack": stack,
+        }
+        self._captured = incident
+        self.incidents.append(incident)
+        _incidents_counter.inc()
+
+    def dump(self):
+        """Print every recorded incident and clear the ring buffer"""
+        if not self.incidents:
+            print("[WATCHDOG] No slow frames")
+            return
+
+        print(f"[WATCHDOG] {len(self.incidents)} slow frame(s) "
+              f"(threshold {self.threshold * 1000:.1f} ms):")
+        for incident in self.incidents:
+            print(f"[WATCHDOG] Frame {incident['frame']} ({incident['context']}, {incident['stage']}): "
+                  f"{incident['elapsed_ms']} ms when captured, {incident['frame_ms']} ms total")
+            for line in incident["stack"].format():
+                print("    " + line.rstrip().replace("\n", "\n    "))
+        self.incidents.clear()
@@ -1,51 +1,94 @@
 """
 Main game class that handles the game loop and state management
 """
+import time
+from functools import partial
 import pygame
 import random
 from config import *
 from entities.floating_object import FloatingObject
 from entities.crocodile import Crocodile
-from entities.crocodile_control import DebugControl
+from entities.crocodile_control import DebugControl, HuntingControl
+from entities.crocodile_scheduler import CrocodileScheduler
+from entities.flow_field import FlowField
 from entities.pegador import Pegador
 from entities.pegador_counter import PegadorCounter
 from entities.pollution_bar import PollutionBar
 from entities.spawn_manager import SpawnManager
 from entities.splash import Splash
 from entities.placa import Placa
-from utils import resource_path
+from entities.sprite_pool import SpritePool
+from entities.hud import HUD
+from utils import load_image, load_font
+from surfaces import prepare_surface, BlitDiagnostics
+from render import create_backend
+from pacing import FramePacer
+from power import PowerScheduler
+from sim_clock import sim_clock
+from timer_wheel import timer_wheel, Timer
+from snapshot import (GameSnapshot, RewindBuffer, SPRITE_PLACA, SPRITE_PEGADOR, SPRITE_CROCODILE,
+                      SPRITE_TRASH, SPRITE_SPLASH, CONTROL_DEFAULT, CONTROL_DEBUG)
+from metrics import metrics, COUNT_BUCKETS
+import profiling
+from gc_control import GCController
+
+_frame_interval = metrics.histogram("frame.interval_ms")
+_frame_update = metrics.histogram("frame.update_ms")
+_frame_draw = metrics.histogram("frame.draw_ms")
+_sprite_count = metrics.histogram("entities.sprites", COUNT_BUCKETS)
+_trash_gauge = metrics.gauge("entities.trash")
+_crocodile_gauge = metrics.gauge("entities.crocodiles")
+_trash_spawned = metrics.counter("trash.spawned")
 
 
 class Game:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, backend=None, pacer=None, power=None, watchdog=None, gc_control=None,
+                 input_source=None, spectator=None, rewind=REWIND_ENABLED):
         """
         Initialize the game
 
         Args:
             debug (bool): Enable debug mode with fixed test crocodile
+            backend (RenderBackend): Render backend to draw with (created if None)
+            pacer (FramePacer): Frame pacer shared with the menus (created if None)
+            power (PowerScheduler): Focus/visibility tracker shared with the menus (created if None)
+            watchdog (FrameWatchdog): Slow-frame watchdog (None to disable)
+            gc_control (GCController): Garbage collection scheduler (created if None)
+            input_source: Controls for every pegador (the keyboard if None)
+            spectator (SpectatorServer): Feed every tick is published to (None to disable)
+            rewind (bool): Keep recent game states so BACKSPACE can rewind
+                           (costs a snapshot every REWIND_INTERVAL_TICKS ticks)
         """
         self.debug = debug
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(GAME_TITLE)
-        self.clock = pygame.time.Clock()
-        self.running = True
-        self.game_over = False  # Flag to track if game ended due to losing lives
-
-        # Game state
-        self.score = 0
-        self.second_crocodile_spawned = False  # Flag to track if second crocodile was spawned
-        self.second_crocodile_unlocked = False  # Flag to track if score threshold was reached
+        self.input_source = input_source
+        self.spectator = spectator
+
+        # Reuse the window created by main.py instead of recreating it
+        self.backend = backend if backend is not None else create_backend()
+        self.screen = self.backend.canvas
+        if pacer is None:
+            pacer = FramePacer(vsync=self.backend.vsync, refresh_rate=self.backend.refresh_rate)
+        self.pacer = pacer
+        self.power = power if power is not None else PowerScheduler()
+        self.watchdog = watchdog
+        self._owns_gc_control = gc_control is None  # Closed with the game (see close())
+        self.gc_control = gc_control if gc_control is not None else GCController()
+
+        # Debug: flag sprites blitted in a non-display pixel format
+        self.blit_diagnostics = BlitDiagnostics() if debug and self.backend.name == "software" else None
 
         # Load and scale background images to fill the screen
-        rio_original = pygame.image.load(resource_path('assets/rio.png')).convert_alpha()
-        margens_original = pygame.image.load(resource_path('assets/margens.png')).convert_alpha()
+        rio_original = load_image('assets/rio.png').convert_alpha()
+        margens_original = load_image('assets/margens.png').convert_alpha()
         
         # Scale images to screen height while maintaining aspect ratio for tiling
         self.scale_factor = SCREEN_HEIGHT / rio_original.get_height()
         new_width = int(rio_original.get_width() * self.scale_factor)
         
-        self.rio_img = pygame.transform.scale(rio_original, (new_width, SCREEN_HEIGHT))
-        self.margens_img = pygame.transform.scale(margens_original, (new_width, SCREEN_HEIGHT))
+        self.rio_img = prepare_surface(pygame.transform.scale(rio_original, (new_width, SCREEN_HEIGHT)),
+                                       alpha=True, rle=True, origin="Game:rio")
+        self.margens_img = prepare_surface(pygame.transform.scale(margens_original, (new_width, SCREEN_HEIGHT)),
+                                           alpha=True, rle=True, origin="Game:margens")
         
         # Vertical band where objects should spawn (converted from image space)
         self.river_band_top = int(RIVER_IMAGE_BAND_TOP * self.scale_factor)
@@ -57,7 +100,6 @@ class Game:
         )
         
         # River animation
-        self.rio_x_offset = 0
         self.rio_width = self.rio_img.get_width()
         
         # Sprite groups
@@ -65,16 +107,11 @@ class Game:
         self.floating_objects = pygame.sprite.Group()
         self.crocodiles = pygame.sprite.Group()
 
-        
-        # Create pegador
-        pegador_x = SCREEN_WIDTH // 2
-        pegador_y = PEGADOR_MARGIN_Y
-        self.pegador = Pegador(pegador_x, pegador_y, self.river_band_top, self.river_band_bottom)
-        self.all_sprites.add(self.pegador)
-
-        # Pegador respawn cooldown tracking
-        self.pegador_respawn_cooldown = 0  # Timer for respawn cooldown
-        self.pegador_is_on_cooldown = False  # Flag to track if waiting for respawn
+        # Pools for short-lived sprites (reused across spawns and restarts)
+        self.trash_pool = SpritePool(
+            lambda x, y, obj_type: FloatingObject(x, y, self.river_band_top, self.river_band_bottom, obj_type)
+        )
+        self.splash_pool = SpritePool(Splash)
 
         # Create pegador counter (lives/HP system)
         self.pegador_counter = PegadorCounter(max_lives=3)
@@ -82,6 +119,9 @@ class Game:
         # Create pollution bar (top right corner)
         self.pollution_bar = PollutionBar()
 
+        # Gameplay timers start from the current tick (entities arm them from here on)
+        timer_wheel.reset(sim_clock.tick_count)
+
         # Create spawn manager
         self.spawn_manager = SpawnManager()
 
@@ -89,17 +129,119 @@ class Game:
         placa_x = SCREEN_WIDTH // 2
         placa_y = 0  # Positioned higher (closer to top edge)
         self.placa = Placa(placa_x, placa_y, debug=self.debug)
-        self.all_sprites.add(self.placa)
 
         # Load custom font for UI
-        self.ui_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 24)
-        self.force_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 18)
+        self.ui_font = load_font('assets/fonts/upheaval.ttf', 24)
+        self.force_font = load_font('assets/fonts/upheaval.ttf', 18)
+
+        # Cached HUD layer (score, lives, pollution bar and force bar)
+        self.hud = HUD(self.pegador_counter, self.pollution_bar, self.ui_font, self.force_font)
+
+        # Decision turns for the crocodile AI
+        self.crocodile_scheduler = CrocodileScheduler()
+
+        # Crocodile behavior (hunting crocodiles share one flow field towards the pegador)
+        if CROCODILE_BEHAVIOR == "hunting":
+            self.flow_field = FlowField(0, self.river_band_top, SCREEN_WIDTH,
+                                        self.river_band_bottom - self.river_band_top)
+            self.crocodile_control = partial(HuntingControl, flow_field=self.flow_field)
+        else:
+            self.flow_field = None
+            self.crocodile_control = None  # CrocodileControl
+
+        # Recent game states for rewinding (BACKSPACE)
+        self.rewind_buffer = RewindBuffer() if rewind else None
+
+        # Everything loaded so far lives for the whole session: keep it out
+        # of full collections (entities are created after this point)
+        self.gc_control.freeze()
 
         # Initialize game objects
         self._setup_game()
-    
+
+    def reset(self):
+        """
+        Reset gameplay state for a new round.
+
+        Keeps the window, loaded assets and fonts; only gameplay state and
+        entities are reinitialized, so restarting takes a single frame.
+        """
+        # Disarm every gameplay timer (entities re-arm theirs below)
+        self._clear_entities()
+
+        # Reset managers and HUD
+        self.pegador_counter.reset()
+        self.pollution_bar.reset()
+        self.spawn_manager.reset()
+        self.placa.reset()
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.clear()
+
+        self._setup_game()
+        print("[GAME] Reset for a new round")
+
+    def close(self):
+        """
+        Shut the game down (the window and pygame are left to the caller)
+
+        Disarms its timers and releases its entities, and closes the
+        garbage collection controller if the game created it, so nothing
+        keeps the game alive once it is dropped.
+        """
+        self._clear_entities()
+        if self._owns_gc_control:
+            self.gc_control.close()
+        print("[GAME] Closed")
+
+    def _clear_entities(self):
+        """Disarm every gameplay timer and release every entity (new round or shutdown)"""
+        timer_wheel.reset(sim_clock.tick_count)
+
+        # Silence crocodiles and drop carried pegadores (breaks the
+        # pegador <-> crocodile reference cycle before the groups are emptied)
+        for crocodile in self.crocodiles:
+            crocodile.release_pegador()
+            crocodile.stop_attack_sound()
+        # The pegador's captured trash goes back to the pool below
+        self.pegador.captured_trash = None
+
+        # Return every entity to its pool (or let it be collected)
+        self.trash_pool.release_all()
+        self.splash_pool.release_all()
+        self.all_sprites.empty()
+        self.floating_objects.empty()
+        self.crocodiles.empty()
+
     def _setup_game(self):
-        """Set up initial game objects"""
+        """Set up gameplay state and initial game objects"""
+        self.running = True
+        self.game_over = False  # Flag to track if game ended due to losing lives
+
+        # Game state
+        self.score = 0
+        self.second_crocodile_spawned = False  # Flag to track if second crocodile was spawned
+        self.second_crocodile_unlocked = False  # Flag to track if score threshold was reached
+
+        # River animation
+        self.rio_x_offset = 0
+
+        # Positions at the previous simulation tick (for interpolated drawing)
+        self._previous_positions = {}
+        self._previous_rio_x_offset = 0
+
+        self.all_sprites.add(self.placa)
+
+        # Create pegador
+        pegador_x = SCREEN_WIDTH // 2
+        pegador_y = PEGADOR_MARGIN_Y
+        self.pegador = Pegador(pegador_x, pegador_y, self.river_band_top, self.river_band_bottom,
+                              input_source=self.input_source)
+        self.all_sprites.add(self.pegador)
+
+        # Pegador respawn cooldown tracking
+        self.respawn_timer = Timer(self.spawn_pegador)  # Spawns the next pegador
+        self.pegador_is_on_cooldown = False  # Flag to track if waiting for respawn
+
         # Don't spawn initial trash - let SpawnManager control spawning
 
         # Spawn initial crocodile
@@ -109,25 +251,138 @@ class Game:
         if self.debug:
             self._setup_debug()
     
-    def run(self):
-        """Main game loop"""
+    def run(self, render_fps=RENDER_FPS):
+        """
+        Main game loop
+
+        The simulation advances in fixed ticks of SIM_TICK_MS while frames
+        are presented at up to render_fps; each frame is drawn interpolated
+        between the last two simulation states. While the window is
+        inactive (see PowerScheduler) the loop only waits for events.
+
+        Args:
+            render_fps (int): Presentation rate cap (0 = uncapped)
+        """
+        accumulator = 0.0
+        self.gc_control.enter_gameplay()
+        self.pacer.reset()  # Don't count the time spent in the menu
+        self._snapshot_positions()
+        if self.watchdog:
+            self.watchdog.start()
+
         while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
-            self.draw()
+            if not self.power.is_active():
+                self._wait_while_inactive()
+                accumulator = 0.0
+                continue
+
+            frame_ms = self.pacer.tick(render_fps)
+            phase = "wave" if self.spawn_manager.is_in_wave() else "gameplay"
+            profiling.set_phase(phase)
+            if self.watchdog:
+                self.watchdog.frame_started(phase)
+            accumulator += min(frame_ms, SIM_MAX_FRAME_MS)
+            self.handle_events(pygame.event.get())
+
+            if self.watchdog:
+                self.watchdog.set_stage("update")
+            update_start = time.perf_counter()
+            while accumulator >= SIM_TICK_MS and self.running:
+                self._snapshot_positions()
+                self.update()
+                accumulator -= SIM_TICK_MS
+                self._record_tick()
+            draw_start = time.perf_counter()
+
+            if self.watchdog:
+                self.watchdog.set_stage("draw")
+            self.draw(accumulator / SIM_TICK_MS)
+
+            if self.watchdog:
+                self.watchdog.frame_finished()
+            self._report_frame(frame_ms, update_start, draw_start)
+            profiling.frame_done()
+
+            # Use the time left before the next frame for garbage collection
+            self.gc_control.collect_in_slack(self.pacer.time_until_next_frame())
+
+        print(f"[HUD] Stats: {self.hud.get_stats()}")
+        print(f"[PACER] Stats: {self.pacer.get_stats()}")
+        print(f"[AI] Stats: {self.crocodile_scheduler.get_stats()}")
+        print(f"[TIMERS] Stats: {timer_wheel.get_stats()}")
+        if self.flow_field is not None:
+            print(f"[FLOW] Stats: {self.flow_field.get_stats()}")
+        if self.rewind_buffer is not None:
+            print(f"[REWIND] Stats: {self.rewind_buffer.get_stats()}")
+        if self.spectator is not None:
+            print(f"[SPECTATOR] Stats: {self.spectator.get_stats()}")
+
+        self.gc_control.leave_gameplay()
+        print(f"[GC] Stats: {self.gc_control.get_stats()}")
+
+        if self.watchdog:
+            self.watchdog.stop()
+            if self.game_over:
+                self.watchdog.dump()
     
-    def handle_events(self):
-        """Handle input events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def _report_frame(self, frame_ms, update_start, draw_start):
+        """
+        Report frame timing and entity counts to the session metrics
+
+        Args:
+            frame_ms (float): Time since the previous frame
+            update_start (float): perf_counter() before the simulation ticks
+            draw_start (float): perf_counter() before drawing
+        """
+        draw_end = time.perf_counter()
+        _frame_interval.observe(frame_ms)
+        _frame_update.observe((draw_start - update_start) * 1000)
+        _frame_draw.observe((draw_end - draw_start) * 1000)
+        _sprite_count.observe(len(self.all_sprites))
+        _trash_gauge.set(len(self.floating_objects))
+        _crocodile_gauge.set(len(self.crocodiles))
+
+    def _wait_while_inactive(self):
+        """
+        Pause until the window is active again.
+
+        Nothing is simulated or rendered in the meantime and game time
+        (sim_clock) stands still, so the round resumes exactly where it
+        stopped.
+        """
+        self.power.set_audio_paused(True)
+        while self.running and not self.power.is_active():
+            self.handle_events(self.power.idle_wait())
+            if self.power.take_exposed():
+                self.draw()
+        self.power.set_audio_paused(False)
+
+        # Restart frame pacing from now instead of catching up on the pause
+        self.pacer.resync()
+        self._snapshot_positions()
+
+    def handle_events(self, events):
+        """
+        Handle input events
+
+        Args:
+            events (list): Events from pygame.event.get()
+        """
+        for event in events:
+            self.power.handle_event(event)
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_BACKSPACE:
+                    self.rewind(REWIND_STEP_SECONDS)
     
     def update(self):
-        """Update game state"""
+        """Update game state by one simulation tick"""
+        sim_clock.advance()
+        timer_wheel.advance(sim_clock.tick_count)  # Fire the gameplay timers due this tick
+
         # Update river animation
         self.rio_x_offset += RIVER_FLOW_SPEED
 
@@ -141,21 +396,20 @@ class Game:
             if self.rio_x_offset <= -self.rio_width:
                 self.rio_x_offset = 0
 
-        # Update all sprites
-        self.all_sprites.update()
+        # Point hunting crocodiles at the pegador (rebuilt only when its dive column changes)
+        if self.flow_field is not None:
+            self.flow_field.update(None if self.pegador_is_on_cooldown else self.pegador)
 
-        # Update pegador respawn cooldown
-        if self.pegador_is_on_cooldown:
-            self.pegador_respawn_cooldown -= 16  # Approximate ms per frame (60 FPS)
-            if self.pegador_respawn_cooldown <= 0:
-                # Cooldown expired, spawn new pegador
-                self.spawn_pegador()
+        # Update all sprites (crocodiles decide on their scheduled turns)
+        self.crocodile_scheduler.begin_tick(self.crocodiles, sim_clock.tick_count)
+        self.all_sprites.update()
+        self.crocodile_scheduler.end_tick()
 
         # Process crocodile splash events
         for crocodile in self.crocodiles:
             while crocodile.pending_splashes:
                 event_type, splash_x, splash_y = crocodile.pending_splashes.pop(0)
-                splash = Splash(splash_x, splash_y)
+                splash = self.splash_pool.acquire(splash_x, splash_y)
                 self.all_sprites.add(splash)
                 print(f"[GAME] Created {event_type} splash at ({splash_x}, {splash_y})")
 
@@ -168,7 +422,7 @@ class Game:
                     crocodile.start_carrying_pegador(self.pegador)
 
                     # Start cooldown for new pegador spawn
-                    self.pegador_respawn_cooldown = PEGADOR_RESPAWN_COOLDOWN
+                    self.respawn_timer.start(PEGADOR_RESPAWN_COOLDOWN)
                     self.pegador_is_on_cooldown = True
                     print(f"[GAME] Pegador caught! Cooldown started for {PEGADOR_RESPAWN_COOLDOWN}ms")
 
@@ -191,7 +445,7 @@ class Game:
                         # Capture the trash and create splash animation
                         if self.pegador.capture_trash(trash):
                             # Create splash at collision point
-                            splash = Splash(trash.rect.centerx, trash.rect.centery)
+                            splash = self.splash_pool.acquire(trash.rect.centerx, trash.rect.centery)
                             self.all_sprites.add(splash)
 
                         self.floating_objects.remove(trash)
@@ -248,24 +502,261 @@ class Game:
                 print(f"[GAME] Second crocodile spawned! (Pollution: {pollution_percent:.1f}%)")
 
         # Spawn new objects using SpawnManager
-        current_time = pygame.time.get_ticks()
-        if self.spawn_manager.update(current_time):
+        if self.spawn_manager.update(sim_clock.get_ticks()):
             y = self._random_river_y()
             obj_type = random.choice(list(OBJECT_TYPES.keys()))
 
             # Spawn on the side opposite to the flow so objects enter the screen
             if RIVER_FLOW_SPEED > 0:
                 spawn_x = SCREEN_WIDTH + FloatingObject.WIDTH
-                floating_obj = FloatingObject(spawn_x, y, self.river_band_top, self.river_band_bottom, obj_type)
             else:
                 spawn_x = -FloatingObject.WIDTH
-                floating_obj = FloatingObject(spawn_x, y, self.river_band_top, self.river_band_bottom, obj_type)
+            floating_obj = self.trash_pool.acquire(spawn_x, y, obj_type)
+            _trash_spawned.inc()
 
             self.floating_objects.add(floating_obj)
             self.all_sprites.add(floating_obj)
     
-    def draw(self):
-        """Draw everything to the screen"""
+    def snapshot(self):
+        """
+        Capture the gameplay state (see snapshot.py)
+
+        Returns:
+            GameSnapshot: State at the current simulation tick
+        """
+        pegadores = self._pegadores()
+        crocodiles = list(self.crocodiles)
+        trash_slots = {sprite: slot for slot, sprite in enumerate(self.trash_pool.sprites)}
+        pegador_index = {pegador: i for i, pegador in enumerate(pegadores)}
+        crocodile_index = {crocodile: i for i, crocodile in enumerate(crocodiles)}
+
+        sprite_keys = {self.placa: (SPRITE_PLACA, 0)}
+        sprite_keys.update((pegador, (SPRITE_PEGADOR, i)) for pegador, i in pegador_index.items())
+        sprite_keys.update((crocodile, (SPRITE_CROCODILE, i)) for crocodile, i in crocodile_index.items())
+        sprite_keys.update((trash, (SPRITE_TRASH, slot)) for trash, slot in trash_slots.items())
+        sprite_keys.update((splash, (SPRITE_SPLASH, slot)) for slot, splash in enumerate(self.splash_pool.sprites))
+        sprite_order = []
+        for sprite in self.all_sprites:
+            sprite_order.extend(sprite_keys[sprite])
+
+        _, words, gauss = random.getstate()
+        return GameSnapshot(
+            tick=sim_clock.tick_count,
+            time_ms=sim_clock.time_ms,
+            rng=words + (gauss,),
+            game=(self.score, self.running, self.game_over, self.second_crocodile_unlocked,
+                  self.second_crocodile_spawned, self.rio_x_offset, self.pegador_is_on_cooldown,
+                  self.pollution_bar.current_points, self.pegador_counter.current_lives,
+                  self.placa.get_phrase_index()) + self.respawn_timer.get_state(),
+            timers=timer_wheel.get_state(),
+            spawn_manager=self.spawn_manager.get_state(),
+            trash=[trash.get_state() for trash in self.trash_pool.sprites],
+            splashes=[splash.get_state() for splash in self.splash_pool.sprites],
+            river_order=tuple(trash_slots[trash] for trash in self.floating_objects),
+            crocodiles=[crocodile.get_state() + (self._control_kind(crocodile),
+                                                 pegador_index.get(crocodile.carried_pegador, -1))
+                        for crocodile in crocodiles],
+            pegadores=[pegador.get_state() + (trash_slots.get(pegador.captured_trash, -1),
+                                              crocodile_index.get(pegador.catching_crocodile, -1))
+                       for pegador in pegadores],
+            sprite_order=tuple(sprite_order),
+        )
+
+    def restore(self, snapshot):
+        """
+        Put the game back in the state of a snapshot
+
+        Pooled sprites, pegadores and crocodiles are reused where they
+        exist and created where they don't, so a snapshot can be restored
+        into any game (same process or not).
+
+        Args:
+            snapshot (GameSnapshot): State to restore
+        """
+        # Entities re-arm their timers from their state below
+        timer_wheel.reset(snapshot.tick)
+
+        pegadores = self._pegadores()
+        crocodiles = list(self.crocodiles)
+        for crocodile in crocodiles:
+            crocodile.stop_attack_sound()
+        for group in (self.all_sprites, self.floating_objects, self.crocodiles):
+            group.empty()
+
+        # Pooled sprites, slot by slot (creating them may use the random
+        # module: its state is restored last)
+        self.trash_pool.resize(len(snapshot.trash), 0, 0, FloatingObject.TYPE_NAMES[0])
+        self.splash_pool.resize(len(snapshot.splashes), 0, 0)
+        trash = self.trash_pool.sprites
+        splashes = self.splash_pool.sprites
+        for sprite, state in zip(trash, snapshot.trash):
+            sprite.set_state(state)
+        for sprite, state in zip(splashes, snapshot.splashes):
+            sprite.set_state(state)
+
+        while len(pegadores) < len(snapshot.pegadores):
+            pegadores.append(Pegador(SCREEN_WIDTH // 2, PEGADOR_MARGIN_Y, self.river_band_top,
+                                     self.river_band_bottom, input_source=self.input_source))
+        pegadores = pegadores[:len(snapshot.pegadores)]
+
+        # Crocodiles are reused only with the same control (the debug
+        # crocodile comes back with DebugControl)
+        spare_crocodiles = {CONTROL_DEFAULT: [], CONTROL_DEBUG: []}
+        for crocodile in crocodiles:
+            spare_crocodiles[self._control_kind(crocodile)].append(crocodile)
+        crocodiles = []
+        for state in snapshot.crocodiles:
+            kind = state[-2]
+            if spare_crocodiles[kind]:
+                crocodiles.append(spare_crocodiles[kind].pop(0))
+            else:
+                control = DebugControl if kind == CONTROL_DEBUG else self.crocodile_control
+                crocodiles.append(Crocodile(0, 0, self.river_band_top, self.river_band_bottom,
+                                            control=control, scheduler=self.crocodile_scheduler))
+            if kind == CONTROL_DEBUG:
+                self.debug_crocodile = crocodiles[-1]
+
+        for pegador, state in zip(pegadores, snapshot.pegadores):
+            pegador.set_state(state[:-2])
+            trash_slot, crocodile_index = state[-2:]
+            pegador.captured_trash = trash[trash_slot] if trash_slot >= 0 else None
+            pegador.catching_crocodile = crocodiles[crocodile_index] if crocodile_index >= 0 else None
+        for crocodile, state in zip(crocodiles, snapshot.crocodiles):
+            crocodile.set_state(state[:-2])
+            crocodile.carried_pegador = pegadores[state[-1]] if state[-1] >= 0 else None
+
+        # Groups, in their original order
+        sprites_by_kind = {SPRITE_PLACA: [self.placa], SPRITE_PEGADOR: pegadores, SPRITE_CROCODILE: crocodiles,
+                           SPRITE_TRASH: trash, SPRITE_SPLASH: splashes}
+        order = snapshot.sprite_order
+        for i in range(0, len(order), 2):
+            self.all_sprites.add(sprites_by_kind[order[i]][order[i + 1]])
+        for slot in snapshot.river_order:
+            self.floating_objects.add(trash[slot])
+        self.crocodiles.add(*crocodiles)
+
+        (self.score, running, game_over, second_crocodile_unlocked, second_crocodile_spawned,
+         self.rio_x_offset, pegador_is_on_cooldown, self.pollution_bar.current_points,
+         self.pegador_counter.current_lives, phrase_index) = snapshot.game[:10]
+        self.respawn_timer.set_state(snapshot.game[10:13])
+        self.running = bool(running)
+        self.game_over = bool(game_over)
+        self.second_crocodile_unlocked = bool(second_crocodile_unlocked)
+        self.second_crocodile_spawned = bool(second_crocodile_spawned)
+        self.pegador_is_on_cooldown = bool(pegador_is_on_cooldown)
+        self.pegador = pegadores[0]
+        self.placa.set_phrase_index(phrase_index)
+        self.spawn_manager.set_state(snapshot.spawn_manager)
+
+        sim_clock.set(snapshot.time_ms, snapshot.tick)
+        random.setstate((3, snapshot.rng[:-1], snapshot.rng[-1]))
+        timer_wheel.set_state(snapshot.timers)
+
+        # Don't interpolate from the positions before the jump
+        self._snapshot_positions()
+
+    @staticmethod
+    def _control_kind(crocodile):
+        """Control kind of a crocodile in snapshots (CONTROL_DEFAULT or CONTROL_DEBUG)"""
+        return CONTROL_DEBUG if isinstance(crocodile.control, DebugControl) else CONTROL_DEFAULT
+
+    def _record_tick(self):
+        """Snapshot the tick for the rewind buffer and the spectator feed (encoded once for both)"""
+        rewind = self.rewind_buffer is not None and sim_clock.tick_count % REWIND_INTERVAL_TICKS == 0
+        if not rewind and self.spectator is None:
+            return
+        snapshot = self.snapshot()
+        data = snapshot.to_bytes()
+        if rewind:
+            self.rewind_buffer.push(snapshot, data)
+        if self.spectator is not None:
+            self.spectator.publish(snapshot.tick, data)
+
+    def rewind(self, seconds):
+        """
+        Go back in game time using the rewind buffer
+
+        Args:
+            seconds (float): Game time to go back
+
+        Returns:
+            bool: True if the game was rewound
+        """
+        if self.rewind_buffer is None:
+            return False
+        snapshot = self.rewind_buffer.rewind(sim_clock.tick_count - int(seconds * SIM_FPS))
+        if snapshot is None:
+            # Less history than asked for: go back as far as possible
+            span = self.rewind_buffer.ticks()
+            snapshot = self.rewind_buffer.rewind(span[0]) if span else None
+        if snapshot is None:
+            return False
+        self.restore(snapshot)
+        print(f"[GAME] Rewound to tick {snapshot.tick}")
+        return True
+
+    def _pegadores(self):
+        """
+        Get every pegador in play
+
+        Returns:
+            list: The active pegador, then pegadores still carried by crocodiles
+        """
+        pegadores = [self.pegador]
+        for crocodile in self.crocodiles:
+            carried = crocodile.carried_pegador
+            if carried is not None and carried not in pegadores:
+                pegadores.append(carried)
+        return pegadores
+
+    def _snapshot_positions(self):
+        """Remember sprite positions and river offset before a simulation tick"""
+        self._previous_positions = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
+        self._previous_rio_x_offset = self.rio_x_offset
+
+    def _interpolated_position(self, sprite, alpha):
+        """
+        Get where to draw a sprite between the previous and current tick
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite to draw
+            alpha (float): Fraction of a tick elapsed since the last update (0-1)
+
+        Returns:
+            tuple: Top-left position to draw at
+        """
+        x, y = sprite.rect.topleft
+        previous = self._previous_positions.get(sprite)
+        if previous is None or alpha >= 1:
+            return x, y
+
+        # Spawned, respawned or teleported sprites snap to their new position
+        dx = x - previous[0]
+        dy = y - previous[1]
+        if abs(dx) > INTERPOLATION_MAX_STEP or abs(dy) > INTERPOLATION_MAX_STEP:
+            return x, y
+
+        return round(previous[0] + dx * alpha), round(previous[1] + dy * alpha)
+
+    def _interpolated_rio_x_offset(self, alpha):
+        """Get the river offset between the previous and current tick"""
+        delta = self.rio_x_offset - self._previous_rio_x_offset
+        if alpha >= 1 or abs(delta) > abs(RIVER_FLOW_SPEED):
+            # The offset wrapped around during the last tick
+            return self.rio_x_offset
+        return self._previous_rio_x_offset + delta * alpha
+
+    def draw(self, alpha=1.0):
+        """
+        Draw everything to the screen
+
+        Args:
+            alpha (float): Fraction of a simulation tick elapsed since the
+                           last update; positions are interpolated from the
+                           previous tick (1.0 draws the current state)
+        """
+        rio_x_offset = self._interpolated_rio_x_offset(alpha)
+
         # Draw rio.png as repeating pattern
         # Add extra tiles to ensure full coverage during animation in both directions
         num_tiles = (SCREEN_WIDTH // self.rio_width) + 3  # +3 to ensure coverage in both directions
@@ -274,21 +765,23 @@ class Game:
         start_tile = -1 if RIVER_FLOW_SPEED >= 0 else -2
         
         for i in range(start_tile, start_tile + num_tiles):
-            x_pos = (i * self.rio_width) - self.rio_x_offset
-            self.screen.blit(self.rio_img, (x_pos, 0))
+            x_pos = round((i * self.rio_width) - rio_x_offset)
+            self.backend.blit(self.rio_img, (x_pos, 0))
         
         # Draw margens.png on top (STATIC - no offset)
         num_tiles_static = (SCREEN_WIDTH // self.rio_width) + 2
         for i in range(-1, num_tiles_static):
             x_pos = i * self.rio_width
-            self.screen.blit(self.margens_img, (x_pos, 0))
+            self.backend.blit(self.margens_img, (x_pos, 0))
         
         # Draw all sprites (except fully submerged crocodiles)
         for sprite in self.all_sprites:
             # Skip drawing crocodiles that are fully submerged
             if hasattr(sprite, 'control') and sprite.control.current_state == 4:
                 continue
-            self.screen.blit(sprite.image, sprite.rect)
+            if self.blit_diagnostics:
+                self.blit_diagnostics.check(sprite.image, type(sprite).__name__)
+            self.backend.blit(sprite.image, self._interpolated_position(sprite, alpha))
         
         # Debug: Draw collision rect (uncomment to visualize)
         # pygame.draw.rect(self.screen, (255, 0, 0), self.pegador.collision_rect, 2)
@@ -296,49 +789,11 @@ class Game:
         # Draw UI
         self._draw_ui()
         
-        pygame.display.flip()
+        self.backend.present()
     
     def _draw_ui(self):
         """Draw UI elements like score and lives"""
-        # Draw pegador counter (lives) at bottom left
-        self.pegador_counter.draw(self.screen)
-
-        # Draw pollution bar at top right
-        self.pollution_bar.draw(self.screen)
-
-        # Draw score at top left (original position)
-        score_text = self.ui_font.render(f"PONTOS: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-
-        # Draw force bar when charging (bottom right corner)
-        if self.pegador.is_charging():
-            bar_width = 200
-            bar_height = 20
-            bar_x = SCREEN_WIDTH - bar_width - 20  # 20px margin from right
-            bar_y = SCREEN_HEIGHT - bar_height - 20  # 20px margin from bottom
-            
-            # Background bar
-            pygame.draw.rect(self.screen, BLACK, (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4))
-            pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height))
-            
-            # Force bar (filled portion)
-            force_percentage = self.pegador.get_force_percentage()
-            fill_width = int((force_percentage / 100) * bar_width)
-            
-            # Color gradient based on force
-            if force_percentage < 33:
-                bar_color = GREEN
-            elif force_percentage < 66:
-                bar_color = YELLOW
-            else:
-                bar_color = RED
-            
-            pygame.draw.rect(self.screen, bar_color, (bar_x, bar_y, fill_width, bar_height))
-
-            # Force text (centered above the bar)
-            force_text = self.force_font.render("FORÇA", True, BLACK)
-            text_rect = force_text.get_rect(center=(bar_x + bar_width // 2, bar_y - 15))
-            self.screen.blit(force_text, text_rect)
+        self.hud.draw(self.backend, self.score, self.pegador)
 
     def _random_river_y(self):
         """Return a random y within the scaled river band"""
@@ -350,7 +805,8 @@ class Game:
         """Spawn a new pegador at the margin"""
         pegador_x = SCREEN_WIDTH // 2
         pegador_y = PEGADOR_MARGIN_Y
-        new_pegador = Pegador(pegador_x, pegador_y, self.river_band_top, self.river_band_bottom)
+        new_pegador = Pegador(pegador_x, pegador_y, self.river_band_top, self.river_band_bottom,
+                              input_source=self.input_source)
         self.all_sprites.add(new_pegador)
         self.pegador = new_pegador
         self.pegador_is_on_cooldown = False
@@ -364,7 +820,8 @@ class Game:
         # RIVER_FLOW_SPEED is negative, so crocodile enters from right
         spawn_x = 20
 
-        crocodile = Crocodile(spawn_x, y, self.river_band_top, self.river_band_bottom)
+        crocodile = Crocodile(spawn_x, y, self.river_band_top, self.river_band_bottom,
+                              control=self.crocodile_control, scheduler=self.crocodile_scheduler)
         self.crocodiles.add(crocodile)
         self.all_sprites.add(crocodile)
 
@@ -374,7 +831,8 @@ class Game:
         # Position: left side (x=150), middle of river (y = center of river band)
         debug_x = 150
         debug_y = (self.river_band_top + self.river_band_bottom) // 2
-        debug_croc = Crocodile(debug_x, debug_y, self.river_band_top, self.river_band_bottom, control=DebugControl)
+        debug_croc = Crocodile(debug_x, debug_y, self.river_band_top, self.river_band_bottom,
+                               control=DebugControl, scheduler=self.crocodile_scheduler)
         self.crocodiles.add(debug_croc)
         self.all_sprites.add(debug_croc)
         self.debug_crocodile = debug_croc
@@ -0,0 +1,139 @@
+"""
+GC control - keep cyclic garbage collection out of gameplay frames
+
+Entities are created and killed all the time during gameplay and sprites
+and groups reference each other, so the cyclic GC runs regularly. A
+generation-2 collection walks every tracked object (pygame and all the
+loaded assets included) and can take long enough to drop a frame.
+
+GCController:
+- freezes everything allocated while loading (gc.freeze), so full
+  collections no longer walk the assets
+- disables automatic generation-2 collections during gameplay
+- collects the young generations only when a frame finishes early
+  (leftover frame slack), and does full collections on menu transitions
+- measures every collection through gc.callbacks
+
+close() removes the gc.callbacks hook and gives the collector back its
+defaults; the owner (Game.close) calls it when it shuts down.
+"""
+import gc
+import time
+from config import *
+from metrics import metrics
+
+_gc_pause = metrics.histogram("gc.pause_ms")
+_gc_collections = [metrics.counter(f"gc.collections.gen{generation}") for generation in range(3)]
+
+# Threshold that keeps generation 2 from ever being collected automatically
+_NO_AUTOMATIC_GEN2 = 1_000_000
+
+
+class GCController:
+    """Schedules Python's cyclic garbage collector around gameplay frames"""
+
+    def __init__(self, enabled=GC_CONTROL_ENABLED, slack_min_ms=GC_SLACK_MIN_MS):
+        """
+        Initialize the controller and start measuring collections
+
+        Args:
+            enabled (bool): Control the collector (False only measures it)
+            slack_min_ms (float): Minimum time left in a frame to collect in it
+        """
+        self.enabled = enabled
+        self.slack_min_ms = slack_min_ms
+        self._default_thresholds = gc.get_threshold()
+        self._collection_start = None
+        self._frozen = False
+
+        # Statistics
+        self.collections = [0, 0, 0]
+        self.slack_collections = 0
+        self.max_pause_ms = 0.0
+        self.total_pause_ms = 0.0
+
+        gc.callbacks.append(self._on_collection)
+
+    def _on_collection(self, phase, info):
+        """gc.callbacks hook: time every collection"""
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+            return
+        if self._collection_start is None:
+            return
+
+        pause_ms = (time.perf_counter() - self._collection_start) * 1000
+        self._collection_start = None
+        generation = info["generation"]
+
+        self.collections[generation] += 1
+        self.total_pause_ms += pause_ms
+        self.max_pause_ms = max(self.max_pause_ms, pause_ms)
+        _gc_pause.observe(pause_ms)
+        _gc_collections[generation].inc()
+
+    def freeze(self):
+        """Collect once and move every surviving object to the permanent generation"""
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+        self._frozen = True
+        print(f"[GC] Froze {gc.get_freeze_count()} objects allocated while loading")
+
+    def enter_gameplay(self):
+        """Collect the previous round's garbage and stop automatic full collections"""
+        if not self.enabled:
+            return
+        gc.collect()
+        threshold0, threshold1, _ = self._default_thresholds
+        gc.set_threshold(threshold0, threshold1, _NO_AUTOMATIC_GEN2)
+
+    def leave_gameplay(self):
+        """Restore automatic collections and collect everything (menu transition)"""
+        if not self.enabled:
+            return
+        gc.set_threshold(*self._default_thresholds)
+        gc.collect()
+
+    def collect_in_slack(self, slack_seconds):
+        """
+        Collect the young generations if the frame finished early
+
+        Args:
+            slack_seconds (float): Time left until the next frame is due
+        """
+        if not self.enabled or slack_seconds * 1000 < self.slack_min_ms:
+            return
+        # Only worth it once a good part of the generation-0 budget is used
+        if gc.get_count()[0] < self._default_thresholds[0] // 2:
+            return
+        gc.collect(1)
+        self.slack_collections += 1
+
+    def close(self):
+        """Stop measuring collections and restore the collector's defaults (no-op when closed)"""
+        if self._on_collection in gc.callbacks:
+            gc.callbacks.remove(self._on_collection)
+        if not self.enabled:
+            return
+        gc.set_threshold(*self._default_thresholds)
+        if self._frozen:
+            # The frozen objects may belong to a game being released
+            gc.unfreeze()
+            self._frozen = False
+
+    def get_stats(self):
+        """
+        Get collection statistics
+
+        Returns:
+            dict: Collections per generation, collections run in frame
+                  slack, and total/max pause in milliseconds
+        """
+        return {
+            "collections": list(self.collections),
+            "slack_collections": self.slack_collections,
+            "total_pause_ms": round(self.total_pause_ms, 3),
+            "max_pause_ms": round(self.max_pause_ms, 3),
+        }
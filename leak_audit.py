@@ -0,0 +1,169 @@
+"""
+Leak audit - entity lifetimes, surfaces by origin and heap growth
+
+Debug aid for long sessions (soak.py --audit). When enabled:
+- entities register themselves with track() when constructed; a
+  weakref.finalize per instance counts its destruction, so live
+  instances per class are known at any time (pooled sprites count as
+  live, they are meant to be reused)
+- prepared surfaces are counted by the origin they were prepared with
+  (surfaces._origins, which only holds surfaces still alive)
+- tracemalloc snapshots are taken at every checkpoint; the lines whose
+  allocations grew the most since the previous checkpoint are reported
+
+checkpoint() is called once per game cycle (after a full collection, so
+garbage waiting for the cyclic GC is not mistaken for a leak).
+find_growth() flags anything that grew at every one of the last N
+checkpoints: traced memory (by more than LEAK_AUDIT_MIN_GROWTH_KB
+overall), live instances of a class or surfaces of an origin.
+"""
+import gc
+import tracemalloc
+import weakref
+from collections import Counter
+from config import *
+import surfaces
+
+
+class LifetimeAuditor:
+    """Counts entity lifetimes and records heap checkpoints"""
+
+    def __init__(self):
+        """Initialize a disabled auditor"""
+        self.enabled = False
+        self.created = Counter()
+        self.destroyed = Counter()
+        self.checkpoints = []  # dicts, see checkpoint()
+        self._snapshot = None
+
+    def enable(self, tracemalloc_frames=LEAK_AUDIT_TRACEMALLOC_FRAMES):
+        """
+        Start tracking (entities created before this are not counted)
+
+        Args:
+            tracemalloc_frames (int): Stack depth recorded per allocation
+                                      (0 = don't trace allocations)
+        """
+        self.enabled = True
+        if tracemalloc_frames and not tracemalloc.is_tracing():
+            tracemalloc.start(tracemalloc_frames)
+
+    def track(self, entity):
+        """
+        Count an entity and watch for its destruction (no-op when disabled)
+
+        Args:
+            entity: Newly constructed entity
+        """
+        if not self.enabled:
+            return
+        name = type(entity).__name__
+        self.created[name] += 1
+        weakref.finalize(entity, self._destroyed, name)
+
+    def _destroyed(self, name):
+        """weakref.finalize callback"""
+        self.destroyed[name] += 1
+
+    def live_counts(self):
+        """
+        Get the number of live tracked instances per class
+
+        Returns:
+            dict: Class name -> instances created and not yet destroyed
+        """
+        return {name: created - self.destroyed[name] for name, created in sorted(self.created.items())}
+
+    @staticmethod
+    def surface_counts():
+        """
+        Get the number of live prepared surfaces per origin
+
+        Returns:
+            dict: Origin label -> surfaces alive
+        """
+        return dict(sorted(Counter(surfaces._origins.values()).items()))
+
+    def checkpoint(self, label):
+        """
+        Collect garbage and record live counts and heap usage
+
+        Args:
+            label: What the checkpoint marks (e.g. game minutes)
+
+        Returns:
+            dict: The checkpoint (label, live, surfaces, traced_kb, top_growth)
+        """
+        gc.collect()
+        record = {
+            "label": label,
+            "live": self.live_counts(),
+            "surfaces": self.surface_counts(),
+            "traced_kb": None,
+            "top_growth": [],
+        }
+
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            record["traced_kb"] = round(tracemalloc.get_traced_memory()[0] / 1024, 1)
+            if self._snapshot is not None:
+                stats = snapshot.compare_to(self._snapshot, "lineno")
+                record["top_growth"] = [
+                    f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                    f"{stat.size_diff / 1024:+.1f} KB ({stat.count_diff:+d} blocks)"
+                    for stat in stats[:LEAK_AUDIT_TOP_LINES] if stat.size_diff > 0
+                ]
+            self._snapshot = snapshot
+
+        self.checkpoints.append(record)
+        return record
+
+    def find_growth(self, cycles=LEAK_AUDIT_CYCLES, min_growth_kb=LEAK_AUDIT_MIN_GROWTH_KB):
+        """
+        Find what kept growing over the last checkpoints
+
+        Args:
+            cycles (int): Consecutive checkpoint-to-checkpoint increases
+                          needed to call something growth
+            min_growth_kb (float): Minimum traced memory growth over those
+                                   cycles to report it
+
+        Returns:
+            list: Descriptions of what grew (empty if nothing did)
+        """
+        if len(self.checkpoints) < cycles + 1:
+            return []
+        window = self.checkpoints[-(cycles + 1):]
+
+        def keeps_growing(values):
+            return all(b > a for a, b in zip(values, values[1:]))
+
+        findings = []
+        traced = [record["traced_kb"] for record in window]
+        if None not in traced and keeps_growing(traced) and traced[-1] - traced[0] >= min_growth_kb:
+            findings.append(f"traced memory grew at every one of the last {cycles} checkpoints: "
+                            f"{traced[0]} KB -> {traced[-1]} KB")
+
+        for key, kind in (("live", "live instances"), ("surfaces", "surfaces from")):
+            names = set().union(*(record[key] for record in window))
+            for name in sorted(names):
+                values = [record[key].get(name, 0) for record in window]
+                if keeps_growing(values):
+                    findings.append(f"{kind} {name} grew at every one of the last {cycles} checkpoints: "
+                                    f"{values[0]} -> {values[-1]}")
+        return findings
+
+    @staticmethod
+    def print_checkpoint(record):
+        """Print a checkpoint"""
+        print(f"[AUDIT] {record['label']}: traced {record['traced_kb']} KB, live {record['live']}")
+        print(f"[AUDIT]   surfaces by origin: {record['surfaces']}")
+        for line in record["top_growth"]:
+            print(f"[AUDIT]   + {line}")
+
+
+# Auditor shared by the game (disabled unless a debug run enables it)
+auditor = LifetimeAuditor()
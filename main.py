@@ -2,67 +2,172 @@
 Game Jam 2025 - Crocolixo
 Main entry point
 """
+# Imported first so the startup timeline includes every other import
+from startup import timeline
 import pygame
 import sys
 import argparse
-from game import Game
 from menu import MenuManager
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE
+from config import (FPS, MENU_IDLE_FPS, WINDOW_SCALE, FULLSCREEN, RENDER_BACKEND, RENDER_FPS, VSYNC,
+                    METRICS_ENABLED, PROFILE_FRAMES, PROFILE_OUTPUT, WATCHDOG_ENABLED, SPECTATOR_ADDRESS,
+                    REWIND_ENABLED)
+from utils import init_mixer
+from render import RENDER_BACKENDS, create_backend
+from pacing import FramePacer
+from power import PowerScheduler
+from metrics import MetricsExporter
+import profiling
+from frame_watchdog import FrameWatchdog
+from recording import RECORD_WRITERS, FrameRecorder
 
 
 def main():
     """Initialize and run the game"""
+    timeline.mark("imports done")
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Crocolixo - River Cleanup Game')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--scale', type=int, default=WINDOW_SCALE, help='Integer window scale factor')
+    parser.add_argument('--fullscreen', action='store_true', default=FULLSCREEN, help='Run in fullscreen')
+    parser.add_argument('--renderer', choices=sorted(RENDER_BACKENDS), default=RENDER_BACKEND,
+                        help='Render backend (sdl2 falls back to software rendering)')
+    parser.add_argument('--render-fps', type=int, default=RENDER_FPS,
+                        help='Gameplay presentation rate cap, e.g. 144 (0 = uncapped)')
+    parser.add_argument('--vsync', action='store_true', default=VSYNC,
+                        help='Synchronize frames to the display refresh where supported')
+    parser.add_argument('--metrics', action='store_true', default=METRICS_ENABLED,
+                        help='Export session metrics to a JSONL file (see metrics.py)')
+    parser.add_argument('--profile', choices=sorted(profiling.PROFILERS),
+                        help='Profile the session: stack sampling (~1 kHz) or a cProfile window')
+    parser.add_argument('--profile-frames', type=int, default=PROFILE_FRAMES,
+                        help='Frames covered by the cProfile window (from the first gameplay frame)')
+    parser.add_argument('--profile-out', default=PROFILE_OUTPUT,
+                        help='Profile output path without extension (.folded and .speedscope.json)')
+    parser.add_argument('--watchdog', action='store_true', default=WATCHDOG_ENABLED,
+                        help='Capture the stack of slow gameplay frames (printed at game over)')
+    parser.add_argument('--record', choices=sorted(RECORD_WRITERS),
+                        help='Record every presented frame (raw delta clip or PNG sequence, software renderer)')
+    parser.add_argument('--autoplay', action='store_true',
+                        help='Let the autoplay bot control the pegador (see autoplay.py)')
+    parser.add_argument('--spectate', nargs='?', const=SPECTATOR_ADDRESS, metavar='ADDRESS',
+                        help=f'Stream live play to spectator viewers (HOST:PORT or socket path, '
+                             f'default {SPECTATOR_ADDRESS}; see spectator.py)')
+    parser.add_argument('--rewind', action='store_true', default=REWIND_ENABLED,
+                        help='Let BACKSPACE rewind the game a few seconds (always on with --debug)')
+    parser.add_argument('--startup-trace', action='store_true',
+                        help='Print the startup timeline when the first frame is shown')
     args = parser.parse_args()
 
-    pygame.init()
-    
-    # Explicitly initialize mixer for sound support
-    # This is important for some systems where pygame.init() doesn't auto-initialize mixer
-    try:
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-    except pygame.error as e:
-        # No audio device available (headless system, etc.)
-        # Game will run normally without sound
-        pass
-
-    # Create screen and clock
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption(GAME_TITLE)
-    clock = pygame.time.Clock()
-
-    # Start with menu
-    menu_manager = MenuManager(screen)
+    # Session metrics are always collected; export them only when asked
+    metrics_exporter = None
+    if args.metrics:
+        metrics_exporter = MetricsExporter()
+        metrics_exporter.start()
+
+    if args.profile:
+        profiling.start_profiler(args.profile, frames=args.profile_frames)
+
+    # Only the subsystems needed for the first frame; the mixer is
+    # initialized right after it (see init_mixer)
+    with timeline.span("pygame display/font init"):
+        pygame.display.init()
+        pygame.font.init()
+
+    # Create window (logical canvas scaled to the window), plus the frame
+    # pacer and focus/visibility tracker shared by the menus and the game
+    with timeline.span("create window"):
+        backend = create_backend(args.renderer, scale=args.scale, fullscreen=args.fullscreen, vsync=args.vsync)
+    screen = backend.canvas
+    pacer = FramePacer(vsync=backend.vsync, refresh_rate=backend.refresh_rate)
+
+    recorder = None
+    if args.record:
+        if backend.name == "software":
+            recorder = FrameRecorder(args.record)
+            backend.recorder = recorder
+        else:
+            print(f"[RECORD] Recording needs the software renderer, not recording ('{backend.name}' in use)")
+    power = PowerScheduler()
+
+    spectator = None
+    if args.spectate:
+        from spectator import SpectatorServer
+        try:
+            spectator = SpectatorServer(args.spectate)
+        except (OSError, ValueError) as e:
+            print(f"[SPECTATOR] Warning: Could not start the spectator feed: {e}")
+
+    # Start with menu (other menu states are built when first shown)
+    with timeline.span("menu"):
+        menu_manager = MenuManager(screen)
     running = True
 
+    # The game is built on first play and reset (not rebuilt) on later plays
+    game = None
+
     # Main game loop
     while running:
         # Menu loop
         menu_manager.reset_flags()
+        menu_fps = FPS
         while running and not menu_manager.should_start_game() and not menu_manager.should_restart_game():
-            clock.tick(FPS)
-            
-            events = pygame.event.get()
+            if power.is_active():
+                pacer.tick(menu_fps)
+                events = pygame.event.get()
+            else:
+                # Minimized or in the background: sleep until something happens
+                events = power.idle_wait()
+
             for event in events:
-                if event.type == pygame.QUIT:
+                if power.handle_event(event) and power.is_active():
+                    pacer.resync()
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
             
             menu_manager.handle_events(events)
+            profiling.set_phase("game_over" if menu_manager.current_state_name == "gameover" else "menu")
+            if not power.is_active():
+                if power.take_exposed():
+                    backend.present_canvas()
+                continue
             menu_manager.update()
-            menu_manager.draw()
-            
-            pygame.display.flip()
+
+            # Only redraw when something visible changed
+            redrawn = menu_manager.needs_redraw()
+            if redrawn:
+                menu_manager.draw()
+                backend.present_canvas()
+
+                if timeline.active:
+                    timeline.finish(print_timeline=args.startup_trace or args.debug)
+                    # Warm up the mixer now rather than on the first splash mid-game
+                    init_mixer()
+
+            # Drop to a low tick rate while the menu is idle
+            menu_fps = FPS if events or redrawn else MENU_IDLE_FPS
+            profiling.frame_done()
 
         # Start game if player chose to play
         if running and (menu_manager.should_start_game() or menu_manager.should_restart_game()):
-            game = Game(debug=args.debug)
-            game.run()
+            if game is None:
+                # The game modules are only needed once the player starts
+                from game import Game
+                watchdog = FrameWatchdog() if args.watchdog else None
+                bot = None
+                if args.autoplay:
+                    from autoplay import AutoplayBot
+                    bot = AutoplayBot()
+                game = Game(debug=args.debug, backend=backend, pacer=pacer, power=power, watchdog=watchdog,
+                            input_source=bot, spectator=spectator, rewind=args.rewind or args.debug)
+                if bot is not None:
+                    bot.game = game
+            else:
+                game.reset()
+            game.run(render_fps=args.render_fps)
             
             # Check if game ended due to losing all lives
             if game.game_over:
@@ -72,6 +177,16 @@ def main():
                 # Player quit the game (ESC), go back to main menu
                 menu_manager.set_state("start")
 
+    if game is not None:
+        game.close()
+    if recorder is not None:
+        recorder.stop()
+    if spectator is not None:
+        spectator.close()
+    if metrics_exporter is not None:
+        metrics_exporter.stop()
+    profiling.stop_profiler(args.profile_out)
+
     pygame.quit()
     sys.exit()
 
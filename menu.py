@@ -3,14 +3,24 @@ Menu system for start screen and credits
 """
 import pygame
 from config import *
-from utils import resource_path
+from utils import load_image, load_font
+from startup import timeline
 
 
 class MenuState:
-    """Base class for menu states"""
+    """
+    Base class for menu states
+
+    Static content (backgrounds, titles, text blocks) is composed once into
+    a static layer by build_static_layer(); draw() blits that layer and then
+    calls draw_dynamic() for animated parts only. States set self.dirty when
+    something visible changes so the menu loop can skip idle frames.
+    """
     def __init__(self, screen):
         self.screen = screen
         self.next_state = None
+        self.static_layer = None  # Composed on first draw
+        self.dirty = True
     
     def handle_events(self, events):
         """Handle input events"""
@@ -19,26 +29,81 @@ class MenuState:
     def update(self):
         """Update menu state"""
         pass
+
+    def invalidate(self):
+        """Mark the state for a full redraw, recomposing the static layer"""
+        self.static_layer = None
+        self.dirty = True
+
+    def build_static_layer(self):
+        """
+        Compose everything that does not change between frames
+
+        Returns:
+            pygame.Surface: Screen-sized surface with the static content
+        """
+        return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
     
     def draw(self):
         """Draw menu"""
+        if self.static_layer is None:
+            self.static_layer = self.build_static_layer()
+        self.screen.blit(self.static_layer, (0, 0))
+        self.draw_dynamic()
+        self.dirty = False
+
+    def draw_dynamic(self):
+        """Draw animated parts on top of the static layer"""
         pass
 
+    def _update_blink(self, visible):
+        """
+        Toggle a blinking element based on elapsed time
+
+        Args:
+            visible (bool): Current visibility
+
+        Returns:
+            bool: New visibility
+        """
+        current_time = pygame.time.get_ticks()
+        if current_time - self.blink_timer >= self.BLINK_INTERVAL:
+            self.blink_timer = current_time
+            self.dirty = True
+            return not visible
+        return visible
+
+
+def render_options(font, options):
+    """
+    Pre-render menu options in both normal and selected colors
+
+    Args:
+        font (pygame.font.Font): Font for the options
+        options (list): Option labels
+
+    Returns:
+        list: (normal surface, selected surface) per option
+    """
+    return [(font.render(option, True, WHITE), font.render(option, True, YELLOW)) for option in options]
+
 
 class StartScreen(MenuState):
     """Start screen with background image and menu options"""
+    BLINK_INTERVAL = 500  # milliseconds
+
     def __init__(self, screen):
         super().__init__(screen)
         
         # Load start screen background
-        self.background = pygame.image.load(resource_path('assets/start_screen.png')).convert()
+        self.background = load_image('assets/start_screen.png').convert()
         self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Load font
         try:
-            self.title_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 48)
-            self.menu_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 32)
-            self.hint_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 20)
+            self.title_font = load_font('assets/fonts/upheaval.ttf', 48)
+            self.menu_font = load_font('assets/fonts/upheaval.ttf', 32)
+            self.hint_font = load_font('assets/fonts/upheaval.ttf', 20)
         except:
             print("Warning: Could not load upheaval.ttf, using default font")
             self.title_font = pygame.font.Font(None, 48)
@@ -48,9 +113,14 @@ class StartScreen(MenuState):
         # Menu options
         self.selected_option = 0
         self.options = ["JOGAR", "CREDITOS"]
+        self.option_surfaces = render_options(self.menu_font, self.options)
+
+        # Hint at the bottom
+        self.hint = self.hint_font.render("Pressione ENTER ou Clique para comecar", True, WHITE)
+        self.hint_rect = self.hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         
         # Animation
-        self.blink_timer = 0
+        self.blink_timer = pygame.time.get_ticks()
         self.show_hint = True
     
     def handle_events(self, events):
@@ -64,40 +134,36 @@ class StartScreen(MenuState):
                         self.next_state = "credits"
                 elif event.key == pygame.K_UP:
                     self.selected_option = (self.selected_option - 1) % len(self.options)
+                    self.dirty = True
                 elif event.key == pygame.K_DOWN:
                     self.selected_option = (self.selected_option + 1) % len(self.options)
+                    self.dirty = True
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Allow clicking to go to story
                 self.next_state = "story"
     
     def update(self):
         """Update animations"""
-        self.blink_timer += 1
-        if self.blink_timer >= 30:  # Blink every 30 frames (0.5s at 60fps)
-            self.blink_timer = 0
-            self.show_hint = not self.show_hint
+        self.show_hint = self._update_blink(self.show_hint)
+
+    def build_static_layer(self):
+        """Compose the background image"""
+        return self.background
     
-    def draw(self):
-        """Draw start screen"""
-        # Draw background
-        self.screen.blit(self.background, (0, 0))
-        
+    def draw_dynamic(self):
+        """Draw menu options and the blinking hint"""
         # Position text in lower portion of screen
         menu_y_start = SCREEN_HEIGHT - 250
         
         # Draw menu options
-        for i, option in enumerate(self.options):
-            color = YELLOW if i == self.selected_option else WHITE
-            text = self.menu_font.render(option, True, color)
+        for i, (normal, selected) in enumerate(self.option_surfaces):
+            text = selected if i == self.selected_option else normal
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, menu_y_start + i * 60))
             self.screen.blit(text, text_rect)
         
         # Draw hint at the bottom
         if self.show_hint:
-            hint_text = "Pressione ENTER ou Clique para comecar"
-            hint = self.hint_font.render(hint_text, True, WHITE)
-            hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-            self.screen.blit(hint, hint_rect)
+            self.screen.blit(self.hint, self.hint_rect)
 
 
 class CreditsScreen(MenuState):
@@ -107,9 +173,9 @@ class CreditsScreen(MenuState):
         
         # Load font
         try:
-            self.title_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 56)
-            self.name_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 36)
-            self.hint_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 24)
+            self.title_font = load_font('assets/fonts/upheaval.ttf', 56)
+            self.name_font = load_font('assets/fonts/upheaval.ttf', 36)
+            self.hint_font = load_font('assets/fonts/upheaval.ttf', 24)
         except:
             print("Warning: Could not load upheaval.ttf, using default font")
             self.title_font = pygame.font.Font(None, 56)
@@ -135,10 +201,12 @@ class CreditsScreen(MenuState):
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self.next_state = "start"
     
-    def draw(self):
-        """Draw credits screen"""
+    def build_static_layer(self):
+        """Compose the whole credits screen (nothing is animated)"""
+        layer = super().build_static_layer()
+
         # Dark background
-        self.screen.fill((20, 40, 60))
+        layer.fill((20, 40, 60))
         
         # Draw credits centered
         y_offset = 150
@@ -151,26 +219,29 @@ class CreditsScreen(MenuState):
             
             text = font.render(text_str, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
             y_offset += line_spacing
         
         # Draw back hint at bottom
         hint_text = "Pressione ENTER para voltar"
         hint = self.hint_font.render(hint_text, True, WHITE)
         hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        self.screen.blit(hint, hint_rect)
+        layer.blit(hint, hint_rect)
+        return layer
 
 
 class StoryScreen(MenuState):
     """Story and instructions screen"""
+    BLINK_INTERVAL = 500  # milliseconds
+
     def __init__(self, screen):
         super().__init__(screen)
         
         # Load font
         try:
-            self.title_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 40)
-            self.text_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 16)
-            self.hint_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 20)
+            self.title_font = load_font('assets/fonts/upheaval.ttf', 40)
+            self.text_font = load_font('assets/fonts/upheaval.ttf', 16)
+            self.hint_font = load_font('assets/fonts/upheaval.ttf', 20)
         except:
             print("Warning: Could not load upheaval.ttf, using default font")
             self.title_font = pygame.font.Font(None, 40)
@@ -196,9 +267,13 @@ class StoryScreen(MenuState):
             "Evite os crocodilos!",
             "Voce tem 3 vidas - use com sabedoria",
         ]
+
+        # Hint to continue
+        self.hint = self.hint_font.render("Pressione ENTER ou ESPACO para comecar!", True, YELLOW)
+        self.hint_rect = self.hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
         
         # Animation
-        self.blink_timer = 0
+        self.blink_timer = pygame.time.get_ticks()
         self.show_hint = True
     
     def handle_events(self, events):
@@ -212,25 +287,24 @@ class StoryScreen(MenuState):
     
     def update(self):
         """Update animations"""
-        self.blink_timer += 1
-        if self.blink_timer >= 30:
-            self.blink_timer = 0
-            self.show_hint = not self.show_hint
+        self.show_hint = self._update_blink(self.show_hint)
     
-    def draw(self):
-        """Draw story and instructions"""
+    def build_static_layer(self):
+        """Compose the gradient, story and instructions"""
+        layer = super().build_static_layer()
+
         # Gradient background (river themed)
         for y in range(SCREEN_HEIGHT):
             color_factor = y / SCREEN_HEIGHT
             r = int(30 + (60 - 30) * color_factor)
             g = int(120 + (160 - 120) * color_factor)
             b = int(180 + (220 - 180) * color_factor)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(layer, (r, g, b), (0, y), (SCREEN_WIDTH, y))
         
         # Title
         title = self.title_font.render("CROCOLIXO", True, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        self.screen.blit(title, title_rect)
+        layer.blit(title, title_rect)
         
         # Story section
         y_offset = 100
@@ -240,12 +314,12 @@ class StoryScreen(MenuState):
                 continue
             text = self.text_font.render(line, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
             y_offset += 25
         
         # Separator
         y_offset += 20
-        pygame.draw.line(self.screen, YELLOW, 
+        pygame.draw.line(layer, YELLOW, 
                         (SCREEN_WIDTH // 4, y_offset), 
                         (3 * SCREEN_WIDTH // 4, y_offset), 3)
         y_offset += 30
@@ -260,27 +334,29 @@ class StoryScreen(MenuState):
             color = YELLOW if "CONTROLES" in line else WHITE
             text = self.text_font.render(line, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            layer.blit(text, text_rect)
             y_offset += 25
         
-        # Hint to continue
+        return layer
+
+    def draw_dynamic(self):
+        """Draw the blinking hint"""
         if self.show_hint:
-            hint_text = "Pressione ENTER ou ESPACO para comecar!"
-            hint = self.hint_font.render(hint_text, True, YELLOW)
-            hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
-            self.screen.blit(hint, hint_rect)
+            self.screen.blit(self.hint, self.hint_rect)
 
 
 class GameOverScreen(MenuState):
     """Game Over screen with restart option"""
+    BLINK_INTERVAL = 333  # milliseconds
+
     def __init__(self, screen):
         super().__init__(screen)
         
         # Load font
         try:
-            self.title_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 64)
-            self.menu_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 32)
-            self.hint_font = pygame.font.Font(resource_path('assets/fonts/upheaval.ttf'), 24)
+            self.title_font = load_font('assets/fonts/upheaval.ttf', 64)
+            self.menu_font = load_font('assets/fonts/upheaval.ttf', 32)
+            self.hint_font = load_font('assets/fonts/upheaval.ttf', 24)
         except:
             print("Warning: Could not load upheaval.ttf, using default font")
             self.title_font = pygame.font.Font(None, 64)
@@ -290,15 +366,21 @@ class GameOverScreen(MenuState):
         # Menu options
         self.selected_option = 0
         self.options = ["JOGAR NOVAMENTE", "MENU PRINCIPAL"]
+        self.option_surfaces = render_options(self.menu_font, self.options)
+
+        # Game Over title (blinking)
+        self.title = self.title_font.render("GAME OVER", True, RED)
+        self.title_rect = self.title.get_rect(center=(SCREEN_WIDTH // 2, 100))
         
         # Animation
-        self.blink_timer = 0
+        self.blink_timer = pygame.time.get_ticks()
         self.show_title = True
         self.final_score = 0
     
     def set_score(self, score):
         """Set the final score to display"""
         self.final_score = score
+        self.invalidate()  # Score is part of the static layer
     
     def handle_events(self, events):
         """Handle input events"""
@@ -311,70 +393,95 @@ class GameOverScreen(MenuState):
                         self.next_state = "start"
                 elif event.key == pygame.K_UP:
                     self.selected_option = (self.selected_option - 1) % len(self.options)
+                    self.dirty = True
                 elif event.key == pygame.K_DOWN:
                     self.selected_option = (self.selected_option + 1) % len(self.options)
+                    self.dirty = True
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Click to restart
                 self.next_state = "restart"
     
     def update(self):
         """Update animations"""
-        self.blink_timer += 1
-        if self.blink_timer >= 20:  # Blink every 20 frames
-            self.blink_timer = 0
-            self.show_title = not self.show_title
+        self.show_title = self._update_blink(self.show_title)
     
-    def draw(self):
-        """Draw game over screen"""
+    def build_static_layer(self):
+        """Compose the background, final score and hint"""
+        layer = super().build_static_layer()
+
         # Dark red background
-        self.screen.fill((80, 20, 20))
-        
-        # Game Over title (blinking)
-        if self.show_title:
-            title = self.title_font.render("GAME OVER", True, RED)
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-            self.screen.blit(title, title_rect)
+        layer.fill((80, 20, 20))
         
         # Score
         score_text = self.hint_font.render(f"Pontuacao Final: {self.final_score}", True, YELLOW)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(score_text, score_rect)
-        
-        # Menu options
-        menu_y_start = 300
-        for i, option in enumerate(self.options):
-            color = YELLOW if i == self.selected_option else WHITE
-            text = self.menu_font.render(option, True, color)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, menu_y_start + i * 60))
-            self.screen.blit(text, text_rect)
+        layer.blit(score_text, score_rect)
         
         # Hint at the bottom
         hint_text = "Use setas para navegar - ENTER para selecionar"
         hint = self.hint_font.render(hint_text, True, WHITE)
         hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        self.screen.blit(hint, hint_rect)
+        layer.blit(hint, hint_rect)
+        return layer
+
+    def draw_dynamic(self):
+        """Draw the blinking title and the menu options"""
+        # Game Over title (blinking)
+        if self.show_title:
+            self.screen.blit(self.title, self.title_rect)
+        
+        # Menu options
+        menu_y_start = 300
+        for i, (normal, selected) in enumerate(self.option_surfaces):
+            text = selected if i == self.selected_option else normal
+            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, menu_y_start + i * 60))
+            self.screen.blit(text, text_rect)
 
 
 class MenuManager:
     """Manages menu states and transitions"""
+
+    # Menu states, built the first time they are shown
+    STATE_CLASSES = {
+        "start": StartScreen,
+        "credits": CreditsScreen,
+        "story": StoryScreen,
+        "gameover": GameOverScreen,
+    }
+
     def __init__(self, screen):
         self.screen = screen
         self.current_state = None
-        self.states = {
-            "start": StartScreen(screen),
-            "credits": CreditsScreen(screen),
-            "story": StoryScreen(screen),
-            "gameover": GameOverScreen(screen),
-        }
+        self.current_state_name = None
+        self.states = {}
         self.set_state("start")
         self.start_game = False
         self.restart_game = False
+
+    def get_state(self, state_name):
+        """
+        Get a menu state, building it on first use
+
+        Args:
+            state_name (str): Key in STATE_CLASSES
+
+        Returns:
+            MenuState: The menu state
+        """
+        state = self.states.get(state_name)
+        if state is None:
+            with timeline.span(f"menu state '{state_name}'"):
+                state = self.STATE_CLASSES[state_name](self.screen)
+            self.states[state_name] = state
+        return state
     
     def set_state(self, state_name):
         """Change to a different menu state"""
-        if state_name in self.states:
-            self.current_state = self.states[state_name]
+        if state_name in self.STATE_CLASSES:
+            self.current_state = self.get_state(state_name)
+            self.current_state_name = state_name
             self.current_state.next_state = None
+            self.current_state.dirty = True
         elif state_name == "game":
             self.start_game = True
         elif state_name == "restart":
@@ -382,7 +489,7 @@ class MenuManager:
     
     def set_game_over(self, score):
         """Show game over screen with final score"""
-        self.states["gameover"].set_score(score)
+        self.get_state("gameover").set_score(score)
         self.set_state("gameover")
     
     def handle_events(self, events):
@@ -400,6 +507,10 @@ class MenuManager:
     def draw(self):
         """Draw current state"""
         self.current_state.draw()
+
+    def needs_redraw(self):
+        """Check if the current state has visible changes to draw"""
+        return self.current_state.dirty
     
     def should_start_game(self):
         """Check if player wants to start the game"""
@@ -0,0 +1,252 @@
+"""
+Session metrics - counters, gauges and histograms with JSONL export
+
+Hot paths report into the shared registry (`metrics`) through metric
+objects fetched once at import time, so reporting costs an attribute
+update. When enabled, MetricsExporter appends a snapshot of every
+metric to one JSONL file per session from a background thread.
+
+Each exported line holds:
+    counters    totals since the session started
+    gauges      last value set
+    histograms  observations since the previous line (count, sum, min,
+                max and bucket counts), so every line describes one
+                flush interval
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from config import *
+
+# Default histogram buckets (upper bounds)
+TIME_MS_BUCKETS = (1, 2, 4, 8, 12, 16.7, 25, 33.3, 50, 100)
+COUNT_BUCKETS = (5, 10, 20, 40, 80, 160)
+
+
+class Counter:
+    """Monotonically increasing total"""
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        """
+        Add to the counter
+
+        Args:
+            amount (int): Amount to add
+        """
+        self.value += amount
+
+
+class Gauge:
+    """Last reported value of a quantity"""
+
+    def __init__(self):
+        self.value = None
+
+    def set(self, value):
+        """
+        Set the current value
+
+        Args:
+            value (float): New value
+        """
+        self.value = value
+
+
+class Histogram:
+    """Distribution of observed values over one flush interval"""
+
+    def __init__(self, buckets=TIME_MS_BUCKETS):
+        """
+        Args:
+            buckets (tuple): Ascending bucket upper bounds; values above the
+                             last bound go to an overflow bucket
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        """Start a new interval"""
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value):
+        """
+        Record one observation
+
+        Args:
+            value (float): Observed value
+        """
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.bucket_counts[index] += 1
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def take_snapshot(self):
+        """
+        Get the observations of the current interval and start a new one
+
+        Returns:
+            dict: count, sum, min, max and per-bucket counts
+        """
+        with self._lock:
+            labels = [f"<={bound}" for bound in self.buckets] + [f">{self.buckets[-1]}"]
+            snapshot = {
+                "count": self.count,
+                "sum": round(self.total, 3),
+                "min": None if self.min is None else round(self.min, 3),
+                "max": None if self.max is None else round(self.max, 3),
+                "buckets": dict(zip(labels, self.bucket_counts)),
+            }
+            self._clear()
+        return snapshot
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def counter(self, name):
+        """
+        Get (or create) a counter
+
+        Args:
+            name (str): Metric name, e.g. 'trash.caught'
+
+        Returns:
+            Counter: The counter registered under name
+        """
+        with self._lock:
+            return self.counters.setdefault(name, Counter())
+
+    def gauge(self, name):
+        """
+        Get (or create) a gauge
+
+        Args:
+            name (str): Metric name
+
+        Returns:
+            Gauge: The gauge registered under name
+        """
+        with self._lock:
+            return self.gauges.setdefault(name, Gauge())
+
+    def histogram(self, name, buckets=TIME_MS_BUCKETS):
+        """
+        Get (or create) a histogram
+
+        Args:
+            name (str): Metric name
+            buckets (tuple): Bucket upper bounds (used when creating)
+
+        Returns:
+            Histogram: The histogram registered under name
+        """
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram(buckets)
+            return self.histograms[name]
+
+    def take_snapshot(self):
+        """
+        Get the value of every metric (starts a new histogram interval)
+
+        Returns:
+            dict: Counters, gauges and histograms by name
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            histograms = dict(self.histograms)
+
+        return {
+            "counters": {name: counter.value for name, counter in counters.items()},
+            "gauges": {name: gauge.value for name, gauge in gauges.items()},
+            "histograms": {name: histogram.take_snapshot() for name, histogram in histograms.items()},
+        }
+
+
+# Registry shared by the whole game
+metrics = MetricsRegistry()
+
+
+class MetricsExporter:
+    """Appends registry snapshots to a per-session JSONL file from a background thread"""
+
+    def __init__(self, registry=metrics, directory=METRICS_DIR, interval=METRICS_FLUSH_INTERVAL):
+        """
+        Args:
+            registry (MetricsRegistry): Registry to export
+            directory (str): Directory for the session files
+            interval (float): Seconds between snapshots
+        """
+        self.registry = registry
+        self.interval = interval
+        self.session_id = datetime.now().strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+        self.path = os.path.join(directory, f"session-{self.session_id}.jsonl")
+        self._directory = directory
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._file = None
+        self._start_time = None
+
+    def start(self):
+        """Open the session file and start the flush thread"""
+        os.makedirs(self._directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        print(f"[METRICS] Writing session metrics to {self.path}")
+
+    def _run(self):
+        """Flush loop (background thread)"""
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        """Append one snapshot line to the session file"""
+        record = {
+            "session": self.session_id,
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "elapsed_s": round(time.perf_counter() - self._start_time, 3),
+        }
+        record.update(self.registry.take_snapshot())
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def stop(self):
+        """Stop the flush thread and write a final snapshot"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+        self._file.close()
+        print(f"[METRICS] Session metrics saved to {self.path}")
@@ -0,0 +1,173 @@
+"""
+Frame pacing - wait for the next frame's target present time
+
+pygame.time.Clock.tick() sleeps with SDL_Delay, which can overshoot by a
+few milliseconds and makes frame-to-frame timing uneven. FramePacer
+sleeps coarsely until shortly before the target time and spin-waits the
+rest, then records how far each frame landed from its target.
+"""
+import time
+from config import *
+
+
+# Upper bounds (ms) of the jitter histogram buckets; the last bucket is open
+JITTER_BUCKETS = (0.25, 0.5, 1, 2, 4, 8)
+
+
+def _bucket_label(index):
+    """Label of a jitter histogram bucket"""
+    if index == len(JITTER_BUCKETS):
+        return f">{JITTER_BUCKETS[-1]}ms"
+    return f"<={JITTER_BUCKETS[index]}ms"
+
+
+class FramePacer:
+    """
+    Paces frames to fixed target present times.
+
+    Targets advance by exactly one frame period from the previous target
+    (not from when the frame finished), so small overruns are absorbed by
+    the following frames. A frame that is more than a whole period late
+    counts as a missed deadline and the schedule restarts from now.
+
+    In vsync mode the blocking present already aligns frames to the
+    display, so the pacer never spins; it only sleeps when the requested
+    rate is below the refresh rate (e.g. idle menus).
+    """
+
+    def __init__(self, spin_ms=PACER_SPIN_MS, vsync=False, refresh_rate=DISPLAY_REFRESH_RATE):
+        """
+        Initialize the pacer
+
+        Args:
+            spin_ms (float): Time before the target spent spin-waiting
+                             instead of sleeping
+            vsync (bool): Presentation is synchronized to the display refresh
+            refresh_rate (float): Display refresh rate in Hz (used with vsync)
+        """
+        self.spin_ms = spin_ms
+        self.vsync = vsync
+        self.refresh_rate = refresh_rate
+        self.reset()
+
+    def reset(self):
+        """Start a new schedule from now and clear the statistics"""
+        self.resync()
+
+        self.frame_count = 0
+        self.missed_deadlines = 0
+        self.jitter_histogram = [0] * (len(JITTER_BUCKETS) + 1)
+        self.max_jitter_ms = 0.0
+        self._jitter_total_ms = 0.0
+
+    def resync(self):
+        """Start a new schedule from now, keeping the statistics (e.g. after a pause)"""
+        self._last_tick = time.perf_counter()
+        self._deadline = None
+        self._period = None
+
+    def tick(self, fps=0):
+        """
+        Wait until the next frame should be presented
+
+        Args:
+            fps (float): Target frame rate (0 = don't wait)
+
+        Returns:
+            float: Milliseconds since the previous tick
+        """
+        now = time.perf_counter()
+
+        if fps > 0 and self.vsync and fps >= self.refresh_rate:
+            # The blocking present already holds frames to the refresh rate:
+            # don't wait, only estimate the next present for time_until_next_frame()
+            self._deadline = now + 1.0 / self.refresh_rate
+            self._period = None
+        elif fps > 0:
+            period = 1.0 / fps
+            if self._deadline is None or period != self._period or self.vsync:
+                # New schedule (first frame, rate change, or vsync-aligned)
+                self._deadline = self._last_tick + period
+                self._period = period
+
+            if now - self._deadline > period:
+                # A whole frame late: drop it and restart the schedule
+                self.missed_deadlines += 1
+                self._deadline = now
+            else:
+                self._wait_until(self._deadline)
+                now = time.perf_counter()
+                self._record_jitter((now - self._deadline) * 1000)
+
+            self._deadline += period
+        else:
+            self._deadline = None
+
+        elapsed_ms = (now - self._last_tick) * 1000
+        self._last_tick = now
+        self.frame_count += 1
+        return elapsed_ms
+
+    def time_until_next_frame(self):
+        """
+        Get the time left before the next frame is due
+
+        Returns:
+            float: Seconds until the next target present time (0 when
+                   uncapped or already late)
+        """
+        if self._deadline is None:
+            return 0.0
+        return max(0.0, self._deadline - time.perf_counter())
+
+    def _wait_until(self, deadline):
+        """
+        Sleep coarsely, then spin until the deadline
+
+        Args:
+            deadline (float): Target time (time.perf_counter() seconds)
+        """
+        spin = 0.0 if self.vsync else self.spin_ms / 1000
+        remaining = deadline - time.perf_counter()
+        if remaining > spin:
+            time.sleep(remaining - spin)
+        if self.vsync:
+            return
+        while time.perf_counter() < deadline:
+            pass
+
+    def _record_jitter(self, jitter_ms):
+        """
+        Add a frame's distance from its target to the histogram
+
+        Args:
+            jitter_ms (float): How late (positive) the frame woke up
+        """
+        jitter_ms = abs(jitter_ms)
+        for index, bound in enumerate(JITTER_BUCKETS):
+            if jitter_ms <= bound:
+                break
+        else:
+            index = len(JITTER_BUCKETS)
+        self.jitter_histogram[index] += 1
+        self.max_jitter_ms = max(self.max_jitter_ms, jitter_ms)
+        self._jitter_total_ms += jitter_ms
+
+    def get_stats(self):
+        """
+        Get pacing statistics since the last reset
+
+        Returns:
+            dict: Frame count, missed deadlines, jitter histogram and
+                  mean/max jitter in milliseconds
+        """
+        paced_frames = sum(self.jitter_histogram)
+        return {
+            "frames": self.frame_count,
+            "missed_deadlines": self.missed_deadlines,
+            "mean_jitter_ms": round(self._jitter_total_ms / paced_frames, 3) if paced_frames else 0.0,
+            "max_jitter_ms": round(self.max_jitter_ms, 3),
+            "jitter_histogram": {
+                _bucket_label(index): count for index, count in enumerate(self.jitter_histogram)
+            },
+        }
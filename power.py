@@ -0,0 +1,132 @@
+"""
+Power scheduler - stop working while the window can't be seen or used
+
+While the window is minimized, hidden or (optionally) unfocused, the
+game pauses and the loops block in pygame.event.wait() instead of
+simulating and presenting frames, so an unattended game uses almost no
+CPU.
+"""
+import pygame
+from config import *
+
+# ACTIVEEVENT state bits (SDL 1.2 compatibility events)
+_APP_INPUT_FOCUS = 2
+_APP_ACTIVE = 4
+
+
+class PowerScheduler:
+    """
+    Tracks window focus and visibility from window events.
+
+    Feed every event to handle_event(); while is_active() is False the
+    caller should skip simulation and rendering and get its events from
+    idle_wait() instead.
+    """
+
+    def __init__(self, pause_on_focus_lost=PAUSE_ON_FOCUS_LOST, idle_timeout_ms=POWER_IDLE_TIMEOUT_MS):
+        """
+        Initialize the scheduler
+
+        Args:
+            pause_on_focus_lost (bool): Also pause when the window loses
+                                        focus (not only when minimized)
+            idle_timeout_ms (int): Longest single wait while inactive
+        """
+        self.pause_on_focus_lost = pause_on_focus_lost
+        self.idle_timeout_ms = idle_timeout_ms
+        self.focused = True
+        self.visible = True
+        self.exposed = False  # Window contents need to be shown again
+
+        # Statistics
+        self.pause_count = 0
+        self.idle_wakeups = 0
+
+    @staticmethod
+    def set_audio_paused(paused):
+        """
+        Pause or resume every playing sound
+
+        Args:
+            paused (bool): True to pause, False to resume
+        """
+        if not pygame.mixer.get_init():
+            return
+        if paused:
+            pygame.mixer.pause()
+        else:
+            pygame.mixer.unpause()
+
+    def is_active(self):
+        """
+        Check if the game should simulate and render
+
+        Returns:
+            bool: False while minimized/hidden (or unfocused, if enabled)
+        """
+        if not self.visible:
+            return False
+        return self.focused or not self.pause_on_focus_lost
+
+    def handle_event(self, event):
+        """
+        Update focus and visibility from a window event
+
+        Args:
+            event (pygame.event.Event): Any event; non-window events are ignored
+
+        Returns:
+            bool: True if the event changed whether the game is active
+        """
+        was_active = self.is_active()
+
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.visible = False
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            self.visible = True
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.exposed = True
+        elif event.type == pygame.ACTIVEEVENT:
+            if event.state & _APP_INPUT_FOCUS:
+                self.focused = bool(event.gain)
+            if event.state & _APP_ACTIVE:
+                self.visible = bool(event.gain)
+
+        active = self.is_active()
+        if active == was_active:
+            return False
+
+        if active:
+            print("[POWER] Window active again - resuming")
+        else:
+            self.pause_count += 1
+            print(f"[POWER] Window inactive (focused: {self.focused}, visible: {self.visible}) - pausing")
+        return True
+
+    def idle_wait(self):
+        """
+        Block until an event arrives or the idle timeout expires
+
+        Returns:
+            list: Events received (to be handled like pygame.event.get())
+        """
+        event = pygame.event.wait(self.idle_timeout_ms)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        self.idle_wakeups += 1
+        return events
+
+    def take_exposed(self):
+        """
+        Check (and clear) whether the window must be redrawn while paused
+
+        Returns:
+            bool: True if the window was exposed since the last call
+        """
+        exposed = self.exposed
+        self.exposed = False
+        return exposed
@@ -0,0 +1,324 @@
+"""
+Profiling - flamegraphs of a session, split by game phase
+
+Two profilers are available (main.py --profile):
+- sample:   a background thread captures the main thread's stack about
+            every PROFILE_SAMPLE_INTERVAL seconds (~1 kHz). Low overhead,
+            covers the whole session.
+- cprofile: cProfile over a window of N frames starting at the first
+            gameplay frame. Exact call counts, but cProfile only records
+            caller -> callee pairs, so its stacks are two levels deep.
+
+Every stack is prefixed with the game phase it was recorded in (menu,
+gameplay, wave, game_over), reported by the loops through set_phase().
+Results are written as collapsed stacks (<out>.folded, one
+"phase;frame;frame weight" line per stack) and as a speedscope profile
+(<out>.speedscope.json) with one profile per phase; both open in
+https://www.speedscope.app.
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from config import *
+
+PHASES = ("startup", "menu", "gameplay", "wave", "game_over")
+
+# Profiler of the current session (None when not profiling)
+_active_profiler = None
+
+
+def _frame_label(name, filename, lineno):
+    """
+    Format a stack frame label
+
+    Args:
+        name (str): Function name
+        filename (str): Source file
+        lineno (int): First line of the function
+
+    Returns:
+        str: Label such as 'update (game.py:210)'
+    """
+    if filename == "~":
+        return name  # Built-in function (cProfile)
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling the main thread's stack from a background thread"""
+
+    unit = "none"  # Weights are sample counts
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        """
+        Args:
+            interval (float): Seconds between samples
+        """
+        self.interval = interval
+        self.phase = "startup"
+        self.stacks = Counter()  # (phase, frame labels...) -> samples
+        self._labels = {}  # code object -> frame label
+        self._main_thread_id = threading.main_thread().ident
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self):
+        """Start sampling"""
+        self._thread.start()
+
+    def set_phase(self, phase):
+        """Set the phase that new samples are attributed to"""
+        self.phase = phase
+
+    def frame_done(self):
+        """Called after every presented frame (unused by the sampler)"""
+
+    def _label(self, code):
+        """Get (and cache) the label of a code object"""
+        label = self._labels.get(code)
+        if label is None:
+            label = _frame_label(code.co_name, code.co_filename, code.co_firstlineno)
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        """Sampling loop (background thread)"""
+        current_frames = sys._current_frames
+        while not self._stop_event.wait(self.interval):
+            frame = current_frames().get(self._main_thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            stack.append(self.phase)
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+
+    def stop(self):
+        """
+        Stop sampling
+
+        Returns:
+            Counter: Samples per (phase, frames...) stack
+        """
+        self._stop_event.set()
+        self._thread.join()
+        return self.stacks
+
+
+class CProfileWindow:
+    """
+    cProfile over a window of frames, with one profile per game phase.
+
+    Switching phase switches the running cProfile.Profile, so every call
+    is attributed to the phase it happened in.
+    """
+
+    unit = "microseconds"
+
+    def __init__(self, frames=PROFILE_FRAMES):
+        """
+        Args:
+            frames (int): Number of frames to profile, starting at the
+                          first gameplay frame
+        """
+        self.frames = frames
+        self.phase = "startup"
+        self.frames_profiled = 0
+        self._profiles = {}
+        self._running = None  # Profile currently enabled
+        self._window_open = False
+        self._window_done = False
+
+    def start(self):
+        """Wait for the first gameplay frame to open the window"""
+
+    def _switch_to(self, phase):
+        """Enable the profile of a phase (disabling the previous one)"""
+        if self._running is not None:
+            self._running.disable()
+        self._running = self._profiles.setdefault(phase, cProfile.Profile())
+        self._running.enable()
+
+    def set_phase(self, phase):
+        """Set the phase that new calls are attributed to"""
+        if phase == self.phase:
+            return
+        self.phase = phase
+        if not self._window_open and not self._window_done and phase in ("gameplay", "wave"):
+            self._window_open = True
+            print(f"[PROFILE] cProfile window started ({self.frames} frames)")
+        if self._window_open:
+            self._switch_to(phase)
+
+    def frame_done(self):
+        """Count a presented frame and close the window after the last one"""
+        if not self._window_open:
+            return
+        self.frames_profiled += 1
+        if self.frames_profiled >= self.frames:
+            self._close_window()
+
+    def _close_window(self):
+        """Stop profiling"""
+        if self._running is not None:
+            self._running.disable()
+            self._running = None
+        self._window_open = False
+        self._window_done = True
+        print(f"[PROFILE] cProfile window finished after {self.frames_profiled} frames")
+
+    def stop(self):
+        """
+        Stop profiling and convert the results to stacks
+
+        Returns:
+            Counter: Inline time (microseconds) per (phase, caller, callee)
+                     stack, or (phase, function) for functions without a
+                     recorded caller
+        """
+        if self._window_open:
+            self._close_window()
+
+        stacks = Counter()
+        for phase, profile in self._profiles.items():
+            stats = pstats.Stats(profile).stats
+            for (filename, lineno, name), (_, _, inline_time, _, callers) in stats.items():
+                callee = _frame_label(name, filename, lineno)
+                if not callers:
+                    stacks[(phase, callee)] += round(inline_time * 1e6)
+                    continue
+                for (caller_file, caller_line, caller_name), edge in callers.items():
+                    caller = _frame_label(caller_name, caller_file, caller_line)
+                    stacks[(phase, caller, callee)] += round(edge[2] * 1e6)
+        return Counter({stack: weight for stack, weight in stacks.items() if weight > 0})
+
+
+PROFILERS = {
+    "sample": SamplingProfiler,
+    "cprofile": CProfileWindow,
+}
+
+
+def write_collapsed(stacks, path):
+    """
+    Write stacks in collapsed ("folded") format
+
+    Args:
+        stacks (Counter): Weight per stack tuple
+        path (str): Output file
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, weight in sorted(stacks.items()):
+            f.write(";".join(frame.replace(";", ":") for frame in stack) + f" {weight}\n")
+
+
+def write_speedscope(stacks, path, unit, name="Crocolixo"):
+    """
+    Write stacks as a speedscope file with one sampled profile per phase
+
+    Args:
+        stacks (Counter): Weight per stack tuple (first element is the phase)
+        path (str): Output file
+        unit (str): Weight unit ('none', 'microseconds', ...)
+        name (str): Profile name shown by speedscope
+    """
+    frames = []
+    frame_index = {}
+    profiles = {}
+
+    for stack, weight in sorted(stacks.items()):
+        phase, calls = stack[0], stack[1:]
+        indices = []
+        for label in calls:
+            if label not in frame_index:
+                frame_index[label] = len(frames)
+                frames.append({"name": label})
+            indices.append(frame_index[label])
+        profile = profiles.setdefault(phase, {"samples": [], "weights": []})
+        profile["samples"].append(indices)
+        profile["weights"].append(weight)
+
+    document = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "crocolixo-profiling",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": phase,
+                "unit": unit,
+                "startValue": 0,
+                "endValue": sum(profile["weights"]),
+                "samples": profile["samples"],
+                "weights": profile["weights"],
+            }
+            for phase, profile in sorted(profiles.items(), key=lambda item: PHASES.index(item[0])
+                                         if item[0] in PHASES else len(PHASES))
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f)
+
+
+def start_profiler(kind, frames=PROFILE_FRAMES):
+    """
+    Start profiling the session
+
+    Args:
+        kind (str): 'sample' or 'cprofile'
+        frames (int): Window size for cProfile
+
+    Returns:
+        SamplingProfiler or CProfileWindow: The active profiler
+    """
+    global _active_profiler
+    if kind == "cprofile":
+        _active_profiler = CProfileWindow(frames)
+    else:
+        _active_profiler = SamplingProfiler()
+    _active_profiler.start()
+    print(f"[PROFILE] Profiling with '{kind}'")
+    return _active_profiler
+
+
+def stop_profiler(output=PROFILE_OUTPUT):
+    """
+    Stop the active profiler and write its results
+
+    Args:
+        output (str): Output path without extension
+    """
+    global _active_profiler
+    if _active_profiler is None:
+        return
+    profiler, _active_profiler = _active_profiler, None
+    stacks = profiler.stop()
+
+    write_collapsed(stacks, output + ".folded")
+    write_speedscope(stacks, output + ".speedscope.json", profiler.unit)
+    print(f"[PROFILE] Wrote {len(stacks)} stacks to {output}.folded and {output}.speedscope.json")
+
+
+def set_phase(phase):
+    """
+    Report the current game phase (no-op when not profiling)
+
+    Args:
+        phase (str): One of PHASES
+    """
+    if _active_profiler is not None:
+        _active_profiler.set_phase(phase)
+
+
+def frame_done():
+    """Report that a frame was presented (no-op when not profiling)"""
+    if _active_profiler is not None:
+        _active_profiler.frame_done()
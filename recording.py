@@ -0,0 +1,390 @@
+"""
+Frame recording - capture presented frames and write them in the background
+
+The game thread only copies the finished canvas into a buffer taken from
+a preallocated pool (one memcpy of the surface's pixel buffer, no
+allocation) and hands it to a writer thread through a bounded queue.
+When the writer falls behind and the queue is full the frame is dropped
+and counted instead of stalling the game. Everything else (delta
+encoding, compression, PNG encoding, disk I/O) happens on the writer
+thread; zlib and numpy release the GIL while they work.
+
+Two formats are available (main.py --record):
+- raw: one clip file per session. Every RECORD_KEYFRAME_INTERVAL-th frame
+  is stored whole; the others as the XOR with the previous frame, which
+  is mostly zeros and compresses very well. zlib-compressed.
+- png: a PNG per frame in a directory. Frames identical to the previous
+  one are not written again; frames.csv maps every frame to its file.
+
+Raw clip layout:
+    header  magic (4 bytes) + version (uint16) + width, height (uint16)
+            + pitch (uint32) + bytes per pixel (uint8) + RGBA masks (4 x uint32)
+    frames  flags (uint8, 1 = key frame) + frame index (uint32)
+            + capture time in ms (float64) + payload size (uint32)
+            + zlib payload (pixels, or XOR with the previous frame)
+
+Convert a raw clip to PNG files with:
+    python recording.py recordings/<clip>.crec <output dir>
+"""
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+import pygame
+from config import *
+from metrics import metrics
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # XOR falls back to Python integers (slower, holds the GIL)
+
+_capture_time = metrics.histogram("record.capture_ms", (0.1, 0.25, 0.5, 1, 2, 4))
+_frames_recorded = metrics.counter("record.frames")
+_frames_dropped = metrics.counter("record.dropped")
+
+CLIP_MAGIC = b"CRRC"
+CLIP_VERSION = 1
+_CLIP_HEADER = struct.Struct("<4sHHHIB4I")
+_FRAME_HEADER = struct.Struct("<BIdI")
+_KEY_FRAME = 1
+
+
+def _xor_into(out, a, b):
+    """
+    XOR two equally sized buffers into a third
+
+    Args:
+        out (bytearray): Destination
+        a: First buffer
+        b: Second buffer
+    """
+    if np is not None:
+        np.bitwise_xor(np.frombuffer(a, np.uint8), np.frombuffer(b, np.uint8), out=np.frombuffer(out, np.uint8))
+    else:
+        out[:] = (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(out), "little")
+
+
+class FrameLayout:
+    """Size and pixel format of the recorded frames"""
+
+    def __init__(self, width, height, pitch, bytesize, masks):
+        """
+        Args:
+            width (int): Frame width in pixels
+            height (int): Frame height in pixels
+            pitch (int): Bytes per row
+            bytesize (int): Bytes per pixel
+            masks (tuple): (R, G, B, A) channel masks
+        """
+        self.width = width
+        self.height = height
+        self.pitch = pitch
+        self.bytesize = bytesize
+        self.masks = tuple(masks)
+        self.frame_size = pitch * height
+
+    @classmethod
+    def of_surface(cls, surface):
+        """Get the layout of a surface's pixel buffer"""
+        width, height = surface.get_size()
+        return cls(width, height, surface.get_pitch(), surface.get_bytesize(), surface.get_masks())
+
+    def to_surface(self, pixels):
+        """
+        Build a surface from a frame's pixels
+
+        Args:
+            pixels: Frame pixel buffer (frame_size bytes)
+
+        Returns:
+            pygame.Surface: Copy of the frame
+        """
+        surface = pygame.Surface((self.width, self.height), 0, self.bytesize * 8, self.masks)
+        if surface.get_pitch() == self.pitch:
+            surface.get_buffer().write(bytes(pixels))
+        else:
+            row = self.width * self.bytesize
+            pixels = memoryview(pixels)
+            for y in range(self.height):
+                start = y * self.pitch
+                surface.get_buffer().write(bytes(pixels[start:start + row]), y * surface.get_pitch())
+        return surface
+
+
+class RawClipWriter:
+    """Writes frames to a single delta-compressed clip file"""
+
+    extension = ".crec"
+
+    def __init__(self, path, layout, keyframe_interval=RECORD_KEYFRAME_INTERVAL, compression=RECORD_COMPRESSION):
+        """
+        Args:
+            path (str): Clip file
+            layout (FrameLayout): Frame size and pixel format
+            keyframe_interval (int): Frames between whole (key) frames
+            compression (int): zlib level (1 = fastest)
+        """
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.compression = compression
+        self._file = open(path, "wb")
+        self._file.write(_CLIP_HEADER.pack(CLIP_MAGIC, CLIP_VERSION, layout.width, layout.height,
+                                           layout.pitch, layout.bytesize, *layout.masks))
+        self._previous = bytearray(layout.frame_size)
+        self._delta = bytearray(layout.frame_size)
+        self._frames_since_key = None
+        self.bytes_written = _CLIP_HEADER.size
+
+    def write(self, pixels, index, time_ms):
+        """
+        Append a frame
+
+        Args:
+            pixels (bytearray): Frame pixels
+            index (int): Frame number
+            time_ms (float): Capture time since recording started
+
+        Returns:
+            bytearray: A buffer the caller can reuse (the frame is kept
+                       as the reference for the next delta)
+        """
+        if self._frames_since_key is None or self._frames_since_key >= self.keyframe_interval:
+            flags = _KEY_FRAME
+            payload = zlib.compress(pixels, self.compression)
+            self._frames_since_key = 0
+        else:
+            flags = 0
+            _xor_into(self._delta, pixels, self._previous)
+            payload = zlib.compress(self._delta, self.compression)
+        self._frames_since_key += 1
+
+        self._file.write(_FRAME_HEADER.pack(flags, index, time_ms, len(payload)))
+        self._file.write(payload)
+        self.bytes_written += _FRAME_HEADER.size + len(payload)
+
+        released, self._previous = self._previous, pixels
+        return released
+
+    def close(self):
+        """Finish the clip"""
+        self._file.close()
+
+
+class PngSequenceWriter:
+    """Writes frames as numbered PNG files, skipping repeated frames"""
+
+    extension = ""
+
+    def __init__(self, path, layout):
+        """
+        Args:
+            path (str): Output directory (created)
+            layout (FrameLayout): Frame size and pixel format
+        """
+        self.path = path
+        self.layout = layout
+        os.makedirs(path, exist_ok=True)
+        self._index_file = open(os.path.join(path, "frames.csv"), "w", encoding="utf-8")
+        self._index_file.write("frame,time_ms,file\n")
+        self._previous = bytearray(layout.frame_size)
+        self._previous_name = None
+        self.bytes_written = 0
+
+    def write(self, pixels, index, time_ms):
+        """
+        Write a frame (or point to the previous file when unchanged)
+
+        Args:
+            pixels (bytearray): Frame pixels
+            index (int): Frame number
+            time_ms (float): Capture time since recording started
+
+        Returns:
+            bytearray: A buffer the caller can reuse
+        """
+        self._index_file.write(f"{index},{time_ms:.3f},")
+        if self._previous_name is not None and pixels == self._previous:
+            self._index_file.write(self._previous_name + "\n")
+            return pixels
+
+        self._previous_name = f"frame_{index:06d}.png"
+        frame_path = os.path.join(self.path, self._previous_name)
+        pygame.image.save(self.layout.to_surface(pixels), frame_path)
+        self.bytes_written += os.path.getsize(frame_path)
+        self._index_file.write(self._previous_name + "\n")
+
+        released, self._previous = self._previous, pixels
+        return released
+
+    def close(self):
+        """Finish the sequence"""
+        self._index_file.close()
+
+
+RECORD_WRITERS = {
+    "raw": RawClipWriter,
+    "png": PngSequenceWriter,
+}
+
+
+class FrameRecorder:
+    """Captures frames on the game thread and writes them on a background thread"""
+
+    def __init__(self, fmt=RECORD_FORMAT, directory=RECORD_DIR, queue_size=RECORD_QUEUE_SIZE):
+        """
+        Args:
+            fmt (str): 'raw' or 'png'
+            directory (str): Directory for the recordings
+            queue_size (int): Frames waiting for the writer before new ones are dropped
+        """
+        self.format = fmt
+        name = "recording-" + datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.path = os.path.join(directory, name + RECORD_WRITERS[fmt].extension)
+        self._directory = directory
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._queue_size = queue_size
+        self._free = deque()  # Pool of frame buffers (appended/popped from both threads)
+        self._layout = None
+        self._writer = None
+        self._thread = None
+        self._start_time = None
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.max_capture_ms = 0.0
+
+    def _start(self, surface):
+        """Size the buffer pool from the first frame and start the writer thread"""
+        self._layout = FrameLayout.of_surface(surface)
+        # One buffer per queue slot, plus the one being written
+        for _ in range(self._queue_size + 1):
+            self._free.append(bytearray(self._layout.frame_size))
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._writer = RECORD_WRITERS[self.format](self.path, self._layout)
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="frame-writer", daemon=True)
+        self._thread.start()
+        print(f"[RECORD] Recording {self._layout.width}x{self._layout.height} frames to {self.path}")
+
+    def capture(self, surface):
+        """
+        Queue the frame currently on a surface (called before presenting it)
+
+        Args:
+            surface (pygame.Surface): The finished frame (the canvas)
+        """
+        if self._layout is None:
+            self._start(surface)
+        start = time.perf_counter()
+        index = self.frames_captured
+        self.frames_captured += 1
+
+        try:
+            pixels = self._free.pop()
+        except IndexError:
+            self._drop()
+            return
+        pixels[:] = surface.get_buffer()
+
+        try:
+            self._queue.put_nowait((pixels, index, (start - self._start_time) * 1000))
+        except queue.Full:
+            self._free.append(pixels)
+            self._drop()
+            return
+
+        capture_ms = (time.perf_counter() - start) * 1000
+        self.max_capture_ms = max(self.max_capture_ms, capture_ms)
+        _capture_time.observe(capture_ms)
+
+    def _drop(self):
+        """Count a frame the writer had no room for"""
+        self.frames_dropped += 1
+        _frames_dropped.inc()
+
+    def _run(self):
+        """Writer loop (background thread)"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            pixels, index, time_ms = item
+            # Writers keep the frame for the next delta and hand back another buffer
+            self._free.append(self._writer.write(pixels, index, time_ms))
+            _frames_recorded.inc()
+
+    def stop(self):
+        """Write the queued frames and close the recording"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._writer.close()
+        print(f"[RECORD] Saved {self.path}: {self.get_stats()}")
+
+    def get_stats(self):
+        """
+        Get recording statistics
+
+        Returns:
+            dict: Frames captured and dropped, bytes written and the
+                  slowest capture on the game thread in milliseconds
+        """
+        return {
+            "frames": self.frames_captured,
+            "dropped": self.frames_dropped,
+            "bytes": self._writer.bytes_written if self._writer else 0,
+            "max_capture_ms": round(self.max_capture_ms, 3),
+        }
+
+
+def read_clip(path):
+    """
+    Decode a raw clip
+
+    Args:
+        path (str): Clip file
+
+    Yields:
+        tuple: (frame index, capture time in ms, pygame.Surface)
+    """
+    with open(path, "rb") as f:
+        magic, version, width, height, pitch, bytesize, *masks = _CLIP_HEADER.unpack(f.read(_CLIP_HEADER.size))
+        if magic != CLIP_MAGIC or version != CLIP_VERSION:
+            raise ValueError(f"Not a Crocolixo clip (version {CLIP_VERSION}): {path}")
+        layout = FrameLayout(width, height, pitch, bytesize, masks)
+        pixels = bytearray(layout.frame_size)
+
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return
+            flags, index, time_ms, size = _FRAME_HEADER.unpack(header)
+            payload = zlib.decompress(f.read(size))
+            if flags & _KEY_FRAME:
+                pixels[:] = payload
+            else:
+                _xor_into(pixels, pixels, payload)
+            yield index, time_ms, layout.to_surface(pixels)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python recording.py <clip.crec> <output dir>")
+        sys.exit(1)
+    clip, output = sys.argv[1], sys.argv[2]
+    os.makedirs(output, exist_ok=True)
+    count = 0
+    for frame_index, _, frame in read_clip(clip):
+        pygame.image.save(frame, os.path.join(output, f"frame_{frame_index:06d}.png"))
+        count += 1
+    print(f"[RECORD] Wrote {count} frames from '{clip}' to '{output}'")
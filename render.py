@@ -0,0 +1,286 @@
+"""
+Render backends - own the game window and present frames
+
+All drawing happens at the logical resolution (SCREEN_WIDTH x
+SCREEN_HEIGHT). The window itself can be an integer multiple of that
+size (or fullscreen): the canvas is scaled to the window once per frame
+while presenting, so a larger window adds no blit cost. This is window
+scaling only: compositing a frame costs the same as drawing straight to
+an 800x600 window.
+
+The canvas is not a lower native resolution, and compositing does not
+get cheaper than 800x600: the game art has no single native scale. The
+pegador, trash, splash, placa and HUD art is authored 1:1 for the
+800x600 canvas, while crocodile frames are upscaled 2x at load time and
+the 400x267 river/margens art about 2.25x (not an integer factor).
+Compositing at half size would resample most sprites and make the river
+scroll in visible steps, so those load-time upscales stay.
+
+Two backends are available:
+- SoftwareBackend: pygame display surface and Surface.blit (default)
+- SDL2Backend: pygame._sdl2 Renderer drawing sprites as textured quads.
+  Falls back to SDL's software renderer when no GPU renderer is available.
+"""
+import weakref
+import pygame
+from config import *
+from metrics import metrics, COUNT_BUCKETS
+
+_blits_per_frame = metrics.histogram("render.blits_per_frame", COUNT_BUCKETS)
+
+
+class RenderBackend:
+    """
+    Interface shared by the render backends.
+
+    Gameplay frames are drawn with blit()/fill_rect() and shown with
+    present(). Menus draw directly on the software canvas and are shown
+    with present_canvas().
+    """
+    name = None
+
+    def __init__(self, scale=WINDOW_SCALE, fullscreen=FULLSCREEN, vsync=VSYNC):
+        """
+        Args:
+            scale (int): Integer window scale factor (1 = logical size)
+            fullscreen (bool): Scale the canvas to fill the whole display
+            vsync (bool): Request presents synchronized to the display refresh
+        """
+        self.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.scale = max(1, int(scale))
+        self.fullscreen = fullscreen
+        self.vsync = False  # Set by subclasses when vsync was actually enabled
+        self.refresh_rate = display_refresh_rate()
+        self.canvas = None
+        self.frame_blits = 0  # Blits issued for the current gameplay frame
+        self.recorder = None  # FrameRecorder capturing presented frames (software backend only)
+
+    def blit(self, surface, dest):
+        """
+        Draw a surface at a position
+
+        Args:
+            surface (pygame.Surface): Image to draw
+            dest: Top-left position or rect
+        """
+        raise NotImplementedError
+
+    def fill_rect(self, color, rect):
+        """
+        Fill a rectangle with a solid color
+
+        Args:
+            color (tuple): RGB color
+            rect: Rectangle to fill
+        """
+        raise NotImplementedError
+
+    def present(self):
+        """Show the gameplay frame drawn with blit()/fill_rect()"""
+        raise NotImplementedError
+
+    def _end_frame(self):
+        """Report the blits of the gameplay frame being presented"""
+        _blits_per_frame.observe(self.frame_blits)
+        self.frame_blits = 0
+
+    def present_canvas(self):
+        """Show the software canvas (menus)"""
+        raise NotImplementedError
+
+
+class SoftwareBackend(RenderBackend):
+    """Software rendering through the pygame display surface"""
+    name = "software"
+
+    def __init__(self, scale=WINDOW_SCALE, fullscreen=FULLSCREEN, vsync=VSYNC):
+        super().__init__(scale, fullscreen, vsync)
+
+        # The canvas is always the 800x600 logical size (see the module
+        # docstring): SCALED only enlarges it for the window
+        flags = 0
+        if self.scale != 1 or fullscreen or vsync:
+            # SCALED keeps the display surface at the logical size and lets
+            # SDL upscale it (nearest neighbour) when presenting. pygame
+            # only supports vsync on SCALED displays.
+            flags |= pygame.SCALED
+        if fullscreen:
+            flags |= pygame.FULLSCREEN
+
+        self.canvas = None
+        if vsync:
+            try:
+                self.canvas = pygame.display.set_mode(self.logical_size, flags, vsync=1)
+                self.vsync = True
+            except pygame.error as e:
+                print(f"[RENDER] Vsync not available ({e})")
+        if self.canvas is None:
+            self.canvas = pygame.display.set_mode(self.logical_size, flags)
+        pygame.display.set_caption(GAME_TITLE)
+
+        if flags & pygame.SCALED and not fullscreen:
+            self._resize_window()
+
+        print(f"[RENDER] Software canvas {self.logical_size}, window scale {self.scale}x, "
+              f"fullscreen: {fullscreen}, vsync: {self.vsync}")
+
+    def _resize_window(self):
+        """Resize the window to the requested integer multiple of the canvas"""
+        try:
+            from pygame._sdl2.video import Window, WINDOWPOS_CENTERED
+        except ImportError:
+            return
+        window = Window.from_display_module()
+        window.size = (self.logical_size[0] * self.scale, self.logical_size[1] * self.scale)
+        window.position = WINDOWPOS_CENTERED
+
+    def blit(self, surface, dest):
+        self.frame_blits += 1
+        self.canvas.blit(surface, dest)
+
+    def fill_rect(self, color, rect):
+        self.canvas.fill(color, rect)
+
+    def present(self):
+        self._end_frame()
+        if self.recorder is not None:
+            self.recorder.capture(self.canvas)
+        pygame.display.flip()
+
+    def present_canvas(self):
+        if self.recorder is not None:
+            self.recorder.capture(self.canvas)
+        pygame.display.flip()
+
+
+class SDL2Backend(RenderBackend):
+    """
+    Hardware-accelerated rendering through pygame._sdl2.video.
+
+    Every surface is uploaded to a texture once (cached per surface) and
+    drawn as a textured quad; alpha blending and scaling to the window are
+    done by the renderer.
+    """
+    name = "sdl2"
+
+    def __init__(self, scale=WINDOW_SCALE, fullscreen=FULLSCREEN, vsync=VSYNC):
+        from pygame._sdl2 import error as sdl2_error
+        from pygame._sdl2.video import Window, Renderer, Texture
+        super().__init__(scale, fullscreen, vsync)
+        self._texture_class = Texture
+
+        # A hidden display mode is still needed for Surface.convert()/convert_alpha()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        window_size = (self.logical_size[0] * self.scale, self.logical_size[1] * self.scale)
+        self.window = Window(GAME_TITLE, size=window_size, fullscreen_desktop=fullscreen)
+
+        try:
+            self.renderer = Renderer(self.window, accelerated=1, vsync=vsync)
+            self.accelerated = True
+            self.vsync = vsync
+        except sdl2_error as e:
+            print(f"[RENDER] No accelerated renderer ({e}), using SDL software renderer")
+            self.renderer = Renderer(self.window, accelerated=0)
+            self.accelerated = False
+        self.renderer.logical_size = self.logical_size
+
+        # Menus keep drawing on a software canvas uploaded once per presented frame
+        self.canvas = pygame.Surface(self.logical_size).convert()
+        self._canvas_texture = Texture(self.renderer, self.logical_size, streaming=True)
+
+        self._textures = weakref.WeakKeyDictionary()
+
+        print(f"[RENDER] SDL2 renderer {self.logical_size}, window scale {self.scale}x, "
+              f"accelerated: {self.accelerated}, fullscreen: {fullscreen}, vsync: {self.vsync}")
+
+    def _texture_for(self, surface):
+        """
+        Get the texture for a surface, uploading it on first use
+
+        Args:
+            surface (pygame.Surface): Source surface (must not be modified afterwards)
+
+        Returns:
+            Texture: Cached texture
+        """
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._texture_class.from_surface(self.renderer, surface)
+            surface_alpha = surface.get_alpha()
+            if surface_alpha is not None and surface_alpha < 255:
+                texture.alpha = surface_alpha
+            self._textures[surface] = texture
+        return texture
+
+    def blit(self, surface, dest):
+        self.frame_blits += 1
+        rect = surface.get_rect(topleft=(dest[0], dest[1]))
+        self._texture_for(surface).draw(dstrect=rect)
+
+    def fill_rect(self, color, rect):
+        self.renderer.draw_color = (color[0], color[1], color[2], 255)
+        self.renderer.fill_rect(pygame.Rect(rect))
+
+    def _flip(self):
+        """Present the renderer and clear it for the next frame"""
+        self.renderer.present()
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def present(self):
+        self._end_frame()
+        self._flip()
+
+    def present_canvas(self):
+        self._canvas_texture.update(self.canvas)
+        self._canvas_texture.draw()
+        self._flip()
+
+
+RENDER_BACKENDS = {
+    SoftwareBackend.name: SoftwareBackend,
+    SDL2Backend.name: SDL2Backend,
+}
+
+
+def display_refresh_rate():
+    """
+    Get the refresh rate of the display
+
+    Returns:
+        int: Refresh rate in Hz (DISPLAY_REFRESH_RATE when pygame can't
+             report it: only newer pygame builds can)
+    """
+    get_rate = getattr(pygame.display, "get_current_refresh_rate", None)
+    if get_rate is not None:
+        try:
+            rate = get_rate()
+            if rate > 0:
+                return rate
+        except pygame.error:
+            pass
+    return DISPLAY_REFRESH_RATE
+
+
+def create_backend(name=RENDER_BACKEND, scale=WINDOW_SCALE, fullscreen=FULLSCREEN, vsync=VSYNC):
+    """
+    Create a render backend, falling back to software rendering
+
+    Args:
+        name (str): Backend name ('software' or 'sdl2')
+        scale (int): Integer window scale factor
+        fullscreen (bool): Run in fullscreen
+        vsync (bool): Synchronize presents to the display refresh where supported
+
+    Returns:
+        RenderBackend: The created backend
+    """
+    backend_class = RENDER_BACKENDS.get(name, SoftwareBackend)
+    try:
+        return backend_class(scale=scale, fullscreen=fullscreen, vsync=vsync)
+    except (ImportError, RuntimeError, pygame.error) as e:
+        if backend_class is SoftwareBackend:
+            raise
+        print(f"[RENDER] Could not create '{name}' backend ({e}), using software rendering")
+        return SoftwareBackend(scale=scale, fullscreen=fullscreen, vsync=vsync)
@@ -0,0 +1,61 @@
+"""
+Simulation clock - game time that only advances with simulation ticks
+
+Gameplay timers read this clock instead of pygame.time.get_ticks(), so
+pausing (or a stalled frame) never makes timers jump ahead: while the
+simulation is not ticking, game time stands still.
+"""
+from config import SIM_TICK_MS
+
+
+class SimClock:
+    """Monotonic game time advanced by the simulation loop"""
+
+    def __init__(self):
+        """Initialize the clock at time zero"""
+        self.time_ms = 0.0
+        self.tick_count = 0
+
+    def advance(self, ms=SIM_TICK_MS):
+        """
+        Advance game time by one simulation tick
+
+        Args:
+            ms (float): Simulated milliseconds to advance
+        """
+        self.time_ms += ms
+        self.tick_count += 1
+
+    def set(self, time_ms, tick_count):
+        """
+        Move the clock to a saved point (restoring a game snapshot)
+
+        Args:
+            time_ms (float): Game time in milliseconds
+            tick_count (int): Ticks simulated up to that time
+        """
+        self.time_ms = time_ms
+        self.tick_count = tick_count
+
+    def get_ticks(self):
+        """
+        Get the current game time
+
+        Returns:
+            int: Milliseconds of simulated time (like pygame.time.get_ticks)
+        """
+        return int(self.time_ms)
+
+
+# Clock shared by the game and its entities
+sim_clock = SimClock()
+
+
+def get_ticks():
+    """
+    Get the current game time from the shared simulation clock
+
+    Returns:
+        int: Milliseconds of simulated time
+    """
+    return sim_clock.get_ticks()
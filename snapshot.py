@@ -0,0 +1,349 @@
+"""
+Game state snapshots and the rewind buffer
+
+Game.snapshot() captures all gameplay state into a GameSnapshot and
+Game.restore() puts it back, so play continues exactly as it would have
+from that tick:
+- entity positions, velocities, states and timers (pegadores, crocodiles
+  with their CrocodileControl, trash, splashes)
+- SpawnManager timers, the timer wheel's start order (armed timers are
+  stored by the entities owning them), pollution, lives, score and the sign's phrase
+- the simulation clock and the state of the random module
+- sprite group membership and order (update order decides the order
+  random numbers are drawn in)
+
+Assets, surfaces, sounds and input sources are not part of it. Pooled
+sprites are stored by pool slot (dead slots included), so every entity
+keeps its place from one snapshot to the next; references between
+entities are stored as slot or list indices.
+
+Encoded, a snapshot is a flat run of float64 values (integers, flags and
+None as NaN), every record prefixed by its length. Consecutive snapshots
+line up value for value, so the XOR of two is almost all zeros.
+
+RewindBuffer keeps the last few seconds of snapshots the way recording.py
+keeps frames: every REWIND_KEYFRAME_INTERVAL-th snapshot whole, the rest
+as the XOR with the previous one, all zlib-compressed.
+"""
+import math
+import zlib
+from array import array
+from collections import deque
+from config import *
+
+SNAPSHOT_VERSION = 4
+
+# Sprite kinds in GameSnapshot.sprite_order
+SPRITE_PLACA = 0
+SPRITE_PEGADOR = 1
+SPRITE_CROCODILE = 2
+SPRITE_TRASH = 3
+SPRITE_SPLASH = 4
+
+# Crocodile control kinds in GameSnapshot.crocodiles
+CONTROL_DEFAULT = 0  # The game's control (wandering or hunting, see CROCODILE_BEHAVIOR)
+CONTROL_DEBUG = 1  # DebugControl (the fixed crocodile of debug mode)
+
+
+class GameSnapshot:
+    """
+    Gameplay state at one simulation tick
+
+    Attributes:
+        tick (int): sim_clock.tick_count
+        time_ms (float): sim_clock.time_ms
+        rng (tuple): Mersenne Twister words of random.getstate() and the
+                     cached gaussian (None if there is none)
+        game (tuple): Score, round flags, river offset, pollution, lives,
+                      sign phrase and the respawn timer
+        timers (tuple): TimerWheel.get_state()
+        spawn_manager (tuple): SpawnManager.get_state()
+        trash (list): FloatingObject.get_state() per trash pool slot
+        splashes (list): Splash.get_state() per splash pool slot
+        river_order (tuple): Trash slots in the floating_objects group, in order
+        crocodiles (list): Crocodile.get_state() + (control kind, carried
+                           pegador) in crocodiles group order
+        pegadores (list): Pegador.get_state() + (captured trash slot,
+                          catching crocodile), active pegador first
+        sprite_order (tuple): (kind, index) pairs of the all_sprites group, in order
+    """
+
+    __slots__ = ("tick", "time_ms", "rng", "game", "timers", "spawn_manager", "trash", "splashes", "river_order",
+                 "crocodiles", "pegadores", "sprite_order")
+
+    # Encoding order: records that rarely change shape first, so the values
+    # of consecutive snapshots stay aligned for as long as possible
+    _RECORDS = ("game", "timers", "spawn_manager", "rng")
+    _LISTS = ("trash", "splashes")
+    _TAIL_RECORDS = ("river_order",)
+    _TAIL_LISTS = ("crocodiles", "pegadores")
+
+    def __init__(self, tick, time_ms, rng, game, timers, spawn_manager, trash, splashes, river_order,
+                 crocodiles, pegadores, sprite_order):
+        self.tick = tick
+        self.time_ms = time_ms
+        self.rng = rng
+        self.game = game
+        self.timers = timers
+        self.spawn_manager = spawn_manager
+        self.trash = trash
+        self.splashes = splashes
+        self.river_order = river_order
+        self.crocodiles = crocodiles
+        self.pegadores = pegadores
+        self.sprite_order = sprite_order
+
+    def to_bytes(self):
+        """
+        Encode the snapshot
+
+        Returns:
+            bytes: Flat float64 values (see module docstring)
+        """
+        values = array('d', (SNAPSHOT_VERSION, self.tick, self.time_ms))
+        for name in self._RECORDS:
+            _put_record(values, getattr(self, name))
+        for name in self._LISTS:
+            records = getattr(self, name)
+            values.append(len(records))
+            for record in records:
+                _put_record(values, record)
+        for name in self._TAIL_RECORDS:
+            _put_record(values, getattr(self, name))
+        for name in self._TAIL_LISTS:
+            records = getattr(self, name)
+            values.append(len(records))
+            for record in records:
+                _put_record(values, record)
+        _put_record(values, self.sprite_order)
+        return values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a snapshot encoded by to_bytes()
+
+        Args:
+            data (bytes): Encoded snapshot
+
+        Returns:
+            GameSnapshot: The snapshot
+
+        Raises:
+            ValueError: If the data is not a snapshot of this version
+        """
+        values = array('d')
+        values.frombytes(data)
+        if not values or values[0] != SNAPSHOT_VERSION:
+            raise ValueError("Not a game snapshot (or from another version)")
+        reader = _Reader(values, 1)
+        fields = {"tick": reader.value(), "time_ms": reader.value()}
+        for name in cls._RECORDS:
+            fields[name] = reader.record()
+        for name in cls._LISTS:
+            fields[name] = [reader.record() for _ in range(reader.value())]
+        for name in cls._TAIL_RECORDS:
+            fields[name] = reader.record()
+        for name in cls._TAIL_LISTS:
+            fields[name] = [reader.record() for _ in range(reader.value())]
+        fields["sprite_order"] = reader.record()
+        return cls(**fields)
+
+
+def _put_record(values, record):
+    """Append a record (length first) to the encoded values"""
+    values.append(len(record))
+    if None in record:
+        values.extend(math.nan if value is None else value for value in record)
+    else:
+        values.extend(record)
+
+
+class _Reader:
+    """Reads records back from encoded values"""
+
+    def __init__(self, values, position):
+        self.values = values
+        self.position = position
+
+    def value(self):
+        """Next value: None for NaN, int when it is whole"""
+        value = self.values[self.position]
+        self.position += 1
+        if value != value:
+            return None
+        return int(value) if value.is_integer() else value
+
+    def record(self):
+        """Next record as a tuple"""
+        return tuple(self.value() for _ in range(self.value()))
+
+
+def xor_delta(data, previous):
+    """
+    XOR data with the previous encoding (zero-padded or cut to the same length)
+
+    Args:
+        data (bytes): Current encoding
+        previous (bytes): Previous encoding
+
+    Returns:
+        bytes: Same length as data
+    """
+    size = len(data)
+    previous = previous[:size].ljust(size, b"\0")
+    return (int.from_bytes(data, "little") ^ int.from_bytes(previous, "little")).to_bytes(size, "little")
+
+
+class RewindBuffer:
+    """
+    Ring buffer of recent snapshots, delta-compressed
+
+    Holds at least `seconds` of snapshots (plus up to one keyframe interval
+    more: the oldest deltas are dropped together with their keyframe).
+    """
+
+    def __init__(self, seconds=REWIND_SECONDS, interval=REWIND_INTERVAL_TICKS,
+                 keyframe_interval=REWIND_KEYFRAME_INTERVAL, compression=REWIND_COMPRESSION):
+        """
+        Initialize an empty buffer
+
+        Args:
+            seconds (float): Game time to keep
+            interval (int): Simulation ticks between snapshots (used for sizing)
+            keyframe_interval (int): Every N-th snapshot is stored whole
+            compression (int): zlib level (1 = fastest)
+        """
+        self.interval = max(1, interval)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.capacity = max(1, int(seconds * SIM_FPS / self.interval)) + self.keyframe_interval
+        self.compression = compression
+        self._entries = deque()  # (tick, is_keyframe, zlib payload)
+        self._previous = None  # Encoding of the newest snapshot
+        self._since_keyframe = 0
+
+        # Statistics
+        self.pushed = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def push(self, snapshot, data=None):
+        """
+        Add a snapshot (newer than every snapshot already held)
+
+        Args:
+            snapshot (GameSnapshot): Snapshot to add
+            data (bytes): snapshot.to_bytes(), if already encoded
+        """
+        if data is None:
+            data = snapshot.to_bytes()
+        is_keyframe = self._previous is None or self._since_keyframe >= self.keyframe_interval - 1
+        if is_keyframe:
+            payload = zlib.compress(data, self.compression)
+            self._since_keyframe = 0
+        else:
+            payload = zlib.compress(xor_delta(data, self._previous), self.compression)
+            self._since_keyframe += 1
+        self._previous = data
+        self._entries.append((snapshot.tick, is_keyframe, payload))
+
+        self.pushed += 1
+        self.raw_bytes += len(data)
+        self.stored_bytes += len(payload)
+
+        if len(self._entries) > self.capacity:
+            # Deltas can't be decoded without their keyframe: drop them together
+            self._entries.popleft()
+            while self._entries and not self._entries[0][1]:
+                self._entries.popleft()
+
+    def ticks(self):
+        """
+        Get the range of ticks held
+
+        Returns:
+            tuple: (oldest tick, newest tick), or None if empty
+        """
+        if not self._entries:
+            return None
+        return self._entries[0][0], self._entries[-1][0]
+
+    def get(self, tick):
+        """
+        Get the newest snapshot at or before a tick
+
+        Args:
+            tick (int): Simulation tick
+
+        Returns:
+            GameSnapshot or None: The snapshot (None if all are newer)
+        """
+        index = self._find(tick)
+        return None if index is None else GameSnapshot.from_bytes(self._decode(index))
+
+    def rewind(self, tick):
+        """
+        Get the newest snapshot at or before a tick and forget the ones after it
+
+        The game restored to this snapshot pushes its next snapshots after it.
+
+        Args:
+            tick (int): Simulation tick to go back to
+
+        Returns:
+            GameSnapshot or None: The snapshot (None if all are newer)
+        """
+        index = self._find(tick)
+        if index is None:
+            return None
+        data = self._decode(index)
+        while len(self._entries) > index + 1:
+            self._entries.pop()
+        self._previous = data
+        self._since_keyframe = 0
+        while not self._entries[index - self._since_keyframe][1]:
+            self._since_keyframe += 1
+        return GameSnapshot.from_bytes(data)
+
+    def clear(self):
+        """Forget every snapshot (new round)"""
+        self._entries.clear()
+        self._previous = None
+        self._since_keyframe = 0
+
+    def _find(self, tick):
+        """Index of the newest entry at or before a tick (None if there is none)"""
+        for index in range(len(self._entries) - 1, -1, -1):
+            if self._entries[index][0] <= tick:
+                return index
+        return None
+
+    def _decode(self, index):
+        """Decode the entry at an index, starting from its keyframe"""
+        start = index
+        while not self._entries[start][1]:
+            start -= 1
+        data = zlib.decompress(self._entries[start][2])
+        for position in range(start + 1, index + 1):
+            data = xor_delta(zlib.decompress(self._entries[position][2]), data)
+        return data
+
+    def get_stats(self):
+        """
+        Get buffer statistics
+
+        Returns:
+            dict: Snapshots held and pushed, seconds held, mean encoded and
+                  stored bytes per snapshot
+        """
+        span = self.ticks()
+        return {
+            "snapshots": len(self._entries),
+            "pushed": self.pushed,
+            "seconds": round((span[1] - span[0]) / SIM_FPS, 2) if span else 0,
+            "raw_bytes": round(self.raw_bytes / self.pushed) if self.pushed else 0,
+            "stored_bytes": round(self.stored_bytes / self.pushed) if self.pushed else 0,
+        }
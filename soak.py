@@ -0,0 +1,289 @@
+"""
+Soak test - play the game headless with the autoplay bot for hours
+
+Runs rounds back to back (the game is reset after every game over)
+without a window or sound, at a multiple of real time (--speed; 0 runs
+as fast as possible). Every --report-minutes of game time a sample is
+printed (and appended to --out as JSON lines):
+    throughput   simulation ticks per second and achieved speed
+    memory       process RSS and objects tracked by the garbage collector
+    entities     sprites, trash, crocodiles and pool sizes
+    play         rounds, mean score, bot dives
+
+The summary fits a line through the samples (after the first, which
+includes warm-up) and reports growth per game hour, so slow leaks and
+entity-count drift show up even when each round looks fine.
+
+With --audit every sample is also a leak audit checkpoint (see
+leak_audit.py: live entities by class, surfaces by origin, tracemalloc
+growth), and the run fails (exit status 1) when something kept growing
+over the last LEAK_AUDIT_CYCLES checkpoints.
+
+Usage:
+    python soak.py --minutes 120 --speed 50
+    python soak.py --minutes 60 --speed 0 --audit
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+from config import *
+from leak_audit import auditor
+from utils import init_headless
+
+
+def _rss_bytes():
+    """
+    Get the process resident set size
+
+    Returns:
+        int or None: Bytes (None where it cannot be read)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak (not current) RSS: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _slope(points):
+    """
+    Least-squares slope of (x, y) points
+
+    Args:
+        points (list): (x, y) tuples
+
+    Returns:
+        float: dy/dx (0 with fewer than two distinct x)
+    """
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+class SoakRunner:
+    """Plays rounds back to back and samples throughput, memory and entity counts"""
+
+    # Sample fields whose growth per game hour is reported
+    TRACKED = ("rss_mb", "gc_objects", "sprites", "trash", "crocodiles", "trash_pool", "splash_pool")
+
+    def __init__(self, minutes, speed=50.0, report_minutes=5.0, seed=None, output=None, audit=False):
+        """
+        Create the headless game and the bot
+
+        Args:
+            minutes (float): Game time to play
+            speed (float): Multiple of real time (0 = as fast as possible)
+            report_minutes (float): Game time between samples
+            seed (int): Seed for the game's random generator
+            output (str): JSONL file for the samples (None = print only)
+            audit (bool): Run the leak audit at every sample
+        """
+        import random
+        from autoplay import AutoplayBot
+        from game import Game
+        from render import create_backend
+
+        if seed is not None:
+            random.seed(seed)
+        init_headless()
+
+        self.total_ticks = int(minutes * 60 * SIM_FPS)
+        self.report_ticks = max(1, int(report_minutes * 60 * SIM_FPS))
+        self.speed = speed
+        self.output = output
+        self.samples = []
+        self.rounds = 0
+        self.round_scores = []
+        self.audit = audit
+        self._devnull = open(os.devnull, "w")
+
+        if audit:
+            # Before the game is built, so every entity is tracked
+            auditor.enable()
+
+        self.bot = AutoplayBot()
+        with contextlib.redirect_stdout(self._devnull):
+            self.game = Game(backend=create_backend("software", scale=1, fullscreen=False, vsync=False),
+                             input_source=self.bot)
+        self.bot.game = self.game
+
+    def run(self):
+        """
+        Play until the requested game time has passed
+
+        Returns:
+            list: The samples taken
+        """
+        game = self.game
+        start = time.perf_counter()
+        last_sample_time = start
+        last_sample_tick = 0
+        print(f"[SOAK] Playing {self.total_ticks / SIM_FPS / 60:.0f} game minutes at "
+              f"{'max' if self.speed <= 0 else f'{self.speed:g}x'} speed")
+
+        out = open(self.output, "a", encoding="utf-8") if self.output else None
+        try:
+            tick = 0
+            while tick < self.total_ticks:
+                batch = min(SIM_FPS, self.total_ticks - tick)
+                with contextlib.redirect_stdout(self._devnull):
+                    for _ in range(batch):
+                        game.update()
+                        if not game.running:
+                            self.rounds += 1
+                            self.round_scores.append(game.score)
+                            game.reset()
+                tick += batch
+
+                if self.speed > 0:
+                    # Hold the requested multiple of real time
+                    ahead = tick * SIM_TICK_MS / 1000 / self.speed - (time.perf_counter() - start)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+                if tick - last_sample_tick >= self.report_ticks or tick >= self.total_ticks:
+                    now = time.perf_counter()
+                    sample = self._sample(tick, tick - last_sample_tick, now - last_sample_time, now - start)
+                    last_sample_tick, last_sample_time = tick, now
+                    self.samples.append(sample)
+                    self._print_sample(sample)
+                    if self.audit:
+                        auditor.print_checkpoint(auditor.checkpoint(f"{sample['game_minutes']} min"))
+                    if out:
+                        out.write(json.dumps(sample, separators=(",", ":")) + "\n")
+                        out.flush()
+        finally:
+            if out:
+                out.close()
+
+        self._print_summary()
+        return self.samples
+
+    def find_leaks(self):
+        """
+        Get the leak audit's findings (see LifetimeAuditor.find_growth)
+
+        Returns:
+            list: What kept growing (empty when not auditing)
+        """
+        return auditor.find_growth() if self.audit else []
+
+    def close(self):
+        """Shut the game down (findings taken so far stay available)"""
+        with contextlib.redirect_stdout(self._devnull):
+            self.game.close()
+        self._devnull.close()
+
+    def _sample(self, tick, ticks, wall_seconds, wall_total):
+        """
+        Take a sample of the current state
+
+        Args:
+            tick (int): Ticks played so far
+            ticks (int): Ticks since the previous sample
+            wall_seconds (float): Wall time since the previous sample
+            wall_total (float): Wall time since the start
+
+        Returns:
+            dict: The sample
+        """
+        game = self.game
+        rss = _rss_bytes()
+        scores = self.round_scores
+        return {
+            "game_minutes": round(tick / SIM_FPS / 60, 2),
+            "wall_seconds": round(wall_total, 1),
+            "ticks_per_second": round(ticks / wall_seconds) if wall_seconds > 0 else None,
+            "speed": round(ticks * SIM_TICK_MS / 1000 / wall_seconds, 1) if wall_seconds > 0 else None,
+            "rss_mb": round(rss / 2 ** 20, 2) if rss is not None else None,
+            "gc_objects": len(gc.get_objects()),
+            "sprites": len(game.all_sprites),
+            "trash": len(game.floating_objects),
+            "crocodiles": len(game.crocodiles),
+            "trash_pool": len(game.trash_pool.sprites),
+            "splash_pool": len(game.splash_pool.sprites),
+            "rounds": self.rounds,
+            "mean_score": round(sum(scores) / len(scores), 1) if scores else None,
+            "bot": self.bot.get_stats(),
+        }
+
+    @staticmethod
+    def _print_sample(sample):
+        """Print one sample line"""
+        print(f"[SOAK] {sample['game_minutes']:8.1f} min | {sample['ticks_per_second']} ticks/s "
+              f"({sample['speed']}x) | RSS {sample['rss_mb']} MB, {sample['gc_objects']} objects | "
+              f"sprites {sample['sprites']}, trash {sample['trash']}, crocodiles {sample['crocodiles']}, "
+              f"pools {sample['trash_pool']}/{sample['splash_pool']} | rounds {sample['rounds']}, "
+              f"mean score {sample['mean_score']}")
+
+    def growth_per_hour(self):
+        """
+        Get the trend of the tracked fields
+
+        Returns:
+            dict: Fitted growth per game hour of every tracked field,
+                  ignoring the first (warm-up) sample
+        """
+        steady = self.samples[1:]
+        growth = {}
+        for field in self.TRACKED:
+            points = [(s["game_minutes"] / 60, s[field]) for s in steady if s[field] is not None]
+            growth[field] = round(_slope(points), 3)
+        return growth
+
+    def _print_summary(self):
+        """Print throughput and drift over the whole run"""
+        if not self.samples:
+            return
+        last = self.samples[-1]
+        mean_speed = last["game_minutes"] * 60 / last["wall_seconds"] if last["wall_seconds"] else 0
+        print(f"[SOAK] Done: {last['game_minutes']:.1f} game minutes in {last['wall_seconds']:.0f} s "
+              f"({mean_speed:.1f}x), {self.rounds} rounds, mean score {last['mean_score']}")
+        print(f"[SOAK] Growth per game hour: {self.growth_per_hour()}")
+
+
+def main():
+    """Parse the command line and run the soak test"""
+    parser = argparse.ArgumentParser(description='Crocolixo soak test (headless autoplay)')
+    parser.add_argument('--minutes', type=float, default=120, help='Game minutes to play')
+    parser.add_argument('--speed', type=float, default=50, help='Multiple of real time (0 = as fast as possible)')
+    parser.add_argument('--report-minutes', type=float, default=5, help='Game minutes between samples')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    parser.add_argument('--out', help='Append the samples to this JSONL file')
+    parser.add_argument('--audit', action='store_true',
+                        help='Audit entity lifetimes and heap growth; fail if memory keeps climbing')
+    args = parser.parse_args()
+
+    runner = SoakRunner(args.minutes, speed=args.speed, report_minutes=args.report_minutes,
+                        seed=args.seed, output=args.out, audit=args.audit)
+    runner.run()
+    runner.close()
+
+    leaks = runner.find_leaks()
+    for finding in leaks:
+        print(f"[AUDIT] Growth: {finding}")
+    if leaks:
+        print("[AUDIT] FAILED: memory kept growing")
+        sys.exit(1)
+    if args.audit:
+        print(f"[AUDIT] OK: no steady growth over the last {LEAK_AUDIT_CYCLES} checkpoints")
+
+
+if __name__ == "__main__":
+    main()
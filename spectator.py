@@ -0,0 +1,425 @@
+"""
+Spectator feed - stream live play to viewers on another screen
+
+SpectatorServer publishes the game state (a GameSnapshot, see
+snapshot.py: entities, HUD values) every simulation tick to any number of
+viewers on a local TCP or Unix socket. Each tick is encoded once: zlib of
+the XOR with the previous tick, shared by every viewer. Viewers that just
+connected, or that fell behind, get a whole keyframe instead.
+
+The game loop never waits for a viewer: sockets are non-blocking, and
+whatever the kernel doesn't take is kept in a per-viewer backlog. When a
+backlog grows past SPECTATOR_MAX_BACKLOG bytes, the queued ticks are
+dropped and the viewer is resynced with a keyframe. A viewer that takes
+nothing through SPECTATOR_MAX_RESYNCS resyncs in a row is disconnected.
+
+Stream layout:
+    hello     magic (4 bytes) + version (uint16)
+    messages  flags (uint8, 1 = keyframe) + tick (uint32) + payload size (uint32)
+              + zlib payload (snapshot, or XOR with the previous tick's snapshot)
+
+The viewer draws with the game's own sprites and code: it builds a Game
+without playing it, restores every snapshot it receives and draws it.
+
+Start the game with main.py --spectate [ADDRESS], then run a viewer with:
+    python spectator.py [ADDRESS]
+where ADDRESS is HOST:PORT or the path of a Unix socket.
+"""
+import argparse
+import os
+import select
+import socket
+import struct
+import sys
+import time
+import zlib
+import pygame
+from config import *
+from metrics import metrics
+from snapshot import GameSnapshot, xor_delta
+
+MAGIC = b"CRSP"
+VERSION = 1
+HELLO = struct.Struct("<4sH")
+MESSAGE = struct.Struct("<BII")
+KEYFRAME = 1
+
+_publish_time = metrics.histogram("spectator.publish_ms", (0.1, 0.25, 0.5, 1, 2, 4))
+_viewer_gauge = metrics.gauge("spectator.viewers")
+_bytes_sent = metrics.counter("spectator.bytes_sent")
+_resyncs = metrics.counter("spectator.resyncs")
+
+
+def parse_address(address):
+    """
+    Parse a spectator address
+
+    Args:
+        address (str): HOST:PORT, or a path (containing '/') for a Unix socket
+
+    Returns:
+        tuple: (socket family, socket address)
+
+    Raises:
+        ValueError: If the address is neither
+    """
+    if "/" in address:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix sockets are not available on this platform")
+        return socket.AF_UNIX, address
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Spectator address must be HOST:PORT or a socket path, not '{address}'")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+class _Viewer:
+    """A connected viewer and the bytes still to be sent to it"""
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.pending = []  # Messages not (fully) sent yet
+        self.offset = 0  # Bytes of pending[0] already sent
+        self.backlog = 0  # Bytes still to be sent
+        self.needs_keyframe = True
+        self.resyncs_without_progress = 0
+
+    def queue(self, message):
+        """Queue a message"""
+        self.pending.append(message)
+        self.backlog += len(message)
+
+    def flush(self):
+        """
+        Send as much as the socket takes without blocking
+
+        Raises:
+            OSError: If the viewer disconnected
+        """
+        while self.pending:
+            message = self.pending[0]
+            try:
+                sent = self.sock.send(memoryview(message)[self.offset:])
+            except (BlockingIOError, InterruptedError):
+                return
+            self.offset += sent
+            self.backlog -= sent
+            self.resyncs_without_progress = 0
+            _bytes_sent.inc(sent)
+            if self.offset < len(message):
+                return
+            self.pending.pop(0)
+            self.offset = 0
+
+    def resync(self):
+        """Drop the queued ticks (except a message half sent) and wait for a keyframe"""
+        keep = self.pending[:1] if self.offset else []
+        self.pending = keep
+        self.backlog = len(keep[0]) - self.offset if keep else 0
+        self.needs_keyframe = True
+        self.resyncs_without_progress += 1
+        _resyncs.inc()
+
+
+class SpectatorServer:
+    """Publishes the game state every tick to connected viewers"""
+
+    def __init__(self, address=SPECTATOR_ADDRESS, max_backlog=SPECTATOR_MAX_BACKLOG,
+                 max_viewers=SPECTATOR_MAX_VIEWERS, compression=SPECTATOR_COMPRESSION):
+        """
+        Start listening
+
+        Args:
+            address (str): HOST:PORT or a Unix socket path
+            max_backlog (int): Bytes queued for a viewer before it is resynced
+            max_viewers (int): Connections accepted at the same time
+            compression (int): zlib level (1 = fastest)
+
+        Raises:
+            OSError: If the address can't be listened on
+            ValueError: If the address is invalid
+        """
+        family, self.address = parse_address(address)
+        self.max_backlog = max_backlog
+        self.max_viewers = max_viewers
+        self.compression = compression
+
+        if family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)  # Left over by a previous session
+        self._listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(self.address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._unix_path = self.address if family == socket.AF_UNIX else None
+
+        self._viewers = []
+        self._previous = None  # Encoding of the previous tick
+
+        # Statistics
+        self.published = 0
+        self.connected = 0
+        self.disconnected = 0
+        self.resyncs = 0
+        print(f"[SPECTATOR] Listening on {address}")
+
+    def publish(self, tick, data):
+        """
+        Send a tick to every viewer (never blocks)
+
+        Args:
+            tick (int): Simulation tick
+            data (bytes): GameSnapshot.to_bytes() of the tick
+        """
+        start = time.perf_counter()
+        self._accept()
+        delta_message = None
+        key_message = None
+
+        for viewer in list(self._viewers):
+            if viewer.needs_keyframe or self._previous is None:
+                if key_message is None:
+                    key_message = self._message(KEYFRAME, tick, data)
+                viewer.queue(key_message)
+                viewer.needs_keyframe = False
+            else:
+                if delta_message is None:
+                    delta_message = self._message(0, tick, xor_delta(data, self._previous))
+                viewer.queue(delta_message)
+
+            try:
+                viewer.flush()
+            except OSError:
+                self._drop(viewer, "disconnected")
+                continue
+            if viewer.backlog > self.max_backlog:
+                viewer.resync()
+                self.resyncs += 1
+                if viewer.resyncs_without_progress >= SPECTATOR_MAX_RESYNCS:
+                    self._drop(viewer, "not reading")
+
+        self._previous = data
+        self.published += 1
+        if self._viewers:
+            _publish_time.observe((time.perf_counter() - start) * 1000)
+
+    def _message(self, flags, tick, payload):
+        """Build a message: header + zlib payload"""
+        payload = zlib.compress(payload, self.compression)
+        return MESSAGE.pack(flags, tick & 0xFFFFFFFF, len(payload)) + payload
+
+    def _accept(self):
+        """Accept the viewers waiting to connect"""
+        while True:
+            try:
+                sock, address = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                print(f"[SPECTATOR] Warning: accept failed: {e}")
+                return
+            if len(self._viewers) >= self.max_viewers:
+                sock.close()
+                continue
+            sock.setblocking(False)
+            viewer = _Viewer(sock, address or "unix socket")
+            viewer.queue(HELLO.pack(MAGIC, VERSION))
+            self._viewers.append(viewer)
+            self.connected += 1
+            _viewer_gauge.set(len(self._viewers))
+            print(f"[SPECTATOR] Viewer connected: {viewer.address}")
+
+    def _drop(self, viewer, reason):
+        """Disconnect a viewer"""
+        self._viewers.remove(viewer)
+        viewer.sock.close()
+        self.disconnected += 1
+        _viewer_gauge.set(len(self._viewers))
+        print(f"[SPECTATOR] Viewer {reason}: {viewer.address}")
+
+    def close(self):
+        """Disconnect every viewer and stop listening"""
+        for viewer in list(self._viewers):
+            self._drop(viewer, "closed")
+        self._listener.close()
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+    def get_stats(self):
+        """
+        Get spectator statistics
+
+        Returns:
+            dict: Viewers now and overall, ticks published, resyncs
+        """
+        return {
+            "viewers": len(self._viewers),
+            "connected": self.connected,
+            "disconnected": self.disconnected,
+            "published": self.published,
+            "resyncs": self.resyncs,
+        }
+
+
+class SpectatorClient:
+    """Receives the spectator feed and rebuilds the snapshots"""
+
+    def __init__(self, address=SPECTATOR_ADDRESS):
+        """
+        Connect to a spectator server
+
+        Args:
+            address (str): HOST:PORT or a Unix socket path
+
+        Raises:
+            OSError: If the server can't be reached
+            ValueError: If the address is invalid or the server isn't one
+        """
+        family, sockaddr = parse_address(address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(sockaddr)
+        self._buffer = bytearray()
+        self._data = None  # Encoding of the latest tick
+        self._hello_checked = False
+        self.tick = None
+        self.ticks_received = 0
+        self.keyframes_received = 0
+
+    def read(self, timeout=0.0):
+        """
+        Read what has arrived and apply it
+
+        Args:
+            timeout (float): Seconds to wait for data
+
+        Returns:
+            GameSnapshot or None: Latest tick, None if nothing new arrived
+
+        Raises:
+            ConnectionError: If the server closed the connection
+            ValueError: If the server is not a spectator server
+        """
+        ready, _, _ = select.select([self.sock], [], [], timeout)
+        if not ready:
+            return None
+        chunk = self.sock.recv(1 << 16)
+        if not chunk:
+            raise ConnectionError("Spectator server closed the connection")
+        self._buffer += chunk
+        while True:
+            ready, _, _ = select.select([self.sock], [], [], 0)
+            if not ready:
+                break
+            chunk = self.sock.recv(1 << 16)
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        updated = False
+        if not self._hello_checked:
+            if len(self._buffer) < HELLO.size:
+                return None
+            magic, version = HELLO.unpack_from(self._buffer)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not a Crocolixo spectator server (or another version)")
+            del self._buffer[:HELLO.size]
+            self._hello_checked = True
+
+        position = 0
+        while len(self._buffer) - position >= MESSAGE.size:
+            flags, tick, size = MESSAGE.unpack_from(self._buffer, position)
+            end = position + MESSAGE.size + size
+            if len(self._buffer) < end:
+                break
+            payload = zlib.decompress(self._buffer[position + MESSAGE.size:end])
+            position = end
+            if flags & KEYFRAME:
+                self._data = payload
+                self.keyframes_received += 1
+            elif self._data is not None:
+                self._data = xor_delta(payload, self._data)
+            else:
+                continue  # A delta before the first keyframe
+            self.tick = tick
+            self.ticks_received += 1
+            updated = True
+        del self._buffer[:position]
+
+        return GameSnapshot.from_bytes(self._data) if updated else None
+
+    def close(self):
+        """Close the connection"""
+        self.sock.close()
+
+
+def main():
+    """Run a viewer window"""
+    import contextlib
+    from utils import disable_mixer
+    from render import create_backend
+
+    parser = argparse.ArgumentParser(description='Crocolixo spectator viewer')
+    parser.add_argument('address', nargs='?', default=SPECTATOR_ADDRESS,
+                        help='HOST:PORT or Unix socket path of the game (main.py --spectate)')
+    parser.add_argument('--scale', type=int, default=WINDOW_SCALE, help='Integer window scale factor')
+    parser.add_argument('--fullscreen', action='store_true', help='Run in fullscreen')
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    disable_mixer()  # Sounds aren't part of the feed
+    backend = create_backend("software", scale=args.scale, fullscreen=args.fullscreen, vsync=False)
+    pygame.display.set_caption("Crocolixo - Spectator")
+
+    # A game that is only ever restored and drawn, never updated
+    from game import Game
+    quiet = open(os.devnull, "w")
+    with contextlib.redirect_stdout(quiet):
+        game = Game(backend=backend)
+
+    client = None
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
+
+        if client is None:
+            try:
+                client = SpectatorClient(args.address)
+                print(f"[SPECTATOR] Connected to {args.address}")
+            except OSError:
+                time.sleep(SPECTATOR_RECONNECT_SECONDS)  # Game not started yet
+                continue
+
+        try:
+            snapshot = client.read(timeout=1 / FPS)
+        except (OSError, ConnectionError) as e:
+            print(f"[SPECTATOR] Disconnected: {e}")
+            client.close()
+            client = None
+            continue
+        except ValueError as e:
+            # Handshake or snapshot of another game version: reconnecting won't help
+            print(f"[SPECTATOR] Incompatible feed from {args.address}: {e}")
+            print("[SPECTATOR] The game and the viewer must be the same version")
+            running = False
+            continue
+        if snapshot is not None:
+            with contextlib.redirect_stdout(quiet):
+                game.restore(snapshot)
+            game.draw()
+
+    if client is not None:
+        client.close()
+    with contextlib.redirect_stdout(quiet):
+        game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
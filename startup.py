@@ -0,0 +1,88 @@
+"""
+Startup timeline - where the time before the first frame goes
+
+main.py imports this module before anything else, so the timeline
+starts before pygame and the game modules are imported. Startup steps
+and asset loads are recorded as spans until the first frame is
+presented; the time to first frame is reported as a metric.
+"""
+import time
+from contextlib import contextmanager
+
+_process_start = time.perf_counter()
+
+
+class StartupTimeline:
+    """Records named spans from process start until the first frame"""
+
+    def __init__(self, start=None):
+        """
+        Args:
+            start (float): perf_counter() of the timeline origin (now if None)
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.spans = []  # (name, start ms, duration ms, depth)
+        self.active = True
+        self.time_to_first_frame_ms = None
+        self._depth = 0
+
+    def _now_ms(self):
+        """Milliseconds since the timeline origin"""
+        return (time.perf_counter() - self.start) * 1000
+
+    def mark(self, name):
+        """
+        Record an instant event
+
+        Args:
+            name (str): Event name
+        """
+        if self.active:
+            self.spans.append((name, self._now_ms(), 0.0, self._depth))
+
+    @contextmanager
+    def span(self, name):
+        """
+        Record the duration of a block (no-op after the first frame)
+
+        Args:
+            name (str): Span name
+        """
+        if not self.active:
+            yield
+            return
+        index = len(self.spans)
+        begin = self._now_ms()
+        self.spans.append((name, begin, 0.0, self._depth))
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans[index] = (name, begin, self._now_ms() - begin, self._depth)
+
+    def finish(self, print_timeline=False):
+        """
+        Stop recording once the first frame has been presented
+
+        Args:
+            print_timeline (bool): Print every recorded span
+        """
+        if not self.active:
+            return
+        from metrics import metrics
+
+        self.time_to_first_frame_ms = self._now_ms()
+        self.spans.append(("first frame", self.time_to_first_frame_ms, 0.0, 0))
+        self.active = False
+        metrics.gauge("startup.time_to_first_frame_ms").set(round(self.time_to_first_frame_ms, 2))
+
+        if print_timeline:
+            print("[STARTUP] Timeline (start ms, duration ms):")
+            for name, begin, duration, depth in self.spans:
+                print(f"[STARTUP] {begin:9.1f} {duration:8.1f}  {'  ' * depth}{name}")
+        print(f"[STARTUP] First frame after {self.time_to_first_frame_ms:.1f} ms")
+
+
+# Timeline of this process (origin: when this module was first imported)
+timeline = StartupTimeline(_process_start)
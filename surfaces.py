@@ -0,0 +1,139 @@
+"""
+Surface preparation and blit diagnostics
+
+Every surface that is blitted repeatedly should go through
+prepare_surface() once, so blits to the screen never pay for a
+per-pixel format conversion.
+"""
+import weakref
+import pygame
+from metrics import metrics
+
+_surfaces_prepared = metrics.counter("surfaces.prepared")
+
+# Origin label of every prepared surface (used by the diagnostics)
+_origins = weakref.WeakKeyDictionary()
+
+
+def has_transparency(surface):
+    """
+    Check if a surface has any transparent or translucent pixel
+
+    Args:
+        surface (pygame.Surface): Surface to inspect
+
+    Returns:
+        bool: True if the surface needs alpha or colorkey blending
+    """
+    if surface.get_colorkey() is not None:
+        return True
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return False
+    # Threshold 254 keeps only fully opaque pixels in the mask
+    width, height = surface.get_size()
+    return pygame.mask.from_surface(surface, 254).count() < width * height
+
+
+def prepare_surface(surface, alpha=None, rle=False, origin=None):
+    """
+    Convert a surface to the display pixel format
+
+    Args:
+        surface (pygame.Surface): Surface to prepare
+        alpha (bool): Keep per-pixel alpha. None picks an opaque format
+                      when the surface has no transparent pixels.
+        rle (bool): Apply RLE acceleration. Helps static sprites with large
+                    transparent runs; avoid for surfaces that are modified
+                    after preparation.
+        origin (str): Label reported by the blit diagnostics
+
+    Returns:
+        pygame.Surface: Surface in the display format (the input surface
+                        if no display mode is set yet)
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+
+    # Colorkeyed surfaces keep their colorkey in an opaque format
+    colorkey = surface.get_colorkey()
+    if alpha is None:
+        alpha = colorkey is None and has_transparency(surface)
+
+    if alpha:
+        prepared = surface.convert_alpha()
+        if rle:
+            prepared.set_alpha(255, pygame.RLEACCEL)
+    else:
+        prepared = surface.convert()
+        if rle and colorkey is not None:
+            prepared.set_colorkey(colorkey, pygame.RLEACCEL)
+
+    _surfaces_prepared.inc()
+    if origin is not None:
+        _origins[prepared] = origin
+    return prepared
+
+
+def surface_origin(surface):
+    """
+    Get the origin label recorded for a prepared surface
+
+    Args:
+        surface (pygame.Surface): Surface to look up
+
+    Returns:
+        str or None: Origin label, or None if the surface was not prepared
+    """
+    return _origins.get(surface)
+
+
+def is_display_format(surface):
+    """
+    Check if blitting a surface to the screen avoids format conversion
+
+    Args:
+        surface (pygame.Surface): Surface to check
+
+    Returns:
+        bool: True if depth and RGB layout match the display
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    if surface.get_bitsize() != display.get_bitsize():
+        return False
+    return surface.get_masks()[:3] == display.get_masks()[:3]
+
+
+class BlitDiagnostics:
+    """
+    Debug aid that flags surfaces blitted in a non-display pixel format.
+
+    Each offending surface is reported once, together with the origin it
+    was prepared with (if any) and the blit site that drew it.
+    """
+
+    def __init__(self):
+        """Initialize the diagnostics"""
+        self._reported = weakref.WeakSet()
+        self.slow_blit_counts = {}  # blit site -> number of slow blits
+
+    def check(self, surface, site):
+        """
+        Check a surface about to be blitted to the screen
+
+        Args:
+            surface (pygame.Surface): Surface being blitted
+            site (str): Where the blit happens (e.g. the sprite class name)
+        """
+        if is_display_format(surface):
+            return
+
+        self.slow_blit_counts[site] = self.slow_blit_counts.get(site, 0) + 1
+        if surface in self._reported:
+            return
+        self._reported.add(surface)
+
+        origin = surface_origin(surface) or "unprepared surface"
+        print(f"[SURFACE] Slow blit from {site} ({origin}): "
+              f"{surface.get_size()} {surface.get_bitsize()}-bit masks={surface.get_masks()}")
@@ -0,0 +1,287 @@
+"""
+Timer wheel - one-shot and periodic gameplay timers on the simulation clock
+
+Entities own Timer objects (a callback plus the tick it is due at) and
+arm them with start(); the shared `timer_wheel` fires them from
+Game.update() once per simulation tick. Nothing is polled: the cost of a
+tick is the number of timers that expire in it (plus, every 64 ticks,
+moving the next block of timers down a level).
+
+Hierarchical wheel (as in the Linux kernel timers): TIMER_WHEEL_LEVELS
+levels of 64 slots, where level n covers 64**(n+1) ticks with slots of
+64**n ticks. A timer goes to the lowest level whose range covers its
+delay; when the wheel reaches a higher-level slot, its timers are
+re-inserted a level lower, until they expire from level 0.
+
+Timers run on simulation ticks, so they stop while the game is paused and
+follow the simulation when it runs faster or slower than real time.
+Timers due on the same tick fire in the order they were started, and a
+timer's state (due tick, order and period) is plain integers. Entities
+store it in their snapshot state, so a restored game fires the same
+callbacks in the same order.
+"""
+from config import *
+from metrics import metrics
+
+_timers_fired = metrics.counter("timers.fired")
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+
+
+def ms_to_ticks(ms):
+    """
+    Convert a delay in game milliseconds to simulation ticks
+
+    Args:
+        ms (float): Delay in milliseconds
+
+    Returns:
+        int: Ticks (at least 1: a timer never fires in the tick it was started)
+    """
+    return max(1, round(ms / SIM_TICK_MS))
+
+
+class Timer:
+    """A callback due at a simulation tick, optionally repeating"""
+
+    __slots__ = ("callback", "wheel", "due", "seq", "period", "_slot")
+
+    def __init__(self, callback, wheel=None):
+        """
+        Create an idle timer (start() arms it)
+
+        Args:
+            callback (callable): Called without arguments when the timer fires
+            wheel (TimerWheel): Wheel to run on (the shared timer_wheel if None)
+        """
+        self.callback = callback
+        self.wheel = wheel if wheel is not None else timer_wheel
+        self.due = -1  # Tick the timer fires at (-1 when idle)
+        self.seq = 0  # Start order (timers due on the same tick fire in this order)
+        self.period = 0  # Ticks between repeats (0 = one-shot)
+        self._slot = None  # Wheel slot holding the timer (None when idle)
+
+    @property
+    def active(self):
+        """True while the timer is armed"""
+        return self._slot is not None
+
+    def start(self, delay_ms, period_ms=None):
+        """
+        Arm the timer (re-arms it if already running)
+
+        Args:
+            delay_ms (float): Game milliseconds until it fires
+            period_ms (float): Repeat every period_ms after that (None = one-shot)
+        """
+        self.start_ticks(ms_to_ticks(delay_ms), ms_to_ticks(period_ms) if period_ms is not None else 0)
+
+    def start_ticks(self, delay, period=0):
+        """
+        Arm the timer in simulation ticks
+
+        Args:
+            delay (int): Ticks until it fires (at least 1)
+            period (int): Ticks between repeats (0 = one-shot)
+        """
+        wheel = self.wheel
+        self.cancel()
+        self.due = wheel.tick + max(1, delay)
+        self.seq = wheel.next_seq
+        wheel.next_seq += 1
+        self.period = period
+        wheel._insert(self)
+
+    def cancel(self):
+        """Disarm the timer (no-op when idle)"""
+        if self._slot is not None:
+            del self._slot[self]
+            self._slot = None
+            self.wheel.pending -= 1
+        self.due = -1
+
+    def remaining_ticks(self):
+        """
+        Get the ticks left before the timer fires
+
+        Returns:
+            int or None: Ticks (None when idle)
+        """
+        return self.due - self.wheel.tick if self._slot is not None else None
+
+    def get_state(self):
+        """
+        Get the timer state (see snapshot.py)
+
+        Returns:
+            tuple: (due tick, start order, period ticks); due is -1 when idle
+        """
+        if self._slot is None:
+            return (-1, 0, 0)
+        return (self.due, self.seq, self.period)
+
+    def set_state(self, state):
+        """
+        Restore the state returned by get_state() (on a wheel already
+        moved to the snapshot's tick)
+
+        Args:
+            state (tuple): State to restore
+        """
+        self.cancel()
+        due, seq, period = state
+        if due >= 0:
+            self.due = due
+            self.seq = seq
+            self.period = period
+            self.wheel._insert(self)
+
+
+class TimerWheel:
+    """Hierarchical timer wheel advanced once per simulation tick"""
+
+    def __init__(self, levels=TIMER_WHEEL_LEVELS):
+        """
+        Args:
+            levels (int): Wheel levels (64**levels ticks of range)
+        """
+        self.levels = max(1, levels)
+        self._wheel = [[{} for _ in range(_SLOTS)] for _ in range(self.levels)]
+        self.tick = 0  # Last tick processed
+        self.next_seq = 0
+        self.pending = 0  # Armed timers
+
+        # Statistics
+        self.fired = 0
+        self.cascaded = 0
+        self.max_fired_per_tick = 0
+
+    def _insert(self, timer):
+        """Put an armed timer in the slot covering its due tick"""
+        delta = timer.due - self.tick
+        for level in range(self.levels):
+            if delta < _SLOTS << (_SLOT_BITS * level) or level == self.levels - 1:
+                shift = _SLOT_BITS * level
+                if delta >= _SLOTS << shift:
+                    # Beyond the wheel's range: park in the last slot, re-inserted when it comes round
+                    index = ((self.tick >> shift) - 1) & _SLOT_MASK
+                else:
+                    index = (timer.due >> shift) & _SLOT_MASK
+                slot = self._wheel[level][index]
+                break
+        slot[timer] = None
+        timer._slot = slot
+        self.pending += 1
+
+    def advance(self, tick):
+        """
+        Process every tick up to a simulation tick, firing the timers due
+
+        Args:
+            tick (int): Current simulation tick (sim_clock.tick_count)
+        """
+        while self.tick < tick:
+            self.tick += 1
+            now = self.tick
+
+            # Move the timers of higher-level slots reached by this tick a level down
+            # (highest first, so their timers can cascade on down)
+            for level in range(self.levels - 1, 0, -1):
+                shift = _SLOT_BITS * level
+                if now & ((1 << shift) - 1) == 0:
+                    slot = self._wheel[level][(now >> shift) & _SLOT_MASK]
+                    if slot:
+                        timers = list(slot)
+                        slot.clear()
+                        self.pending -= len(timers)
+                        self.cascaded += len(timers)
+                        for timer in timers:
+                            self._insert(timer)
+
+            slot = self._wheel[0][now & _SLOT_MASK]
+            if not slot:
+                continue
+            fired = 0
+            for timer in sorted(slot, key=_start_order):
+                if timer._slot is not slot:
+                    continue  # Cancelled or re-armed by an earlier callback
+                del slot[timer]
+                timer._slot = None
+                self.pending -= 1
+                if timer.due > now:
+                    self._insert(timer)  # Parked beyond the wheel's range
+                    continue
+                if timer.period:
+                    # Re-armed before the callback, so the callback can cancel it
+                    timer.due = now + timer.period
+                    timer.seq = self.next_seq
+                    self.next_seq += 1
+                    self._insert(timer)
+                else:
+                    timer.due = -1
+                fired += 1
+                timer.callback()
+
+            _timers_fired.inc(fired)
+            self.fired += fired
+            if fired > self.max_fired_per_tick:
+                self.max_fired_per_tick = fired
+
+    def reset(self, tick=0):
+        """
+        Disarm every timer and move the wheel to a tick (new round or restore)
+
+        Args:
+            tick (int): Last simulation tick processed
+        """
+        for level in self._wheel:
+            for slot in level:
+                for timer in slot:
+                    timer._slot = None
+                    timer.due = -1
+                slot.clear()
+        self.pending = 0
+        self.tick = tick
+
+    def get_state(self):
+        """
+        Get the wheel state (see snapshot.py; armed timers are stored by their owners)
+
+        Returns:
+            tuple: (next start order,)
+        """
+        return (self.next_seq,)
+
+    def set_state(self, state):
+        """
+        Restore the state returned by get_state()
+
+        Args:
+            state (tuple): State to restore
+        """
+        self.next_seq = state[0]
+
+    def get_stats(self):
+        """
+        Get wheel statistics
+
+        Returns:
+            dict: Armed timers, timers fired and cascaded, most fired in one tick
+        """
+        return {
+            "pending": self.pending,
+            "fired": self.fired,
+            "cascaded": self.cascaded,
+            "max_fired_per_tick": self.max_fired_per_tick,
+        }
+
+
+def _start_order(timer):
+    """Sort key: timers due on the same tick fire in start order"""
+    return timer.seq
+
+
+# Wheel shared by the game (advanced by Game.update with sim_clock)
+timer_wheel = TimerWheel()
@@ -3,6 +3,10 @@ Utility functions for the game
 """
 import os
 import sys
+import pygame
+from asset_pack import AssetPack, normalize_asset_name
+from config import ASSET_PACK_FILE
+from startup import timeline
 
 
 def resource_path(relative_path):
@@ -27,3 +31,146 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     
     return os.path.join(base_path, relative_path)
+
+
+_asset_pack = None
+_asset_pack_checked = False
+
+
+def get_asset_pack():
+    """
+    Get the shared asset pack, opening it on first use
+
+    Returns:
+        AssetPack or None: The pack if ASSET_PACK_FILE exists, None otherwise
+    """
+    global _asset_pack, _asset_pack_checked
+    if not _asset_pack_checked:
+        _asset_pack_checked = True
+        pack_path = resource_path(ASSET_PACK_FILE)
+        if os.path.exists(pack_path):
+            try:
+                _asset_pack = AssetPack(pack_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not open asset pack, using loose files: {e}")
+    return _asset_pack
+
+
+def open_asset(relative_path):
+    """
+    Open an asset for binary reading
+
+    Entries are served from the memory-mapped asset pack when one is
+    bundled, falling back to the loose file resolved by resource_path().
+
+    Args:
+        relative_path (str): Relative path to the asset (e.g. 'assets/rio.png')
+
+    Returns:
+        file-like: Readable binary file object
+    """
+    pack = get_asset_pack()
+    if pack is not None and relative_path in pack:
+        return pack.open(relative_path)
+    return open(resource_path(relative_path), 'rb')
+
+
+def load_image(relative_path):
+    """
+    Load an image asset
+
+    Args:
+        relative_path (str): Relative path to the image
+
+    Returns:
+        pygame.Surface: The loaded (unconverted) image
+    """
+    with timeline.span(f"load {relative_path}"):
+        return pygame.image.load(open_asset(relative_path), normalize_asset_name(relative_path))
+
+
+_mixer_failed = False
+
+
+def init_mixer():
+    """
+    Initialize the mixer on first use
+
+    Returns:
+        bool: True if sound is available
+    """
+    global _mixer_failed
+    if pygame.mixer.get_init():
+        return True
+    if _mixer_failed:
+        return False
+    try:
+        with timeline.span("mixer init"):
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        return True
+    except pygame.error as e:
+        # No audio device available (headless system, etc.)
+        # Game will run normally without sound
+        _mixer_failed = True
+        print(f"Warning: Sound disabled: {e}")
+        return False
+
+
+def disable_mixer():
+    """Keep the mixer from being initialized (headless runs: init_mixer() returns False)"""
+    global _mixer_failed
+    if not pygame.mixer.get_init():
+        _mixer_failed = True
+
+
+def init_headless():
+    """Initialize pygame without a window or audio device (training, soak tests)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    disable_mixer()
+
+
+def load_sound(relative_path):
+    """
+    Load a sound asset
+
+    Args:
+        relative_path (str): Relative path to the sound file
+
+    Returns:
+        pygame.mixer.Sound: The loaded sound
+    """
+    with timeline.span(f"load {relative_path}"):
+        return pygame.mixer.Sound(file=open_asset(relative_path))
+
+
+def load_font(relative_path, size):
+    """
+    Load a font asset
+
+    Args:
+        relative_path (str): Relative path to the font file
+        size (int): Font size in points
+
+    Returns:
+        pygame.font.Font: The loaded font
+    """
+    with timeline.span(f"load {relative_path} ({size}pt)"):
+        return pygame.font.Font(open_asset(relative_path), size)
+
+
+def read_text(relative_path, encoding='utf-8'):
+    """
+    Read a text asset
+
+    Args:
+        relative_path (str): Relative path to the text file
+        encoding (str): Text encoding
+
+    Returns:
+        str: The file contents
+    """
+    with open_asset(relative_path) as f:
+        return f.read().decode(encoding)